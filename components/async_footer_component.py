@@ -0,0 +1,61 @@
+import logging
+from playwright.async_api import Locator
+
+from helpers.async_support import async_mirror
+from helpers.form_filler import AsyncFormFiller
+from components.footer_component import FooterComponent
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncFooterComponent(FooterComponent):
+
+    __slots__ = ()
+
+    async def click_footer_link(self, link_locator: Locator) -> None:
+        logger.info(f"[ACTION] Clicking on footer link: {link_locator}...")
+        await link_locator.click()
+        logger.info(f"[SUCCESS] {link_locator} clicked.")
+
+    async def click_social_icon(self, social_icon_locator: Locator) -> None:
+        logger.info(f"[ACTION] Navigating to social media profile: {social_icon_locator}...")
+        await social_icon_locator.click()
+        logger.info(f"[SUCCESS] {social_icon_locator} navigation completed.")
+
+    async def click_agency_logo(self) -> None:
+        logger.info("[ACTION] Clicking 'Agency Logo' in footer...")
+        await self.agency_logo.click()
+        logger.info("[SUCCESS] 'Agency Logo' clicked.")
+
+    async def click_platform_logo(self) -> None:
+        logger.info("[ACTION] Clicking 'PHPTRAVELS' platform logo...")
+        await self.platform_logo.click()
+        logger.info("[SUCCESS] 'PHPTRAVELS' platform logo clicked.")
+
+    async def click_contact_link(self) -> None:
+        logger.info("[ACTION] Clicking 'Contact Us' info link in footer...")
+        await self.contact_icon.click()
+        logger.info("[SUCCESS] 'Contact Us' info link clicked.")
+
+    async def enter_name(self, name: str) -> None:
+        logger.info(f"[INPUT] Entering name for newsletter: '{name}'...")
+        await self.newsletter_name_input.fill(name)
+        logger.info("[SUCCESS] Name entered.")
+
+    async def enter_email(self, email: str) -> None:
+        logger.info(f"[INPUT] Entering email for newsletter: '{email}'...")
+        await self.newsletter_email_input.fill(email)
+        logger.info("[SUCCESS] Email entered.")
+
+    async def click_subscribe_button(self) -> None:
+        logger.info("[ACTION] Clicking 'Signup' button on Newsletter form...")
+        await self.subscribe_button.click()
+        logger.info("[SUCCESS] 'Signup' button clicked.")
+
+    async def subscribe_newsletter(self, name: str, email: str) -> None:
+        logger.info(f"[ACTION] Performing full newsletter subscription for: '{email}'...")
+
+        await AsyncFormFiller(self, self.NEWSLETTER_FORM).fill({"name": name, "email": email})
+        await self.click_subscribe_button()
+        
+        logger.info("[SUCCESS] Newsletter subscription form submitted.")
\ No newline at end of file
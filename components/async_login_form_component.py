@@ -0,0 +1,83 @@
+import logging
+
+from models.data_models import CustomerLoginData
+from helpers.common_helper import mask_text
+from helpers.async_support import async_mirror
+from helpers.form_filler import AsyncFormFiller
+from components.login_form_component import LoginFormComponent
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncLoginFormComponent(LoginFormComponent):
+
+    __slots__ = ()
+
+    async def enter_email(self, email: str) -> None:
+        logger.info(f"[INPUT] Entering email: '{email}'...")
+        await self.email_input.fill(email)
+        logger.info("[SUCCESS] Email entered.")
+
+    async def enter_password(self, password: str) -> None:
+        logger.info(f"[INPUT] Entering password: '{mask_text(password)}'...")
+        logger.debug(f"[DEBUG-DATA] Entering password: {password}...")
+        await self.password_input.fill(password)
+        logger.info("[SUCCESS] Password entered.")
+
+    async def click_login_button(self) -> None:
+        logger.info("[ACTION] Clicking 'Login' button...")
+        await self.login_button.click()
+        logger.info("[SUCCESS] 'Login' button clicked.")
+
+    async def click_remember_me_text(self) -> None:
+        logger.info("[ACTION] Clicking 'Remember Me' label text...")
+        await self.remember_me_text.click()
+        logger.info("[SUCCESS] 'Remember Me' label text clicked.")
+
+    async def check_remember_me(self) -> None:
+        logger.info("[ACTION] Checking 'Remember Me' checkbox via label...")
+        await self.click_remember_me_text()
+        logger.info("[SUCCESS] 'Remember Me' checkbox checked.")
+
+    async def click_reset_button(self) -> None:
+        try:
+            logger.info("[ACTION] Clicking 'Reset Email' button...")
+            await self.reset_pw_reset_button.click()
+            logger.info("[SUCCESS] 'Reset Email' button clicked.")
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to click 'Reset Email' button: {e}.")
+            raise
+
+    async def click_cancel_button(self) -> None:
+        logger.info("[ACTION] Clicking 'Cancel' button on 'Reset password' Modal...")
+        await self.reset_pw_cancel_button.click()
+        logger.info("[SUCCESS] 'Cancel' button on 'Reset password' clicked.")
+
+    async def click_reset_password_link(self) -> None:
+        logger.info("[ACTION] Clicking 'Reset Password' link...")
+        await self.reset_password_link.click()
+        logger.info("[SUCCESS] 'Reset Password' link clicked.")
+
+    async def reset_password(self, email: str | None = None) -> None:
+        if email:
+            logger.info(f"[INPUT] Filling reset email: '{email}'...")
+            await self.reset_pw_email_input.fill(email)
+            logger.info("[SUCCESS] Reset email filled.")
+        else:
+            logger.info("[ACTION] Resetting password with empty email field...")
+
+        await self.click_reset_button()
+        logger.info("[SUCCESS] Password reset sequence completed.")
+
+    async def login(self, login_data: CustomerLoginData) -> None:
+        logger.info(f"[ACTION] Performing full login sequence for: '{login_data.email}'...")
+
+        await AsyncFormFiller(self, self.LOGIN_FORM).fill(login_data)
+        await self.click_login_button()
+
+        logger.info("[SUCCESS] Login sequence completed.")
+
+    async def click_signup_button(self) -> None:
+        logger.info("[ACTION] Clicking 'Signup' button...")
+        await self.signup_button.click()
+        logger.info("[SUCCESS] 'Signup' button clicked.")
\ No newline at end of file
@@ -0,0 +1,21 @@
+import logging
+
+from helpers.async_support import async_mirror
+from components.mobile_app_component import MobileAppComponent
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncMobileAppComponent(MobileAppComponent):
+
+    __slots__ = ()
+
+    async def click_playstore_button(self) -> None:
+        logger.info("[ACTION] Clicking on 'Google Play Store' button...")
+        await self.playstore_button.click()
+        logger.info("[SUCCESS] 'Google Play Store' button clicked.")
+
+    async def click_appstore_button(self) -> None:
+        logger.info("[ACTION] Clicking on 'Apple App Store' button...")
+        await self.appstore_button.click()
+        logger.info("[SUCCESS] 'Apple App Store' button clicked.")
\ No newline at end of file
@@ -0,0 +1,60 @@
+import logging
+from playwright.async_api import Locator
+
+from helpers.async_support import async_mirror
+from components.navbar_component import NavbarComponent
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncNavbarComponent(NavbarComponent):
+
+    __slots__ = ()
+
+    async def click_agency_logo(self) -> None:
+        logger.info("[ACTION] Clicking 'Agency Logo' in navigation bar...")
+        await self.agency_logo.click()
+        logger.info("[SUCCESS] 'Agency Logo' clicked.")
+
+    async def click_navbar_link(self, link_locator: Locator) -> None:
+        logger.info(f"[ACTION] Clicking navbar link: {link_locator}...")
+        await link_locator.click()
+        logger.info(f"[SUCCESS] {link_locator} clicked.")
+
+    async def select_language(self, language_name: str) -> None:
+        logger.info(f"[ACTION] Selecting language: '{language_name}'...")
+        await self.language_dropdown.click()
+        target_lang = self.root.locator("ul.dropdown-menu:visible").get_by_role("link", name=language_name)
+        await target_lang.click()
+        logger.info(f"[SUCCESS] Language '{language_name}' selected.")
+
+    async def select_currency(self, currency_code: str) -> None:
+        logger.info(f"[ACTION] Selecting currency: '{currency_code}'...")
+        await self.currency_dropdown.click()
+        target_currency = self.root.locator("ul.dropdown-menu:visible").get_by_role("link", name=currency_code)
+        await target_currency.click()
+        logger.info(f"[SUCCESS] Currency '{currency_code}' selected.")
+
+    async def go_to_agents_login(self) -> None:
+        logger.info("[ACTION] Navigating to 'Agents Login' page...")
+        await self.agents_dropdown.click()
+        await self.login_link.click()
+        logger.info("[SUCCESS] Navigation to 'Agents Login' page completed.")
+
+    async def go_to_agents_signup(self) -> None:
+        logger.info("[ACTION] Navigating to 'Agents Signup' page...")
+        await self.agents_dropdown.click()
+        await self.signup_link.click()
+        logger.info("[SUCCESS] Navigation to 'Agents Signup' page completed.")
+
+    async def go_to_customer_login(self) -> None:
+        logger.info("[ACTION] Navigating to 'Customer Login' page...")
+        await self.customer_dropdown.click()
+        await self.login_link.click()
+        logger.info("[SUCCESS] Navigation to 'Customer Login' page completed.")
+
+    async def go_to_customer_signup(self) -> None:
+        logger.info("[ACTION] Navigating to 'Customer Signup' page...")
+        await self.customer_dropdown.click()
+        await self.signup_link.click()
+        logger.info("[SUCCESS] Navigation to 'Customer Signup' page completed.")
\ No newline at end of file
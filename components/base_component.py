@@ -0,0 +1,9 @@
+from playwright.sync_api import Page, Locator
+
+class BaseComponent:
+
+    __slots__ = ("page", "_locators")
+
+    def __init__(self, page: Page) -> None:
+        self.page = page
+        self._locators: dict[str, Locator] = {}
@@ -1,46 +1,59 @@
 import logging
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Locator
+
+from components.base_component import BaseComponent
+from helpers.form_filler import FormField, FormFiller, FormSpec
+from helpers.locator_registry import on_page, on_root
 
 logger = logging.getLogger(__name__)
 
-class FooterComponent:
-
-    def __init__(self, page: Page) -> None:
-        self.page = page
-        self.root = self.page.locator("section.footer-area")
-
-        self.about_us_link = self.root.get_by_role("link", name="About Us")
-        self.privacy_policy_link = self.root.get_by_role("link", name="Privacy Policy")
-        self.file_a_claim_link = self.root.get_by_role("link", name="File A Claim")
-        self.contact_us_link = self.root.locator("ul.dropdown-menu-item").get_by_role("link", name="Contact Us")
-        self.become_a_supplier_link = self.root.get_by_role("link", name="Become A Supplier")
-        self.careers_and_jobs_link = self.root.get_by_role("link", name="Careers And Jobs")
-        self.faq_link = self.root.get_by_role("link", name="Faq")
-        self.how_to_book_link = self.root.get_by_role("link", name="How To Book")
-        self.terms_of_use_link = self.root.get_by_role("link", name="Terms Of Use")
-        self.cookies_policy_link = self.root.get_by_role("link", name="Cookies Policy")
-        self.booking_tips_link = self.root.get_by_role("link", name="Booking Tips")
-
-        self.agency_logo = self.root.get_by_role("link", name="logo")
-        self.phone = self.root.get_by_text("+123456789")
-        self.email = self.root.get_by_text("email@agency.com")
-        self.contact_icon = self.root.locator("ul.list-items").get_by_role("link", name="Contact Us")
-
-        self.newsletter_name_input = self.root.locator("input[name='name']")
-        self.newsletter_email_input = self.root.locator("input[name='email']")
-        self.subscribe_button = self.root.get_by_role("button", name="Signup Newsletter")
-
-        self.copyright = self.root.get_by_text("All Rights Reserved by PHPTARVELS")
-        self.powered_by = self.root.get_by_text("Powered by PHPTRAVELS v9.1")
-        self.platform_logo = self.root.get_by_role("link", name="phptravels")
-
-        self.facebook_icon = self.root.locator('ul.social-profile a[href="https://facebook.com/phptravels"]')
-        self.twitter_icon = self.root.locator('ul.social-profile a[href="https://twitter.com/phptravelss"]')
-        self.linkedin_icon = self.root.locator('ul.social-profile a[href="https://twitter.com/phptravels"]')
-        self.google_plus_icon = self.root.locator('ul.social-profile a[href="https://google.com/phptravels"]')
-        self.youtube_icon = self.root.locator('ul.social-profile a[href="https://youtube.com/phptravels"]')
-        self.whatsapp_icon = self.root.locator('ul.social-profile a[href="https://whatsapp.com/phptravels"]')
-        self.instagram_icon = self.root.locator('ul.social-profile a[href="https://instagram.com/phptravels"]')
+class FooterComponent(BaseComponent):
+
+    __slots__ = ()
+
+    root = on_page.locator("section.footer-area")
+
+    about_us_link = on_root.get_by_role("link", name="About Us")
+    privacy_policy_link = on_root.get_by_role("link", name="Privacy Policy")
+    file_a_claim_link = on_root.get_by_role("link", name="File A Claim")
+    contact_us_link = on_root.locator("ul.dropdown-menu-item").get_by_role("link", name="Contact Us")
+    become_a_supplier_link = on_root.get_by_role("link", name="Become A Supplier")
+    careers_and_jobs_link = on_root.get_by_role("link", name="Careers And Jobs")
+    faq_link = on_root.get_by_role("link", name="Faq")
+    how_to_book_link = on_root.get_by_role("link", name="How To Book")
+    terms_of_use_link = on_root.get_by_role("link", name="Terms Of Use")
+    cookies_policy_link = on_root.get_by_role("link", name="Cookies Policy")
+    booking_tips_link = on_root.get_by_role("link", name="Booking Tips")
+
+    agency_logo = on_root.get_by_role("link", name="logo")
+    phone = on_root.get_by_text("+123456789")
+    email = on_root.get_by_text("email@agency.com")
+    contact_icon = on_root.locator("ul.list-items").get_by_role("link", name="Contact Us")
+
+    newsletter_name_input = on_root.locator("input[name='name']")
+    newsletter_email_input = on_root.locator("input[name='email']")
+    subscribe_button = on_root.get_by_role("button", name="Signup Newsletter")
+
+    NEWSLETTER_FORM = FormSpec(
+        name="newsletter form",
+        root="section.footer-area",
+        fields={
+            "name": FormField("input[name='name']", "enter_name"),
+            "email": FormField("input[name='email']", "enter_email"),
+        }
+    )
+
+    copyright = on_root.get_by_text("All Rights Reserved by PHPTARVELS")
+    powered_by = on_root.get_by_text("Powered by PHPTRAVELS v9.1")
+    platform_logo = on_root.get_by_role("link", name="phptravels")
+
+    facebook_icon = on_root.locator('ul.social-profile a[href="https://facebook.com/phptravels"]')
+    twitter_icon = on_root.locator('ul.social-profile a[href="https://twitter.com/phptravelss"]')
+    linkedin_icon = on_root.locator('ul.social-profile a[href="https://twitter.com/phptravels"]')
+    google_plus_icon = on_root.locator('ul.social-profile a[href="https://google.com/phptravels"]')
+    youtube_icon = on_root.locator('ul.social-profile a[href="https://youtube.com/phptravels"]')
+    whatsapp_icon = on_root.locator('ul.social-profile a[href="https://whatsapp.com/phptravels"]')
+    instagram_icon = on_root.locator('ul.social-profile a[href="https://instagram.com/phptravels"]')
 
     def click_footer_link(self, link_locator: Locator) -> None:
         logger.info(f"[ACTION] Clicking on footer link: {link_locator}...")
@@ -85,8 +98,7 @@ class FooterComponent:
     def subscribe_newsletter(self, name: str, email: str) -> None:
         logger.info(f"[ACTION] Performing full newsletter subscription for: '{email}'...")
 
-        self.enter_name(name)
-        self.enter_email(email)
+        FormFiller(self, self.NEWSLETTER_FORM).fill({"name": name, "email": email})
         self.click_subscribe_button()
         
         logger.info("[SUCCESS] Newsletter subscription form submitted.")
\ No newline at end of file
@@ -1,37 +1,47 @@
 import logging
-from playwright.sync_api import Page
 
 from models.data_models import CustomerLoginData
 from helpers.common_helper import mask_text
+from helpers.form_filler import FormField, FormFiller, FormSpec
+from helpers.locator_registry import on_page
+from components.base_component import BaseComponent
 
 logger = logging.getLogger(__name__)
 
-class LoginFormComponent:
-    
-    def __init__(self, page: Page) -> None:
-        self.page = page
-
-        self.email_input = self.page.locator("#email")
-        self.password_input = self.page.get_by_role("textbox", name="Password")
-
-        self.remember_me_checkbox = self.page.get_by_role("checkbox", name="Remember Me")
-        self.remember_me_text = self.page.get_by_text("Remember Me")
-        # self.remember_me_checkbox = self.page.locator("span.checkmark")
-
-        self.reset_password_link = self.page.locator("#login").get_by_text("Reset Password")
-        self.reset_password_modal = self.page.locator("#forget_pass")
-        self.reset_pw_email_input = self.page.get_by_role("dialog", name="Reset Password").get_by_placeholder("name@example.com")
-        self.reset_pw_cancel_button = self.page.get_by_role("button", name="Cancel")
-        self.reset_pw_reset_button = self.page.get_by_role("button", name="Reset Email")
-        self.reset_pw_add_email_alert_msg = "Please add email address to reset password"
-        self.reset_pw_invalid_email_alert_msg = "Invalid or no account found with this email"
-
-        self.login_button = self.page.get_by_role("button", name="Login")
-        self.signup_button = self.page.get_by_role("link", name="Signup")
-        
-        self.alert_card = self.page.locator("div.vt-card.error")
-        self.not_active_account_alert_msgs = ["Account not active", "Please contact admin to activate your account"]
-        self.invalid_login_alert_msgs = ["Invalid Login", "Please check your email and password"]
+class LoginFormComponent(BaseComponent):
+
+    __slots__ = ()
+
+    email_input = on_page.locator("#email")
+    password_input = on_page.get_by_role("textbox", name="Password")
+
+    remember_me_checkbox = on_page.get_by_role("checkbox", name="Remember Me")
+    remember_me_text = on_page.get_by_text("Remember Me")
+    # remember_me_checkbox = on_page.locator("span.checkmark")
+
+    reset_password_link = on_page.locator("#login").get_by_text("Reset Password")
+    reset_password_modal = on_page.locator("#forget_pass")
+    reset_pw_email_input = on_page.get_by_role("dialog", name="Reset Password").get_by_placeholder("name@example.com")
+    reset_pw_cancel_button = on_page.get_by_role("button", name="Cancel")
+    reset_pw_reset_button = on_page.get_by_role("button", name="Reset Email")
+    reset_pw_add_email_alert_msg = "Please add email address to reset password"
+    reset_pw_invalid_email_alert_msg = "Invalid or no account found with this email"
+
+    login_button = on_page.get_by_role("button", name="Login")
+    signup_button = on_page.get_by_role("link", name="Signup")
+
+    alert_card = on_page.locator("div.vt-card.error")
+    not_active_account_alert_msgs = ("Account not active", "Please contact admin to activate your account")
+    invalid_login_alert_msgs = ("Invalid Login", "Please check your email and password")
+
+    LOGIN_FORM = FormSpec(
+        name="login form",
+        root="#login",
+        fields={
+            "email": FormField("#email", "enter_email"),
+            "password": FormField("#password", "enter_password"),
+        }
+    )
 
     def enter_email(self, email: str) -> None:
         logger.info(f"[INPUT] Entering email: '{email}'...")
@@ -85,15 +95,14 @@ class LoginFormComponent:
             logger.info("[SUCCESS] Reset email filled.")
         else:
             logger.info("[ACTION] Resetting password with empty email field...")
-        
+
         self.click_reset_button()
         logger.info("[SUCCESS] Password reset sequence completed.")
 
     def login(self, login_data: CustomerLoginData) -> None:
         logger.info(f"[ACTION] Performing full login sequence for: '{login_data.email}'...")
 
-        self.enter_email(login_data.email)
-        self.enter_password(login_data.password)
+        FormFiller(self, self.LOGIN_FORM).fill(login_data)
         self.click_login_button()
 
         logger.info("[SUCCESS] Login sequence completed.")
@@ -1,21 +1,23 @@
 import logging
-from playwright.sync_api import Page
+
+from components.base_component import BaseComponent
+from helpers.locator_registry import on_page, on_root
 
 logger = logging.getLogger(__name__)
 
-class MobileAppComponent:
-
-    def __init__(self, page: Page) -> None:
-        self.page = page
-        self.root = self.page.locator("div.mobile_apps")
-                
-        self.promotion_title = self.root.get_by_text("Get The App!")
-        self.promotion_desc = self.root.get_by_text("Our app has all your travel needs covered")
-        
-        self.playstore_button = self.root.get_by_role("link", name="PLAYSTORE")
-        self.appstore_button = self.root.get_by_role("link", name="APP STORE")
-        
-        self.mobile_mockup_img = self.root.get_by_role("img", name="app")
+class MobileAppComponent(BaseComponent):
+
+    __slots__ = ()
+
+    root = on_page.locator("div.mobile_apps")
+
+    promotion_title = on_root.get_by_text("Get The App!")
+    promotion_desc = on_root.get_by_text("Our app has all your travel needs covered")
+
+    playstore_button = on_root.get_by_role("link", name="PLAYSTORE")
+    appstore_button = on_root.get_by_role("link", name="APP STORE")
+
+    mobile_mockup_img = on_root.get_by_role("img", name="app")
 
     def click_playstore_button(self) -> None:
         logger.info("[ACTION] Clicking on 'Google Play Store' button...")
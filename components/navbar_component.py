@@ -1,33 +1,36 @@
 import re
 import logging
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Locator
+
+from components.base_component import BaseComponent
+from helpers.locator_registry import on_page, on_root
 
 logger = logging.getLogger(__name__)
 
-class NavbarComponent:
-
-    def __init__(self, page: Page) -> None:
-
-        self.page = page
-        self.root = self.page.get_by_role("banner")
-        self.currency_pattern = re.compile(r"^(USD|GBP|SAR|EUR|PHP)$")
-        
-        self.agency_logo = self.root.get_by_role("link", name="logo")
-
-        self.flights_link = self.root.get_by_role("link", name="Flights")
-        self.hotels_link = self.root.get_by_role("link", name="Hotels")
-        self.tours_link = self.root.get_by_role("link", name="Tours")
-        self.cars_link = self.root.get_by_role("link", name="Cars")
-        self.visa_link = self.root.get_by_role("link", name="Visa")
-        self.blogs_link = self.root.get_by_role("link", name="Blogs")
-
-        self.language_dropdown = self.root.get_by_role("button", name="flag")
-        self.currency_dropdown = self.root.get_by_role("button", name=self.currency_pattern)
-        self.agents_dropdown = self.root.get_by_role("button", name="Agents")
-        self.customer_dropdown = self.root.get_by_role("button", name="Customer")
-        
-        self.login_link = self.root.locator("ul.dropdown-menu:visible").get_by_role("link", name="Login")
-        self.signup_link = self.root.locator("ul.dropdown-menu:visible").get_by_role("link", name="Signup")
+class NavbarComponent(BaseComponent):
+
+    __slots__ = ()
+
+    currency_pattern = re.compile(r"^(USD|GBP|SAR|EUR|PHP)$")
+
+    root = on_page.get_by_role("banner")
+
+    agency_logo = on_root.get_by_role("link", name="logo")
+
+    flights_link = on_root.get_by_role("link", name="Flights")
+    hotels_link = on_root.get_by_role("link", name="Hotels")
+    tours_link = on_root.get_by_role("link", name="Tours")
+    cars_link = on_root.get_by_role("link", name="Cars")
+    visa_link = on_root.get_by_role("link", name="Visa")
+    blogs_link = on_root.get_by_role("link", name="Blogs")
+
+    language_dropdown = on_root.get_by_role("button", name="flag")
+    currency_dropdown = on_root.get_by_role("button", name=currency_pattern)
+    agents_dropdown = on_root.get_by_role("button", name="Agents")
+    customer_dropdown = on_root.get_by_role("button", name="Customer")
+
+    login_link = on_root.locator("ul.dropdown-menu:visible").get_by_role("link", name="Login")
+    signup_link = on_root.locator("ul.dropdown-menu:visible").get_by_role("link", name="Signup")
 
     def click_agency_logo(self) -> None:
         logger.info("[ACTION] Clicking 'Agency Logo' in navigation bar...")
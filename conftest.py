@@ -1,31 +1,71 @@
 import allure
 import pytest
 import logging
-from pathlib import Path
 from typing import Generator
 from _pytest.nodes import Item
 from playwright.sync_api import Page
 
+from helpers.captcha import CaptchaStrategy
+from helpers.network_policy import NetworkPolicyController
+from helpers.web_vitals import WebVitalsRecorder
+from helpers.artifact_index import get_artifact_index
+from helpers.attachment_store import attachment_store_key
+from helpers.screenshot_pipeline import screenshot_pipeline_key
 from pages.signup_success_page import SignupSuccessPage
 from pages.customer_login_page import CustomerLoginPage
 from pages.customer_signup_page import CustomerSignupPage
 
 logger = logging.getLogger(__name__)
 
+pytest_plugins = [
+    "plugins.structured_logging",
+    "plugins.local_app",
+    "plugins.browser_server",
+    "plugins.artifact_index",
+    "plugins.context_pool",
+    "plugins.preconditions",
+    "plugins.identity",
+    "plugins.durations",
+    "plugins.sharding",
+    "plugins.flaky_retry",
+    "plugins.data_bank",
+    "plugins.network_policy",
+    "plugins.web_vitals",
+    "plugins.captcha",
+    "plugins.form_fill",
+    "plugins.async_pages",
+    "plugins.spans",
+    "plugins.screenshots",
+    "plugins.attachments",
+]
+
 @pytest.fixture()
-def customer_signup_page(page: Page):
+def customer_signup_page(
+    page: Page,
+    base_url: str,
+    network_policy: NetworkPolicyController,
+    web_vitals: WebVitalsRecorder,
+    captcha_strategy: CaptchaStrategy
+):
     logger.debug("[CONFIG] Initializing CustomerSignupPage fixture")
-    yield CustomerSignupPage(page)
+    network_policy.apply(CustomerSignupPage.NETWORK_POLICY)
+    web_vitals.watch()
+    captcha_strategy.prepare(page)
+    yield CustomerSignupPage(page, base_url, captcha_strategy)
 
 @pytest.fixture()
-def signup_success_page(page: Page):
+def signup_success_page(page: Page, base_url: str, network_policy: NetworkPolicyController, web_vitals: WebVitalsRecorder):
     logger.debug("[CONFIG] Initializing SignupSuccessPage fixture")
-    yield SignupSuccessPage(page)
+    network_policy.apply(SignupSuccessPage.NETWORK_POLICY)
+    web_vitals.watch()
+    yield SignupSuccessPage(page, base_url)
 
 @pytest.fixture()
-def customer_login_page(page: Page):
+def customer_login_page(page: Page, base_url: str, network_policy: NetworkPolicyController, web_vitals: WebVitalsRecorder):
     logger.debug("[CONFIG] Initializing CustomerLoginPage fixture")
-    yield CustomerLoginPage(page)
+    network_policy.apply(CustomerLoginPage.NETWORK_POLICY)
+    web_vitals.watch()
+    yield CustomerLoginPage(page, base_url)
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: Item, call: pytest.CallInfo) -> Generator:
@@ -63,13 +103,7 @@ def pytest_runtest_makereport(item: Item, call: pytest.CallInfo) -> Generator:
 
         if page:
             try:
-                logger.info(f"[ACTION] Capturing {status} screenshot...")
-                allure.attach(
-                    page.screenshot(full_page=True, animations="disabled"),
-                    name=f"Screenshot_{status}_Call",
-                    attachment_type=allure.attachment_type.PNG
-                )
-                logger.info(f"[SUCCESS] Screenshot attached to Allure")
+                item.config.stash[screenshot_pipeline_key].capture(page, f"Screenshot_{status}_Call", report.failed)
             except Exception as e:
                 logger.warning(f"[WARNING] Could not capture screenshot: {e}")
 
@@ -77,36 +111,22 @@ def pytest_runtest_makereport(item: Item, call: pytest.CallInfo) -> Generator:
         is_failed = getattr(item, "test_failed", False)
         
         if is_failed:
-            logger.info(f"[ACTION] Test FAILED. Searching for Trace and Video artifacts...")
-            
-            output_dir = Path(item.config.getoption("--output") or "test-results")
-            if not output_dir.exists():
-                logger.error(f"[ERROR] Artifacts directory not found: {output_dir}")
+            logger.info(f"[ACTION] Test FAILED. Looking up Trace and Video artifacts...")
+
+            artifacts = get_artifact_index(item.config).artifacts(item.nodeid)
+            if not artifacts:
+                logger.warning(f"[WARNING] No artifacts found for test: {item.nodeid} (expected in {artifacts.folder})")
                 return
 
-            test_method_name = item.name.split('[')[0]
-            found_folder = False
-
-            for entry in output_dir.iterdir():
-                if entry.is_dir() and test_method_name in entry.name.replace("-", "_"):
-                    found_folder = True
-                    logger.debug(f"[DEBUG] Matching artifact folder found: {entry.name}")
-                    
-                    trace_file = entry / "trace.zip"
-                    if trace_file.exists():
-                        logger.info(f"[ATTACH] Attaching Trace file: {trace_file}")
-                        allure.attach.file(str(trace_file), name="Log_Error_Trace", attachment_type=allure.attachment_type.ZIP)
-                    else:
-                        logger.debug(f"[DEBUG] Trace file not found in {entry}")
-
-                    video_file = entry / "video.webm"
-                    if video_file.exists():
-                        logger.info(f"[ATTACH] Attaching Video file: {video_file}")
-                        allure.attach.file(str(video_file), name="Log_Error_Video", attachment_type=allure.attachment_type.WEBM)
-                    else:
-                        logger.debug(f"[DEBUG] Video file not found in {entry}")
-            
-            if not found_folder:
-                logger.warning(f"[WARNING] No artifact folder found for test: {test_method_name}")
+            logger.debug(f"[DEBUG] Artifact folder for test: {artifacts.folder}")
+            attachment_store = item.config.stash[attachment_store_key]
+
+            for trace_file in artifacts.traces:
+                logger.info(f"[ATTACH] Attaching Trace file: {trace_file}")
+                attachment_store.attach(trace_file, name="Log_Error_Trace", attachment_type=allure.attachment_type.ZIP)
+
+            for video_file in artifacts.videos:
+                logger.info(f"[ATTACH] Attaching Video file: {video_file}")
+                attachment_store.attach(video_file, name="Log_Error_Video", attachment_type=allure.attachment_type.WEBM)
         else:
             logger.info(f"[EVENT] Test PASSED. Skipping Trace and Video attachments.")
\ No newline at end of file
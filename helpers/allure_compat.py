@@ -0,0 +1,61 @@
+import logging
+import threading
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+
+import allure_commons.reporter
+
+logger = logging.getLogger(__name__)
+
+# The private allure internals used below (AllureReporter._attach, ThreadContextItems._thread_context,
+# AllureListener._cache) are known to exist in these releases of allure-python-commons and allure-pytest
+SUPPORTED_COMMONS_VERSIONS = ((2, 9), (3, 0))
+
+
+@cache
+def _package_version(package: str) -> tuple[int, int] | None:
+    try:
+        major, minor, *_ = version(package).split(".")
+        return int(major), int(minor)
+    except (PackageNotFoundError, ValueError):
+        return None
+
+
+def _is_supported(package: str) -> bool:
+    lowest, highest = SUPPORTED_COMMONS_VERSIONS
+    package_version = _package_version(package)
+    return package_version is not None and lowest <= package_version < highest
+
+
+def supports_referenced_attachments(listener: object | None) -> bool:
+    return (
+        _is_supported("allure-python-commons")
+        and callable(getattr(getattr(listener, "allure_logger", None), "_attach", None))
+    )
+
+
+def reference_attachment(listener: object, uuid: str, name: str, attachment_type: object, extension: str | None = None) -> str:
+    # Registers the attachment on the running test without writing it, so the caller decides how the file gets there
+    return listener.allure_logger._attach(uuid, name=name, attachment_type=attachment_type, extension=extension)
+
+
+def rebind_thread_context(thread: threading.Thread) -> bool:
+    # Allure snapshots the current test for foreign threads on first use; dropping it makes the thread pick up the running test
+    thread_context = getattr(getattr(allure_commons.reporter, "ThreadContextItems", None), "_thread_context", None)
+    if not _is_supported("allure-python-commons") or not isinstance(thread_context, dict):
+        logger.debug(f"[DEBUG] Unsupported allure-python-commons, steps run on '{thread.name}' may be reported on an earlier test")
+        return False
+    thread_context.pop(thread, None)
+    return True
+
+
+def close_test_result(listener: object, nodeid: str) -> bool:
+    # Closes the running Allure result of a test, so the next call of the same test starts a new one
+    test_cache = getattr(listener, "_cache", None)
+    if not _is_supported("allure-pytest") or not callable(getattr(test_cache, "pop", None)):
+        logger.debug(f"[DEBUG] Unsupported allure-pytest, the Allure result of '{nodeid}' is not split per attempt")
+        return False
+    uuid = test_cache.pop(nodeid)
+    if uuid:
+        listener.allure_logger.close_test(uuid)
+    return True
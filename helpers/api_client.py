@@ -0,0 +1,147 @@
+import re
+import logging
+import requests
+import threading
+from typing import Any
+from html import unescape
+from dataclasses import asdict
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+from helpers.common_helper import mask_text
+from helpers.captcha import HCAPTCHA_TEST_RESPONSE
+from models.data_models import CustomerLoginData, CustomerSignupData
+
+logger = logging.getLogger(__name__)
+
+CSRF_INPUT_PATTERN = re.compile(r'<input[^>]*name="(?:csrf_token|_token)"[^>]*value="([^"]*)"')
+CSRF_META_PATTERN = re.compile(r'<meta[^>]*name="csrf-token"[^>]*content="([^"]*)"')
+ALERT_PATTERN = re.compile(r'<div class="vt-card error"[^>]*>(.*?)</div>', re.S)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+class ApiPreconditionError(RuntimeError):
+    pass
+
+
+class PhpTravelsApiClient:
+
+    CSRF_FIELD = "csrf_token"
+    CSRF_HEADER = "X-CSRF-TOKEN"
+
+    def __init__(
+        self,
+        base_url: str,
+        captcha_response: str = HCAPTCHA_TEST_RESPONSE,
+        pool_size: int = 16,
+        timeout: float = 10.0
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.captcha_response = captcha_response
+        self.timeout = timeout
+
+        self._adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.1, allowed_methods=["GET"])
+        )
+        # The server ties the CSRF token to the session cookie, so every thread keeps its own cookie jar and token
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.csrf_token = None
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def csrf_token(self, refresh: bool = False) -> str | None:
+        session = self.session
+        if self._local.csrf_token is None or refresh:
+            response = session.get(f"{self.base_url}/login", timeout=self.timeout)
+            response.raise_for_status()
+            match = CSRF_INPUT_PATTERN.search(response.text) or CSRF_META_PATTERN.search(response.text)
+            self._local.csrf_token = unescape(match.group(1)) if match else None
+            logger.debug(f"[DEBUG] CSRF token {'found' if self._local.csrf_token else 'not found'} on login page")
+        return self._local.csrf_token
+
+    def signup(self, user_data: CustomerSignupData) -> None:
+        logger.info(f"[ACTION] Seeding account over HTTP for email: '{user_data.email}'...")
+        form = {**asdict(user_data), "h-captcha-response": self.captcha_response}
+        response = self._post_form("/signup", form)
+
+        if response.status_code not in (302, 303) or not response.headers.get("Location", "").endswith("/signup_success"):
+            raise ApiPreconditionError(f"Signup for '{user_data.email}' failed: {self._describe_failure(response)}")
+        logger.info(f"[SUCCESS] Account '{user_data.email}' seeded.")
+
+    def login(self, login_data: CustomerLoginData) -> requests.Response:
+        logger.info(f"[ACTION] Logging in over HTTP as: '{login_data.email}' / '{mask_text(login_data.password)}'...")
+        response = self._post_form("/login", asdict(login_data))
+        logger.info(f"[SUCCESS] Login request answered with status {response.status_code}.")
+        return response
+
+    def reset_password(self, email: str) -> dict[str, Any]:
+        logger.info(f"[ACTION] Requesting password reset over HTTP for: '{email}'...")
+        response = self._post_form("/reset_password", {"email": email})
+        response.raise_for_status()
+        logger.info("[SUCCESS] Password reset request answered.")
+        return response.json()
+
+    def signup_many(self, accounts: list[CustomerSignupData], max_workers: int = 8) -> list[CustomerSignupData]:
+        logger.info(f"[ACTION] Seeding {len(accounts)} accounts over HTTP...")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api-seed") as executor:
+            results = list(executor.map(self._try_signup, accounts))
+
+        failures = [error for error in results if error is not None]
+        if failures:
+            raise ApiPreconditionError(f"{len(failures)} of {len(accounts)} accounts could not be seeded: {failures[0]}")
+
+        logger.info(f"[SUCCESS] {len(accounts)} accounts seeded.")
+        return accounts
+
+    def close(self) -> None:
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+    def _try_signup(self, user_data: CustomerSignupData) -> ApiPreconditionError | None:
+        try:
+            self.signup(user_data)
+        except ApiPreconditionError as e:
+            return e
+        return None
+
+    def _post_form(self, path: str, form: dict[str, str]) -> requests.Response:
+        response = self._send_form(path, form, self.csrf_token())
+        if response.status_code in (403, 419):
+            logger.debug(f"[DEBUG] CSRF token rejected on '{path}', refreshing it")
+            response = self._send_form(path, form, self.csrf_token(refresh=True))
+        return response
+
+    def _send_form(self, path: str, form: dict[str, str], csrf_token: str | None) -> requests.Response:
+        headers = {self.CSRF_HEADER: csrf_token} if csrf_token else {}
+        payload = {**form, self.CSRF_FIELD: csrf_token} if csrf_token else form
+        return self.session.post(
+            f"{self.base_url}{path}",
+            data=payload,
+            headers=headers,
+            allow_redirects=False,
+            timeout=self.timeout
+        )
+
+    def _describe_failure(self, response: requests.Response) -> str:
+        match = ALERT_PATTERN.search(response.text)
+        if match:
+            return " ".join(unescape(TAG_PATTERN.sub(" ", match.group(1))).split())
+        return f"HTTP {response.status_code}"
@@ -0,0 +1,77 @@
+import os
+import pytest
+from pathlib import Path
+from dataclasses import dataclass, field
+from slugify import slugify
+from pytest_playwright.pytest_playwright import _truncate_file_name
+
+ARTIFACT_INDEX_PLUGIN = "artifact_index"
+
+
+@dataclass
+class TestArtifacts:
+    __test__ = False
+
+    folder: Path
+    traces: list[Path] = field(default_factory=list)
+    videos: list[Path] = field(default_factory=list)
+    screenshots: list[Path] = field(default_factory=list)
+    scanned: bool = False
+
+    def add(self, path: Path) -> None:
+        if path.suffix == ".zip":
+            bucket = self.traces
+        elif path.suffix == ".webm":
+            bucket = self.videos
+        elif path.suffix in (".png", ".jpeg", ".jpg"):
+            bucket = self.screenshots
+        else:
+            return
+        if path not in bucket:
+            bucket.append(path)
+
+    def __bool__(self) -> bool:
+        return bool(self.traces or self.videos or self.screenshots)
+
+
+class ArtifactIndex:
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        self._folders: dict[str, Path] = {}
+        self._artifacts: dict[str, TestArtifacts] = {}
+
+    def folder_for(self, nodeid: str) -> Path:
+        folder = self._folders.get(nodeid)
+        if folder is None:
+            folder = self._folders[nodeid] = self.output_dir / _truncate_file_name(slugify(nodeid))
+        return folder
+
+    def register_folder(self, nodeid: str, folder: str | Path) -> None:
+        self._folders[nodeid] = Path(folder)
+
+    def record(self, nodeid: str, path: str | Path) -> None:
+        self._entry(nodeid).add(Path(path))
+
+    def artifacts(self, nodeid: str) -> TestArtifacts:
+        entry = self._entry(nodeid)
+        if not entry.scanned:
+            entry.scanned = True
+            if entry.folder.is_dir():
+                with os.scandir(entry.folder) as dir_entries:
+                    for dir_entry in sorted(dir_entries, key=lambda e: e.name):
+                        entry.add(Path(dir_entry.path))
+        return entry
+
+    def _entry(self, nodeid: str) -> TestArtifacts:
+        entry = self._artifacts.get(nodeid)
+        if entry is None:
+            entry = self._artifacts[nodeid] = TestArtifacts(self.folder_for(nodeid))
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._artifacts)
+
+
+def get_artifact_index(config: pytest.Config) -> ArtifactIndex:
+    return config.pluginmanager.getplugin(ARTIFACT_INDEX_PLUGIN)
@@ -0,0 +1,62 @@
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def async_mirror(cls: type[T]) -> type[T]:
+    missing = []
+    for base in cls.__mro__[1:]:
+        for name, member in vars(base).items():
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            if not inspect.iscoroutinefunction(getattr(cls, name)):
+                missing.append(f"{base.__name__}.{name}")
+
+    if missing:
+        raise TypeError(f"{cls.__name__} must override with coroutines: {', '.join(sorted(set(missing)))}")
+    return cls
+
+
+class AsyncRunner:
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="async-pages", daemon=True)
+
+    def start(self) -> "AsyncRunner":
+        self.thread.start()
+        return self
+
+    def submit(self, awaitable: Awaitable[T]) -> "Future[T]":
+        return asyncio.run_coroutine_threadsafe(self._await(awaitable), self.loop)
+
+    def run(self, awaitable: Awaitable[T], timeout: float | None = None) -> T:
+        return self.submit(awaitable).result(timeout)
+
+    def gather(self, *awaitables: Awaitable[Any], timeout: float | None = None) -> list[Any]:
+        return self.run(self._gather(awaitables), timeout)
+
+    def stop(self) -> None:
+        if not self.thread.is_alive():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    async def _await(self, awaitable: Awaitable[T]) -> T:
+        return await awaitable
+
+    async def _gather(self, awaitables: tuple[Awaitable[Any], ...]) -> list[Any]:
+        return list(await asyncio.gather(*awaitables))
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        logger.debug("[CONFIG] Async page event loop started")
+        self.loop.run_forever()
@@ -0,0 +1,104 @@
+import os
+import errno
+import shutil
+import allure
+import hashlib
+import pytest
+import logging
+from pathlib import Path
+from collections import Counter
+from allure_commons.types import AttachmentType
+
+from helpers.allure_compat import reference_attachment, supports_referenced_attachments
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FICLONE = 0x40049409
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    if fcntl is None or not hasattr(fcntl, "ioctl"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform")
+    with open(source, "rb") as src, open(destination, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            destination.unlink(missing_ok=True)
+            raise
+
+
+class LinkedAttachmentStore:
+
+    def __init__(self, report_dir: Path, listener: object | None) -> None:
+        self.report_dir = report_dir
+        self.listener = listener
+        self.referenced = supports_referenced_attachments(listener)
+        self.stats: Counter = Counter()
+        self._reflink_supported = True
+        self._hardlink_supported = True
+
+    @property
+    def enabled(self) -> bool:
+        return self.listener is not None
+
+    def attach(self, source: str | Path, name: str, attachment_type: AttachmentType) -> None:
+        if not self.enabled:
+            return
+
+        source = Path(source)
+        if not self.referenced:
+            allure.attach.file(str(source), name=name, attachment_type=attachment_type)
+            self.stats["attached"] += 1
+            return
+
+        file_name = reference_attachment(self.listener, content_digest(source), name, attachment_type)
+        destination = self.report_dir / file_name
+
+        if destination.exists():
+            self.stats["deduplicated"] += 1
+            logger.debug(f"[DEBUG] Identical attachment already stored, referencing: {file_name}")
+            return
+
+        method = self.place(source, destination)
+        self.stats[method] += 1
+        logger.debug(f"[DEBUG] Attachment '{name}' stored via {method}: {file_name}")
+
+    def place(self, source: Path, destination: Path) -> str:
+        if self._reflink_supported:
+            try:
+                _reflink(source, destination)
+                return "reflinked"
+            except OSError as e:
+                if e.errno == errno.EEXIST:
+                    return "deduplicated"
+                self._reflink_supported = False
+
+        if self._hardlink_supported:
+            try:
+                os.link(source, destination)
+                return "hardlinked"
+            except FileExistsError:
+                return "deduplicated"
+            except OSError:
+                self._hardlink_supported = False
+
+        shutil.copyfile(source, destination)
+        return "copied"
+
+
+attachment_store_key = pytest.StashKey[LinkedAttachmentStore]()
@@ -0,0 +1,202 @@
+import re
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from playwright.sync_api import Page, Locator, Error
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator, Error as AsyncError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 5000
+POLL_INTERVALS = (100, 250, 500, 1000)
+SELECTOR_PATTERN = re.compile(r"selector=(?P<quote>['\"])(?P<selector>.*)(?P=quote)>$")
+
+SNAPSHOT_SCRIPT = """
+elements => {
+    const isVisible = element => {
+        const style = getComputedStyle(element);
+        const box = element.getBoundingClientRect();
+        return style.visibility !== "hidden" && box.width > 0 && box.height > 0;
+    };
+    return {
+        count: elements.length,
+        visible_count: elements.filter(isVisible).length,
+        text: elements.length === 1 ? (elements[0].textContent || "").replace(/\\s+/g, " ").trim() : null
+    };
+}
+"""
+
+URL = "to_have_url"
+VISIBLE = "to_be_visible"
+HIDDEN = "not_to_be_visible"
+CONTAINS_TEXT = "to_contain_text"
+
+
+def describe_locator(locator: Locator | AsyncLocator) -> str:
+    match = SELECTOR_PATTERN.search(repr(locator))
+    return match["selector"] if match else repr(locator)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+@dataclass(frozen=True)
+class Expectation:
+    kind: str
+    expected: str | None = None
+    locator: Locator | AsyncLocator | None = None
+    name: str | None = None
+
+    @property
+    def target(self) -> str:
+        if self.locator is None:
+            return "page"
+        return self.name or describe_locator(self.locator)
+
+    def mismatch(self, url: str, snapshot: dict | None) -> str | None:
+        if self.kind == URL:
+            return None if url == self.expected else f"expected '{self.expected}', actual '{url}'"
+        if snapshot is None:
+            return "could not be evaluated (the page was navigating)"
+        if snapshot["count"] > 1 and self.kind != HIDDEN:
+            return f"strict mode violation, the locator resolved to {snapshot['count']} elements"
+        if self.kind == VISIBLE:
+            if snapshot["count"] == 0:
+                return "expected visible, element not found"
+            return None if snapshot["visible_count"] else "expected visible, actual hidden"
+        if self.kind == HIDDEN:
+            if not snapshot["visible_count"]:
+                return None
+            return f"expected hidden, {snapshot['visible_count']} of {snapshot['count']} matching element(s) visible"
+        if snapshot["count"] == 0:
+            return f"expected to contain '{self.expected}', element not found"
+        if normalize_text(self.expected) in snapshot["text"]:
+            return None
+        return f"expected to contain '{self.expected}', actual text '{snapshot['text']}'"
+
+
+class BatchExpect:
+
+    def __init__(self, page: Page | AsyncPage, timeout: float | None = None) -> None:
+        self.page = page
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        self.expectations: list[Expectation] = []
+
+    def to_have_url(self, url: str) -> "BatchExpect":
+        self.expectations.append(Expectation(URL, url))
+        return self
+
+    def to_be_visible(self, locator: Locator | AsyncLocator, name: str | None = None) -> "BatchExpect":
+        self.expectations.append(Expectation(VISIBLE, locator=locator, name=name))
+        return self
+
+    def not_to_be_visible(self, locator: Locator | AsyncLocator, name: str | None = None) -> "BatchExpect":
+        self.expectations.append(Expectation(HIDDEN, locator=locator, name=name))
+        return self
+
+    def to_contain_text(self, locator: Locator | AsyncLocator, *texts: str, name: str | None = None) -> "BatchExpect":
+        self.expectations.extend(Expectation(CONTAINS_TEXT, text, locator, name) for text in texts)
+        return self
+
+    def verify(self) -> None:
+        deadline = time.monotonic() + self.timeout / 1000
+        poll = 0
+        while True:
+            unmet = self._unmet(self._snapshots())
+            if not unmet:
+                self._log_success(poll)
+                return
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                raise AssertionError(self._failure_message(unmet))
+            self.page.wait_for_timeout(min(self._interval(poll), remaining_ms))
+            poll += 1
+
+    def __enter__(self) -> "BatchExpect":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.verify()
+
+    def _locators(self) -> dict[int, Locator | AsyncLocator]:
+        return {id(e.locator): e.locator for e in self.expectations if e.locator is not None}
+
+    def _snapshots(self) -> dict[int, dict | None]:
+        snapshots = {}
+        for key, locator in self._locators().items():
+            try:
+                snapshots[key] = locator.evaluate_all(SNAPSHOT_SCRIPT)
+            except Error:
+                snapshots[key] = None
+        return snapshots
+
+    def _unmet(self, snapshots: dict[int, dict | None]) -> list[tuple[Expectation, str]]:
+        url = self.page.url
+        unmet = []
+        for expectation in self.expectations:
+            mismatch = expectation.mismatch(url, snapshots.get(id(expectation.locator)))
+            if mismatch:
+                unmet.append((expectation, mismatch))
+        return unmet
+
+    def _interval(self, poll: int) -> int:
+        return POLL_INTERVALS[min(poll, len(POLL_INTERVALS) - 1)]
+
+    def _failure_message(self, unmet: list[tuple[Expectation, str]]) -> str:
+        lines = [f"{len(unmet)} of {len(self.expectations)} batched expectations not met after {self.timeout:.0f} ms:"]
+        lines.extend(f"  - {expectation.kind} [{expectation.target}]: {mismatch}" for expectation, mismatch in unmet)
+        return "\n".join(lines)
+
+    def _log_success(self, poll: int) -> None:
+        logger.debug(f"[DEBUG] {len(self.expectations)} batched expectations met after {poll + 1} evaluation(s)")
+
+
+class AsyncBatchExpect(BatchExpect):
+
+    async def verify(self) -> None:
+        deadline = time.monotonic() + self.timeout / 1000
+        poll = 0
+        while True:
+            unmet = self._unmet(await self._snapshots())
+            if not unmet:
+                self._log_success(poll)
+                return
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                raise AssertionError(self._failure_message(unmet))
+            await self.page.wait_for_timeout(min(self._interval(poll), remaining_ms))
+            poll += 1
+
+    async def __aenter__(self) -> "AsyncBatchExpect":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.verify()
+
+    async def _snapshots(self) -> dict[int, dict | None]:
+        locators = self._locators()
+        results = await asyncio.gather(
+            *(locator.evaluate_all(SNAPSHOT_SCRIPT) for locator in locators.values()),
+            return_exceptions=True
+        )
+        snapshots = {}
+        for key, result in zip(locators, results):
+            if isinstance(result, AsyncError):
+                snapshots[key] = None
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                snapshots[key] = result
+        return snapshots
+
+
+def expect_all(page: Page, timeout: float | None = None) -> BatchExpect:
+    return BatchExpect(page, timeout)
+
+
+def async_expect_all(page: AsyncPage, timeout: float | None = None) -> AsyncBatchExpect:
+    return AsyncBatchExpect(page, timeout)
@@ -0,0 +1,178 @@
+import json
+import math
+import time
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    samples: list[float]
+    inner: int = 1
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def iqr(self) -> float:
+        if len(self.samples) < 4:
+            return 0.0
+        q1, _, q3 = statistics.quantiles(self.samples, n=4)
+        return q3 - q1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"samples": self.samples, "inner": self.inner, "median": self.median, "iqr": self.iqr}
+
+
+@dataclass
+class Comparison:
+    name: str
+    current: float
+    baseline: float | None
+    p_value: float | None
+    regressed: bool = False
+    improved: bool = False
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline - 1
+
+
+def measure(operation: Callable[[], Any], rounds: int, warmup: int = 2, min_sample_time: float = 0.005) -> BenchmarkResult:
+    for _ in range(warmup):
+        operation()
+
+    inner = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(inner):
+            operation()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_time or inner >= 1 << 20:
+            break
+        inner *= 2
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(inner):
+            operation()
+        samples.append((time.perf_counter() - started) / inner)
+    return BenchmarkResult("", samples, inner)
+
+
+def mann_whitney_greater(current: list[float], baseline: list[float]) -> float:
+    # One-sided Mann-Whitney U: p-value for "current is stochastically greater (slower) than baseline"
+    n1, n2 = len(current), len(baseline)
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    index = 0
+    while index < len(combined):
+        end = index
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        ties = end - index + 1
+        tie_term += ties ** 3 - ties
+        for position in range(index, end + 1):
+            ranks[position] = (index + end) / 2 + 1
+        index = end + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    current: dict[str, BenchmarkResult],
+    baseline: dict[str, list[float]],
+    alpha: float = 0.01,
+    min_effect: float = 0.05
+) -> list[Comparison]:
+    comparisons = []
+    for name, result in current.items():
+        previous = baseline.get(name)
+        if not previous or len(previous) < 3 or len(result.samples) < 3:
+            comparisons.append(Comparison(name, result.median, None, None))
+            continue
+
+        comparison = Comparison(name, result.median, statistics.median(previous), mann_whitney_greater(result.samples, previous))
+        change = comparison.change or 0.0
+        comparison.regressed = comparison.p_value < alpha and change > min_effect
+        comparison.improved = mann_whitney_greater(previous, result.samples) < alpha and change < -min_effect
+        comparisons.append(comparison)
+    return comparisons
+
+
+def current_commit(repo: Path) -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=repo, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=repo, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def current_environment() -> dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform()}
+
+
+class BenchmarkHistory:
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.runs: list[dict[str, Any]] = []
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    self.runs.append(json.loads(line))
+
+    def baseline(
+        self,
+        commit: str,
+        names: list[str],
+        environment: dict[str, str],
+        against: str | None = None
+    ) -> dict[str, list[float]]:
+        # Timings from another Python or machine would make the test report the environment change as a regression
+        comparable = [run for run in self.runs if run.get("environment") == environment]
+        runs = [run for run in comparable if (run["commit"] == against if against else run["commit"] != commit)]
+        if not runs and not against:
+            runs = comparable
+
+        samples: dict[str, list[float]] = {}
+        for run in reversed(runs):
+            for name in names:
+                if name not in samples and name in run["results"]:
+                    samples[name] = run["results"][name]["samples"]
+        return samples
+
+    def append(self, commit: str, results: dict[str, BenchmarkResult], environment: dict[str, str]) -> None:
+        run = {
+            "commit": commit,
+            "timestamp": round(time.time(), 3),
+            "environment": environment,
+            "results": {name: result.as_dict() for name, result in results.items()},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as history:
+            history.write(json.dumps(run) + "\n")
+        self.runs.append(run)
@@ -0,0 +1,265 @@
+import os
+import json
+import time
+import signal
+import socket
+import hashlib
+import logging
+import subprocess
+from pathlib import Path
+from urllib.parse import urlsplit
+from dataclasses import dataclass
+from importlib.metadata import version
+from playwright._impl._driver import compute_driver_executable
+
+logger = logging.getLogger(__name__)
+
+BROWSER_SERVER_DIR = Path(".pytest_cache", "d", "browser-server")
+DEFAULT_IDLE_TIMEOUT = 900
+START_TIMEOUT = 30
+PROBE_TIMEOUT = 0.5
+CLIENT_ONLY_OPTIONS = ("slow_mo",)
+
+SERVER_SCRIPT = """
+const fs = require("fs");
+const options = JSON.parse(process.env.BROWSER_SERVER_OPTIONS);
+const playwright = require(options.driverPackage);
+
+const ownsStateFile = () => {
+    try {
+        return JSON.parse(fs.readFileSync(options.stateFile, "utf-8")).pid === process.pid;
+    } catch {
+        return false;
+    }
+};
+
+(async () => {
+    const server = await playwright[options.browser].launchServer({ ...options.launchOptions, host: "127.0.0.1", port: 0 });
+    const state = {
+        pid: process.pid,
+        browser: options.browser,
+        ws_endpoint: server.wsEndpoint(),
+        launch_options: options.launchOptions,
+        started_at: Date.now() / 1000
+    };
+    fs.writeFileSync(`${options.stateFile}.tmp`, JSON.stringify(state));
+    fs.renameSync(`${options.stateFile}.tmp`, options.stateFile);
+    console.log(`Serving ${options.browser} on ${state.ws_endpoint}`);
+
+    const shutdown = async (reason, code = 0) => {
+        console.log(`Shutting down: ${reason}`);
+        if (ownsStateFile()) {
+            fs.rmSync(options.stateFile, { force: true });
+        }
+        await server.close().catch(() => {});
+        process.exit(code);
+    };
+    const lastUsed = () => {
+        try {
+            return Math.max(state.started_at, fs.statSync(options.heartbeatFile).mtimeMs / 1000);
+        } catch {
+            return state.started_at;
+        }
+    };
+
+    setInterval(() => {
+        if (Date.now() / 1000 - lastUsed() > options.idleTimeout) {
+            shutdown(`idle for more than ${options.idleTimeout} s`);
+        }
+    }, 5000);
+    server.process().on("exit", () => shutdown("the browser process exited", 1));
+    process.on("SIGTERM", () => shutdown("SIGTERM"));
+    process.on("SIGINT", () => shutdown("SIGINT"));
+})().catch(error => {
+    console.error(error);
+    process.exit(1);
+});
+"""
+
+
+class BrowserServerError(RuntimeError):
+    pass
+
+
+def camel_case(name: str) -> str:
+    head, *tail = name.split("_")
+    return head + "".join(part.capitalize() for part in tail)
+
+
+@dataclass(frozen=True)
+class BrowserServerState:
+    pid: int
+    browser: str
+    ws_endpoint: str
+    launch_options: dict
+    started_at: float
+
+    def is_healthy(self) -> bool:
+        endpoint = urlsplit(self.ws_endpoint)
+        try:
+            with socket.create_connection((endpoint.hostname, endpoint.port), timeout=PROBE_TIMEOUT):
+                return True
+        except OSError:
+            return False
+
+
+class BrowserServer:
+
+    def __init__(
+        self,
+        root: Path,
+        browser: str,
+        launch_options: dict | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ) -> None:
+        self.root = root
+        self.browser = browser
+        self.launch_options = {
+            camel_case(name): value for name, value in (launch_options or {}).items() if name not in CLIENT_ONLY_OPTIONS
+        }
+        self.idle_timeout = idle_timeout
+
+        # Daemons of another Playwright version or other launch options live side by side
+        fingerprint = json.dumps([version("playwright"), self.launch_options], sort_keys=True)
+        self.key = f"{browser}-{hashlib.sha1(fingerprint.encode()).hexdigest()[:8]}"
+
+    @property
+    def state_file(self) -> Path:
+        return self.root / f"{self.key}.json"
+
+    @property
+    def heartbeat_file(self) -> Path:
+        return self.root / f"{self.key}.heartbeat"
+
+    @property
+    def lock_file(self) -> Path:
+        return self.root / f"{self.key}.lock"
+
+    @property
+    def log_file(self) -> Path:
+        return self.root / f"{self.key}.log"
+
+    def state(self) -> BrowserServerState | None:
+        try:
+            return BrowserServerState(**json.loads(self.state_file.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def healthy_state(self) -> BrowserServerState | None:
+        state = self.state()
+        return state if state and state.is_healthy() else None
+
+    def ensure(self, timeout: float = START_TIMEOUT) -> BrowserServerState:
+        self.root.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            state = self.healthy_state()
+            if state:
+                self.touch()
+                return state
+            try:
+                lock = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                # Another worker is starting the same daemon; wait for its state file
+                if time.time() - self._mtime(self.lock_file) > timeout:
+                    self.lock_file.unlink(missing_ok=True)
+                elif time.monotonic() > deadline:
+                    raise BrowserServerError(f"Timed out waiting for another process to start '{self.key}'")
+                time.sleep(0.05)
+                continue
+            try:
+                return self.healthy_state() or self._spawn(timeout)
+            finally:
+                os.close(lock)
+                self.lock_file.unlink(missing_ok=True)
+
+    def stop(self, timeout: float = 10) -> bool:
+        state = self.state()
+        if not state:
+            return False
+        logger.info(f"[ACTION] Stopping browser server '{self.key}' (pid {state.pid})...")
+        try:
+            os.kill(state.pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            self.state_file.unlink(missing_ok=True)
+            return False
+
+        deadline = time.monotonic() + timeout
+        while self.state_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.state_file.unlink(missing_ok=True)
+        self.heartbeat_file.unlink(missing_ok=True)
+        return True
+
+    def touch(self) -> None:
+        self.heartbeat_file.touch()
+
+    def idle_for(self) -> float:
+        state = self.state()
+        last_used = max(state.started_at if state else 0, self._mtime(self.heartbeat_file))
+        return time.time() - last_used
+
+    def _spawn(self, timeout: float) -> BrowserServerState:
+        node, cli = compute_driver_executable()
+        options = {
+            "driverPackage": str(Path(cli).parent),
+            "browser": self.browser,
+            "launchOptions": self.launch_options,
+            "stateFile": str(self.state_file),
+            "heartbeatFile": str(self.heartbeat_file),
+            "idleTimeout": self.idle_timeout,
+        }
+        logger.info(f"[ACTION] Starting browser server '{self.key}' with options {self.launch_options}...")
+        self.state_file.unlink(missing_ok=True)
+        self.touch()
+
+        with open(self.log_file, "w", encoding="utf-8") as log:
+            process = subprocess.Popen(
+                [node, "-e", SERVER_SCRIPT],
+                env={**os.environ, "BROWSER_SERVER_OPTIONS": json.dumps(options)},
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+                creationflags=getattr(subprocess, "DETACHED_PROCESS", 0)
+            )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            state = self.state()
+            if state and state.pid == process.pid:
+                logger.info(f"[SUCCESS] Browser server '{self.key}' listening on {state.ws_endpoint}")
+                return state
+            if process.poll() is not None:
+                raise BrowserServerError(f"Browser server '{self.key}' exited with code {process.returncode}:\n{self._log_tail()}")
+            time.sleep(0.05)
+
+        process.terminate()
+        raise BrowserServerError(f"Browser server '{self.key}' did not start within {timeout:.0f} s:\n{self._log_tail()}")
+
+    def _log_tail(self, lines: int = 20) -> str:
+        try:
+            return "\n".join(self.log_file.read_text(encoding="utf-8", errors="replace").splitlines()[-lines:])
+        except OSError:
+            return ""
+
+    @staticmethod
+    def _mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return 0
+
+    @classmethod
+    def running(cls, root: Path) -> list["BrowserServer"]:
+        servers = []
+        for state_file in sorted(root.glob("*.json")):
+            try:
+                state = BrowserServerState(**json.loads(state_file.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                continue
+            server = cls(root, state.browser)
+            server.launch_options = state.launch_options
+            server.key = state_file.stem
+            servers.append(server)
+        return servers
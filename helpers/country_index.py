@@ -0,0 +1,94 @@
+import re
+import difflib
+import logging
+import unicodedata
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+READ_OPTIONS_SCRIPT = "options => options.filter(option => option.value).map(option => [option.value, option.textContent.trim()])"
+
+COUNTRY_ALIASES = {
+    "Bolivia": ("Bolivia, Plurinational State of",),
+    "Cabo Verde": ("Cape Verde",),
+    "Congo, Democratic Republic of the": ("DR Congo", "DRC", "Democratic Republic of the Congo"),
+    "Cote d'Ivoire": ("Ivory Coast",),
+    "Czechia": ("Czech Republic",),
+    "Eswatini": ("Swaziland",),
+    "Holy See": ("Vatican", "Vatican City"),
+    "Iran, Islamic Republic of": ("Iran",),
+    "Korea, Democratic People's Republic of": ("North Korea", "DPRK"),
+    "Korea, Republic of": ("South Korea", "Korea"),
+    "Lao People's Democratic Republic": ("Laos",),
+    "Micronesia, Federated States of": ("Micronesia",),
+    "Moldova, Republic of": ("Moldova",),
+    "Myanmar": ("Burma",),
+    "North Macedonia": ("Macedonia",),
+    "Palestine, State of": ("Palestine",),
+    "Russian Federation": ("Russia",),
+    "Syrian Arab Republic": ("Syria",),
+    "Tanzania, United Republic of": ("Tanzania",),
+    "Turkey": ("Turkiye",),
+    "United Kingdom": ("UK", "Great Britain", "Britain", "England"),
+    "United States": ("USA", "United States of America", "America"),
+    "Venezuela": ("Venezuela, Bolivarian Republic of",),
+    "Viet Nam": ("Vietnam",),
+}
+
+
+def country_key(name: str) -> str:
+    # "Côte d'Ivoire", "Cote d'Ivoire" and "cote divoire" share one key, as do "Viet Nam" and "Vietnam"
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", ascii_name.casefold())
+
+
+class UnknownCountryError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CountryOption:
+    value: str
+    label: str
+
+
+class CountryIndex:
+
+    _cache: dict[str, "CountryIndex"] = {}
+
+    def __init__(self, options: list[tuple[str, str]]) -> None:
+        self.options = [CountryOption(value, label) for value, label in options]
+        self._lookup: dict[str, CountryOption] = {}
+
+        for option in self.options:
+            self._lookup.setdefault(country_key(option.label), option)
+        for option in self.options:
+            self._lookup.setdefault(country_key(option.value), option)
+        for label, aliases in COUNTRY_ALIASES.items():
+            option = self._lookup.get(country_key(label))
+            if option:
+                for alias in aliases:
+                    self._lookup.setdefault(country_key(alias), option)
+
+    @classmethod
+    def cached(cls, key: str) -> "CountryIndex | None":
+        return cls._cache.get(key)
+
+    @classmethod
+    def store(cls, key: str, options: list[tuple[str, str]]) -> "CountryIndex":
+        index = cls._cache[key] = cls(options)
+        logger.debug(f"[CONFIG] Country index for '{key}' built from {len(index)} options")
+        return index
+
+    def resolve(self, name: str) -> CountryOption:
+        option = self._lookup.get(country_key(name))
+        if option:
+            return option
+
+        suggestions = difflib.get_close_matches(country_key(name), self._lookup, n=3, cutoff=0.6)
+        labels = list(dict.fromkeys(self._lookup[key].label for key in suggestions))
+        hint = f" Did you mean: {', '.join(repr(label) for label in labels)}?" if labels else ""
+        raise UnknownCountryError(f"Unknown country '{name}' ({len(self.options)} options available).{hint}")
+
+    def __len__(self) -> int:
+        return len(self.options)
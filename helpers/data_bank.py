@@ -0,0 +1,170 @@
+import json
+import mmap
+import zlib
+import random
+import struct
+import logging
+from pathlib import Path
+from faker import Faker
+from slugify import slugify
+from importlib.metadata import version
+
+from helpers.file_helper import atomic_write_bytes, file_lock
+from models.countries import COUNTRIES
+from models.data_models import CustomerLoginData, CustomerSignupData
+
+logger = logging.getLogger(__name__)
+
+BANK_MAGIC = b"PHPTDB01"
+BANK_VERSION = 1
+INDEX_HEADER = struct.Struct("<8sI")
+RECORD_HEADER = struct.Struct("<6H")
+OFFSET = struct.Struct("<I")
+BANKS_KEPT = 8
+
+
+def _section_key(group: str, char_class: str) -> str:
+    return f"{group}/{char_class}"
+
+
+def _sub_seed(seed: int, *parts: str) -> int:
+    return zlib.crc32("/".join(parts).encode("utf-8"), seed & 0xFFFFFFFF)
+
+
+def generate_bank(seed: int, langs: dict[str, list[str]], chars: dict[str, str], size: int) -> bytes:
+    countries = [name for _, name in COUNTRIES]
+    records = bytearray()
+    sections: dict[str, list[int]] = {}
+    offsets: list[int] = []
+
+    for group, locales in langs.items():
+        fakers = [Faker(locale) for locale in locales]
+        for locale, faker in zip(locales, fakers):
+            faker.seed_instance(_sub_seed(seed, group, locale))
+        rng = random.Random(_sub_seed(seed, group, "fields"))
+        count = size * len(chars)
+
+        record_fakers = rng.choices(fakers, k=count)
+        first_names = [faker.first_name() for faker in record_fakers]
+        last_names = [faker.last_name() for faker in record_fakers]
+        country_names = rng.choices(countries, k=count)
+        phones = ["0" + "".join(rng.choices("0123456789", k=9)) for _ in range(count)]
+
+        for class_index, (char_class, alphabet) in enumerate(chars.items()):
+            sections[_section_key(group, char_class)] = [len(offsets), size]
+            for index in range(size):
+                row = class_index * size + index
+                local_part = slugify(f"{first_names[row]} {last_names[row]}", separator="_") or "user"
+                fields = (
+                    first_names[row],
+                    last_names[row],
+                    country_names[row],
+                    phones[row],
+                    f"{local_part}.{seed:x}.{group}.{char_class}.{index}@example.com".lower(),
+                    "".join(rng.choices("abcdefghjkmnpqrstuvwxyz23456789", k=8)) + "".join(rng.choices(alphabet, k=4)),
+                )
+                encoded = [value.encode("utf-8") for value in fields]
+                offsets.append(len(records))
+                records += RECORD_HEADER.pack(*map(len, encoded))
+                records += b"".join(encoded)
+
+    index = json.dumps({
+        "version": BANK_VERSION,
+        "seed": seed,
+        "size": size,
+        "sections": sections,
+    }).encode("utf-8")
+    offsets_start = INDEX_HEADER.size + len(index)
+    records_start = offsets_start + OFFSET.size * len(offsets)
+
+    header = INDEX_HEADER.pack(BANK_MAGIC, len(index)) + index
+    offset_table = b"".join(OFFSET.pack(records_start + offset) for offset in offsets)
+    return header + offset_table + bytes(records)
+
+
+class DataBank:
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = INDEX_HEADER.unpack_from(self._buffer, 0)
+        if magic != BANK_MAGIC:
+            raise ValueError(f"Not a data bank file: {path}")
+        index = json.loads(self._buffer[INDEX_HEADER.size:INDEX_HEADER.size + index_length])
+
+        self.seed: int = index["seed"]
+        self.size: int = index["size"]
+        self._offsets_start = INDEX_HEADER.size + index_length
+        self._sections: dict[str, tuple[int, int]] = {key: tuple(value) for key, value in index["sections"].items()}
+
+    @classmethod
+    def open(
+        cls,
+        directory: Path,
+        seed: int,
+        langs: dict[str, list[str]],
+        chars: dict[str, str],
+        size: int = 256
+    ) -> "DataBank":
+        directory.mkdir(parents=True, exist_ok=True)
+        # Faker's providers change between releases, so the same seed only gives the same records on the same Faker
+        fingerprint = zlib.crc32(json.dumps([BANK_VERSION, version("Faker"), langs, chars], sort_keys=True).encode("utf-8"))
+        path = directory / f"bank-{seed}-{size}-{fingerprint:08x}.bin"
+
+        if path.exists():
+            path.touch()
+        else:
+            with file_lock(directory / f"{path.name}.lock"):
+                if not path.exists():
+                    logger.info(f"[CONFIG] Generating data bank for seed {seed} ({size} records per section)...")
+                    atomic_write_bytes(path, generate_bank(seed, langs, chars, size))
+                    logger.info(f"[SUCCESS] Data bank written: {path}")
+            cls.evict(directory)
+
+        return cls(path)
+
+    @staticmethod
+    def evict(directory: Path, keep: int = BANKS_KEPT) -> None:
+        banks = []
+        for bank in directory.glob("bank-*.bin"):
+            try:
+                banks.append((bank.stat().st_mtime, bank))
+            except FileNotFoundError:
+                continue
+        for _, bank in sorted(banks, reverse=True)[keep:]:
+            try:
+                bank.unlink()
+                bank.with_name(f"{bank.name}.lock").unlink(missing_ok=True)
+            except OSError:
+                continue
+            logger.debug(f"[DEBUG] Evicted unused data bank: {bank.name}")
+
+    @property
+    def sections(self) -> list[str]:
+        return list(self._sections)
+
+    def signup_data(self, group: str, char_class: str, index: int) -> CustomerSignupData:
+        try:
+            first_offset, count = self._sections[_section_key(group, char_class)]
+        except KeyError:
+            raise KeyError(f"No data bank section for group '{group}' and character class '{char_class}'") from None
+
+        buffer = self._buffer
+        (position,) = OFFSET.unpack_from(buffer, self._offsets_start + OFFSET.size * (first_offset + index % count))
+        lengths = RECORD_HEADER.unpack_from(buffer, position)
+        position += RECORD_HEADER.size
+
+        values = []
+        for length in lengths:
+            values.append(buffer[position:position + length].decode("utf-8"))
+            position += length
+        return CustomerSignupData(*values)
+
+    def login_data(self, group: str, char_class: str, index: int) -> CustomerLoginData:
+        signup_data = self.signup_data(group, char_class, index)
+        return CustomerLoginData(email=signup_data.email, password=signup_data.password)
+
+    def close(self) -> None:
+        self._buffer.close()
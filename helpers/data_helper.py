@@ -1,35 +1,79 @@
 import string
 import logging
+from pathlib import Path
 from faker import Faker
 
+from helpers.data_bank import DataBank
+from helpers.identity import IdentityAllocator
+from models.data_models import CustomerLoginData, CustomerSignupData
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SEED = 4197
+# Same directory as the data_helper fixture uses, so scripts and pytest share one bank per checkout
+DEFAULT_BANK_DIR = Path(__file__).resolve().parent.parent / ".pytest_cache" / "d" / "data_bank"
+
 class DataHelper:
 
-    def __init__(self, seed: int | None = None):
-        
-        self.langs = {
-            "basic_latinh": ["en_US"],
-            "accented": ["vi_VN", "fr_FR", "de_DE", "es_ES", "pt_BR", "it_IT", "pl_PL", "cs_CZ"],
-            "non_latinh": ["ja_JP", "ko_KR", "zh_CN", "ru_RU", "ar_SA"]
-        }
-
-        self.chars = {
-            "ascii_letter": string.ascii_letters,
-            "digit": string.digits,
-            "punctuation_no_at": string.punctuation.replace("@", ""),
-            "punctuation": string.punctuation,
-            "symbol": "©®™§¶†‡•€£¥∞±≠",
-            "math": "+-=*/√^∞∫≈≠≤≥∀∂∃∅∇∈∉∋∏∑−∕∗∘√∝∞∠∧∨∩∪∫∬∭∮",
-            "emoji": "😀🚀🔥✅❌🌟💯🐱‍👤",
-            "control": "".join(chr(i) for i in range(0, 32)),
-            "whitespace": " \t\n\r\u00A0\u200B",
-        }
-
-        all_locales = [lang for group in self.langs.values() for lang in group]
-        self.faker = Faker(all_locales)
-        if seed is None:
-            import time
-            seed = int(time.time())
+    langs = {
+        "basic_latinh": ["en_US"],
+        "accented": ["vi_VN", "fr_FR", "de_DE", "es_ES", "pt_BR", "it_IT", "pl_PL", "cs_CZ"],
+        "non_latinh": ["ja_JP", "ko_KR", "zh_CN", "ru_RU", "ar_SA"]
+    }
+
+    chars = {
+        "ascii_letter": string.ascii_letters,
+        "digit": string.digits,
+        "punctuation_no_at": string.punctuation.replace("@", ""),
+        "punctuation": string.punctuation,
+        "symbol": "©®™§¶†‡•€£¥∞±≠",
+        "math": "+-=*/√^∞∫≈≠≤≥∀∂∃∅∇∈∉∋∏∑−∕∗∘√∝∞∠∧∨∩∪∫∬∭∮",
+        "emoji": "😀🚀🔥✅❌🌟💯🐱‍👤",
+        "control": "".join(chr(i) for i in range(0, 32)),
+        "whitespace": " \t\n\r\u00A0\u200B",
+    }
+
+    def __init__(
+        self,
+        seed: int = DEFAULT_SEED,
+        bank_dir: Path = DEFAULT_BANK_DIR,
+        bank_size: int = 256,
+        identities: IdentityAllocator | None = None
+    ):
         self.seed = seed
-        self.faker.seed_instance(seed)
\ No newline at end of file
+        self.bank_dir = bank_dir
+        self.bank_size = bank_size
+        self.identities = identities or IdentityAllocator.for_process()
+        self._faker: Faker | None = None
+        self._bank: DataBank | None = None
+
+    @property
+    def faker(self) -> Faker:
+        if self._faker is None:
+            all_locales = [lang for group in self.langs.values() for lang in group]
+            self._faker = Faker(all_locales)
+            self._faker.seed_instance(self.seed)
+        return self._faker
+
+    @property
+    def bank(self) -> DataBank:
+        if self._bank is None:
+            self._bank = DataBank.open(self.bank_dir, self.seed, self.langs, self.chars, self.bank_size)
+        return self._bank
+
+    def signup_data(self, group: str = "basic_latinh", char_class: str = "ascii_letter", index: int = 0) -> CustomerSignupData:
+        return self.bank.signup_data(group, char_class, index)
+
+    def login_data(self, group: str = "basic_latinh", char_class: str = "ascii_letter", index: int = 0) -> CustomerLoginData:
+        return self.bank.login_data(group, char_class, index)
+
+    def unique_email(self, prefix: str = "user", domain: str = "gmail.com") -> str:
+        return self.identities.email(prefix, domain)
+
+    def unique_phone(self) -> str:
+        return self.identities.phone()
+
+    def close(self) -> None:
+        if self._bank is not None:
+            self._bank.close()
+            self._bank = None
@@ -0,0 +1,62 @@
+import heapq
+import pytest
+import statistics
+from typing import Any
+
+DURATION_HISTORY_KEY = "durations/history"
+DEFAULT_ESTIMATE = 5.0
+
+duration_history_key = pytest.StashKey["DurationHistory"]()
+predicted_loads_key = pytest.StashKey[list[float]]()
+
+
+class DurationHistory:
+
+    def __init__(self, entries: dict[str, list[float]] | None = None, keep: int = 5) -> None:
+        self.entries = {nodeid: list(durations) for nodeid, durations in (entries or {}).items()}
+        self.keep = keep
+        self._current: dict[str, float] = {}
+
+    @classmethod
+    def load(cls, cache: Any, keep: int = 5) -> "DurationHistory":
+        return cls(cache.get(DURATION_HISTORY_KEY, {}) if cache else {}, keep)
+
+    def predict(self, nodeid: str) -> float | None:
+        durations = self.entries.get(nodeid)
+        return statistics.median(durations) if durations else None
+
+    @property
+    def default_estimate(self) -> float:
+        known = [statistics.median(durations) for durations in self.entries.values() if durations]
+        return statistics.median(known) if known else DEFAULT_ESTIMATE
+
+    def estimates(self, nodeids: list[str]) -> dict[str, float]:
+        default = self.default_estimate
+        return {nodeid: self.predict(nodeid) or default for nodeid in nodeids}
+
+    def add(self, nodeid: str, duration: float) -> None:
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + duration
+
+    @property
+    def current(self) -> dict[str, float]:
+        return dict(self._current)
+
+    def save(self, cache: Any) -> None:
+        for nodeid, duration in self._current.items():
+            self.entries[nodeid] = (self.entries.get(nodeid, []) + [round(duration, 3)])[-self.keep:]
+        if cache:
+            cache.set(DURATION_HISTORY_KEY, self.entries)
+
+
+def lpt_plan(estimates: dict[str, float], workers: int) -> list[list[str]]:
+    plan: list[list[str]] = [[] for _ in range(workers)]
+    loads = [(0.0, worker) for worker in range(workers)]
+    for nodeid in sorted(estimates, key=lambda nodeid: -estimates[nodeid]):
+        load, worker = heapq.heappop(loads)
+        plan[worker].append(nodeid)
+        heapq.heappush(loads, (load + estimates[nodeid], worker))
+    return plan
+
+
+def plan_loads(plan: list[list[str]], durations: dict[str, float]) -> list[float]:
+    return [round(sum(durations.get(nodeid, 0.0) for nodeid in nodeids), 3) for nodeids in plan]
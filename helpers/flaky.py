@@ -0,0 +1,67 @@
+import pytest
+from typing import Any
+from dataclasses import dataclass
+
+FLAKE_HISTORY_KEY = "flaky/history"
+FAILED_ALL_ATTEMPTS = 0
+
+flaky_attempt_key = pytest.StashKey[int]()
+
+
+@dataclass(frozen=True)
+class FlakeRate:
+    runs: int
+    passed_first_try: int
+    passed_on_retry: int
+    failed: int
+
+    @property
+    def rate(self) -> float:
+        return (self.runs - self.passed_first_try) / self.runs if self.runs else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "passed_first_try": self.passed_first_try,
+            "passed_on_retry": self.passed_on_retry,
+            "failed": self.failed,
+            "flake_rate": round(self.rate, 4)
+        }
+
+
+class FlakeHistory:
+
+    def __init__(self, entries: dict[str, list[int]] | None = None, keep: int = 20) -> None:
+        self.entries = {nodeid: list(runs) for nodeid, runs in (entries or {}).items()}
+        self.keep = keep
+        self._current: dict[str, int] = {}
+
+    @classmethod
+    def load(cls, cache: Any, keep: int = 20) -> "FlakeHistory":
+        return cls(cache.get(FLAKE_HISTORY_KEY, {}) if cache else {}, keep)
+
+    def add(self, nodeid: str, attempts: int, passed: bool) -> None:
+        self._current[nodeid] = attempts if passed else FAILED_ALL_ATTEMPTS
+
+    @property
+    def current(self) -> dict[str, int]:
+        return dict(self._current)
+
+    def save(self, cache: Any) -> None:
+        for nodeid, attempts in self._current.items():
+            self.entries[nodeid] = (self.entries.get(nodeid, []) + [attempts])[-self.keep:]
+        self._current.clear()
+        if cache:
+            cache.set(FLAKE_HISTORY_KEY, self.entries)
+
+    def rate(self, nodeid: str) -> FlakeRate:
+        runs = self.entries.get(nodeid, [])
+        return FlakeRate(
+            runs=len(runs),
+            passed_first_try=runs.count(1),
+            passed_on_retry=sum(1 for attempts in runs if attempts > 1),
+            failed=runs.count(FAILED_ALL_ATTEMPTS)
+        )
+
+    def rates(self) -> dict[str, FlakeRate]:
+        return {nodeid: self.rate(nodeid) for nodeid in sorted(self.entries)}
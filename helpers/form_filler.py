@@ -0,0 +1,121 @@
+import logging
+from typing import Any, Mapping
+from dataclasses import asdict, dataclass, is_dataclass
+
+logger = logging.getLogger(__name__)
+
+FAST = "fast"
+STRICT = "strict"
+FORM_FILL_MODES = (FAST, STRICT)
+
+FILL_SCRIPT = """
+(root, { fields, values }) => {
+    const prototypes = [HTMLInputElement, HTMLTextAreaElement, HTMLSelectElement].map(type => type.prototype);
+    const rejected = {};
+    for (const [name, selector] of Object.entries(fields)) {
+        const matches = root.querySelectorAll(selector);
+        if (matches.length !== 1) {
+            rejected[name] = `${matches.length} elements match '${selector}'`;
+            continue;
+        }
+        const element = matches[0];
+        if (element.disabled || element.readOnly) {
+            rejected[name] = "disabled or read-only";
+            continue;
+        }
+        let value = String(values[name]);
+        if (element instanceof HTMLSelectElement) {
+            const option = [...element.options].find(option => option.value === value || option.textContent.trim() === value);
+            if (!option) {
+                rejected[name] = `no option '${value}'`;
+                continue;
+            }
+            value = option.value;
+        }
+        const prototype = prototypes.find(prototype => prototype.isPrototypeOf(element));
+        if (!prototype) {
+            rejected[name] = `<${element.tagName.toLowerCase()}> is not a form control`;
+            continue;
+        }
+        Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, value);
+        element.dispatchEvent(new Event("input", { bubbles: true }));
+        element.dispatchEvent(new Event("change", { bubbles: true }));
+        if (element.value !== value) {
+            rejected[name] = `value was changed to '${element.value}'`;
+        }
+    }
+    return rejected;
+}
+"""
+
+
+@dataclass(frozen=True)
+class FormField:
+    selector: str
+    fallback: str
+
+
+@dataclass(frozen=True)
+class FormSpec:
+    name: str
+    root: str
+    fields: dict[str, FormField]
+
+
+class FormFiller:
+
+    mode = FAST
+
+    def __init__(self, owner: Any, spec: FormSpec, mode: str | None = None) -> None:
+        self.owner = owner
+        self.spec = spec
+        self.mode = mode or type(self).mode
+
+    def fill(self, data: Any) -> None:
+        values = self._values(data)
+        if self.mode == STRICT:
+            self._fall_back(values)
+            return
+
+        logger.info(f"[INPUT] Filling {len(values)} field(s) of the {self.spec.name} in one round trip: {', '.join(values)}...")
+        rejected = self.owner.page.locator(self.spec.root).evaluate(FILL_SCRIPT, self._payload(values))
+        self._log_rejected(rejected)
+        self._fall_back({name: value for name, value in values.items() if name in rejected})
+        logger.info(f"[SUCCESS] {self.spec.name.capitalize()} filled.")
+
+    def _values(self, data: Any) -> dict[str, Any]:
+        source = asdict(data) if is_dataclass(data) else dict(data)
+        return {name: source[name] for name in self.spec.fields if source.get(name) is not None}
+
+    def _payload(self, values: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+        return {
+            "fields": {name: self.spec.fields[name].selector for name in values},
+            "values": dict(values)
+        }
+
+    def _log_rejected(self, rejected: dict[str, str]) -> None:
+        for name, reason in rejected.items():
+            logger.warning(f"[WARNING] Field '{name}' needs a real fill ({reason}), falling back to '{self.spec.fields[name].fallback}'")
+
+    def _fall_back(self, values: Mapping[str, Any]) -> None:
+        for name, value in values.items():
+            getattr(self.owner, self.spec.fields[name].fallback)(value)
+
+
+class AsyncFormFiller(FormFiller):
+
+    async def fill(self, data: Any) -> None:
+        values = self._values(data)
+        if self.mode == STRICT:
+            await self._fall_back(values)
+            return
+
+        logger.info(f"[INPUT] Filling {len(values)} field(s) of the {self.spec.name} in one round trip: {', '.join(values)}...")
+        rejected = await self.owner.page.locator(self.spec.root).evaluate(FILL_SCRIPT, self._payload(values))
+        self._log_rejected(rejected)
+        await self._fall_back({name: value for name, value in values.items() if name in rejected})
+        logger.info(f"[SUCCESS] {self.spec.name.capitalize()} filled.")
+
+    async def _fall_back(self, values: Mapping[str, Any]) -> None:
+        for name, value in values.items():
+            await getattr(self.owner, self.spec.fields[name].fallback)(value)
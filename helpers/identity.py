@@ -0,0 +1,59 @@
+import os
+import time
+import secrets
+import itertools
+
+# E.164 caps phones at 15 digits, which is also the most a type="number" input keeps exact
+PHONE_LENGTH = 15
+PHONE_EPOCH_MS = 1_735_689_600_000
+PHONE_TIME_DIGITS = 10
+PHONE_WORKER_DIGITS = 2
+PHONE_COUNTER_DIGITS = PHONE_LENGTH - PHONE_TIME_DIGITS - PHONE_WORKER_DIGITS
+
+
+def new_run_id() -> str:
+    return f"{time.time_ns() // 1_000_000:011x}{secrets.token_hex(2)}"
+
+
+def run_started_ms(run_id: str) -> int:
+    return int(run_id[:11], 16)
+
+
+def phone_time_slot(timestamp_ms: int) -> int:
+    # Tenths of a second since 2025-01-01, ten digits last until 2056
+    return (timestamp_ms - PHONE_EPOCH_MS) // 100
+
+
+def worker_index(worker_id: str) -> int:
+    return int(worker_id.removeprefix("gw")) + 1 if worker_id.startswith("gw") else 0
+
+
+class IdentityAllocator:
+
+    def __init__(self, run_id: str, worker_id: str = "master") -> None:
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self.worker = worker_index(worker_id)
+        if self.worker >= 10 ** PHONE_WORKER_DIGITS:
+            raise ValueError(f"Worker '{worker_id}' does not fit the {PHONE_WORKER_DIGITS} worker digits of a phone")
+        self._sequence = itertools.count(1)
+        self._phone_slot = phone_time_slot(run_started_ms(run_id))
+        self._phone_count = -1
+
+    @classmethod
+    def for_process(cls) -> "IdentityAllocator":
+        return cls(new_run_id(), os.environ.get("PYTEST_XDIST_WORKER", "master"))
+
+    def next_token(self) -> str:
+        return f"{self.run_id}_{self.worker:03d}_{next(self._sequence):06d}"
+
+    def email(self, prefix: str = "user", domain: str = "gmail.com") -> str:
+        return f"{prefix}_{self.next_token()}@{domain}"
+
+    def phone(self) -> str:
+        self._phone_count += 1
+        if self._phone_count == 10 ** PHONE_COUNTER_DIGITS:
+            # Move on to a later time slot instead of growing the number, so phones keep their length and order
+            self._phone_slot = max(self._phone_slot + 1, phone_time_slot(time.time_ns() // 1_000_000))
+            self._phone_count = 0
+        return f"{self._phone_slot:0{PHONE_TIME_DIGITS}d}{self.worker:0{PHONE_WORKER_DIGITS}d}{self._phone_count:0{PHONE_COUNTER_DIGITS}d}"
@@ -0,0 +1,101 @@
+import math
+from typing import Any
+
+
+class LatencyHistogram:
+
+    def __init__(self, significant_digits: int = 2, highest_value: int = 3_600_000_000) -> None:
+        self.significant_digits = significant_digits
+        self.highest_value = highest_value
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0
+
+    def record(self, value: int, count: int = 1) -> None:
+        value = min(max(int(value), 0), self.highest_value)
+        index = self._index_of(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        if not self.total or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.total += count
+        self._sum += value * count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if not other.total:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.min = other.min if not self.total else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.total += other.total
+        self._sum += other._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total if self.total else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(self.total * percentile / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def summary(self, percentiles: tuple[float, ...] = (50, 95, 99)) -> dict[str, Any]:
+        return {
+            "count": self.total,
+            "min": self.min,
+            "mean": round(self.mean, 1),
+            "max": self.max,
+            **{f"p{percentile:g}": self.value_at_percentile(percentile) for percentile in percentiles},
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "significant_digits": self.significant_digits,
+            "highest_value": self.highest_value,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "sum": self._sum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data["significant_digits"], data["highest_value"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        histogram._sum = data["sum"]
+        return histogram
+
+    def _index_of(self, value: int) -> int:
+        # Values below sub_bucket_count are exact; above that every power of two keeps sub_bucket_half linear steps
+        bucket = max(value.bit_length() - self.sub_bucket_bits, 0)
+        sub_bucket = value >> bucket
+        return bucket * self.sub_bucket_half + sub_bucket
+
+    def _highest_equivalent(self, index: int) -> int:
+        bucket, sub_bucket = divmod(index, self.sub_bucket_half)
+        if bucket <= 1:
+            bucket, sub_bucket = 0, index
+        else:
+            bucket, sub_bucket = bucket - 1, sub_bucket + self.sub_bucket_half
+        return ((sub_bucket + 1) << bucket) - 1
+
+    def __len__(self) -> int:
+        return self.total
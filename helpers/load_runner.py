@@ -0,0 +1,270 @@
+import time
+import random
+import asyncio
+import logging
+from threading import Barrier
+from dataclasses import dataclass, field, replace
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+from playwright.async_api import async_playwright, Browser, BrowserContext, Error as PlaywrightError
+
+from helpers.captcha import CAPTCHA_STRATEGIES, CaptchaStrategy
+from helpers.data_helper import DataHelper
+from helpers.identity import IdentityAllocator
+from helpers.latency_histogram import LatencyHistogram
+from models.data_models import CustomerLoginData
+from pages.async_base_page import AsyncBasePage
+from pages.async_customer_login_page import AsyncCustomerLoginPage
+from pages.async_customer_signup_page import AsyncCustomerSignupPage
+from pages.signup_success_page import SignupSuccessPage
+
+logger = logging.getLogger(__name__)
+
+READY_TIMEOUT = 120
+
+@dataclass(frozen=True)
+class LoadProfile:
+    base_url: str
+    users: int
+    processes: int
+    duration: float
+    ramp_up: float
+    scenarios: dict[str, float]
+    run_id: str
+    captcha_strategy: str = "stub"
+    browser_name: str = "chromium"
+    headless: bool = True
+    think_time: float = 0.0
+    seed: int = 4197
+
+    def users_for(self, process_index: int) -> list[int]:
+        return list(range(process_index, self.users, self.processes))
+
+
+@dataclass
+class LoadResult:
+    histograms: dict[str, LatencyHistogram] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    error_types: dict[str, dict[str, int]] = field(default_factory=dict)
+    started: float = 0.0
+    finished: float = 0.0
+
+    def record(self, action: str, elapsed_us: int) -> None:
+        histogram = self.histograms.get(action)
+        if histogram is None:
+            histogram = self.histograms[action] = LatencyHistogram()
+        histogram.record(elapsed_us)
+
+    def record_error(self, action: str, error_type: str) -> None:
+        self.errors[action] = self.errors.get(action, 0) + 1
+        types = self.error_types.setdefault(action, {})
+        types[error_type] = types.get(error_type, 0) + 1
+
+    def merge(self, other: "LoadResult") -> None:
+        for action, histogram in other.histograms.items():
+            self.histograms.setdefault(action, LatencyHistogram()).merge(histogram)
+        for action, count in other.errors.items():
+            self.errors[action] = self.errors.get(action, 0) + count
+        for action, types in other.error_types.items():
+            merged = self.error_types.setdefault(action, {})
+            for error_type, count in types.items():
+                merged[error_type] = merged.get(error_type, 0) + count
+        self.started = min(self.started, other.started) if self.started else other.started
+        self.finished = max(self.finished, other.finished)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "histograms": {action: histogram.to_dict() for action, histogram in self.histograms.items()},
+            "errors": self.errors,
+            "error_types": self.error_types,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LoadResult":
+        return cls(
+            histograms={action: LatencyHistogram.from_dict(value) for action, value in data["histograms"].items()},
+            errors=dict(data["errors"]),
+            error_types={action: dict(types) for action, types in data["error_types"].items()},
+            started=data["started"],
+            finished=data["finished"],
+        )
+
+    def report(self, profile: LoadProfile) -> dict[str, Any]:
+        elapsed = max(self.finished - self.started, 1e-9)
+        actions = {}
+        for action in sorted(self.histograms.keys() | self.errors.keys()):
+            summary = self.histograms.get(action, LatencyHistogram()).summary()
+            actions[action] = {
+                **{key: (value / 1000 if key != "count" else value) for key, value in summary.items()},
+                "errors": self.errors.get(action, 0),
+                "error_types": self.error_types.get(action, {}),
+                "throughput_per_s": round(summary["count"] / elapsed, 3),
+            }
+        return {
+            "run_id": profile.run_id,
+            "base_url": profile.base_url,
+            "users": profile.users,
+            "processes": profile.processes,
+            "duration_s": round(elapsed, 3),
+            "ramp_up_s": profile.ramp_up,
+            "scenarios": profile.scenarios,
+            "unit": "ms",
+            "actions": actions,
+        }
+
+
+class VirtualUser:
+
+    def __init__(
+        self,
+        index: int,
+        browser: Browser,
+        profile: LoadProfile,
+        result: LoadResult,
+        identity: IdentityAllocator,
+        data_helper: DataHelper,
+        captcha_strategy: CaptchaStrategy
+    ) -> None:
+        self.index = index
+        self.browser = browser
+        self.profile = profile
+        self.result = result
+        self.identity = identity
+        self.data_helper = data_helper
+        self.captcha_strategy = captcha_strategy
+        self.iteration = 0
+        self.rng = random.Random(profile.seed + index)
+        self._context: BrowserContext | None = None
+
+    @asynccontextmanager
+    async def timed(self, action: str) -> AsyncIterator[None]:
+        started = time.perf_counter_ns()
+        try:
+            yield
+        except Exception as e:
+            self.result.record_error(action, type(e).__name__)
+            raise
+        self.result.record(action, (time.perf_counter_ns() - started) // 1000)
+
+    async def open(self, page_class: type[AsyncBasePage]) -> Any:
+        self._context = await self.browser.new_context(base_url=self.profile.base_url)
+        page = await self._context.new_page()
+        if issubclass(page_class, AsyncCustomerSignupPage):
+            await self.captcha_strategy.prepare_async(page)
+            return page_class(page, self.profile.base_url, self.captcha_strategy)
+        return page_class(page, self.profile.base_url)
+
+    async def run(self, deadline: float) -> None:
+        names = list(self.profile.scenarios)
+        weights = list(self.profile.scenarios.values())
+
+        while time.monotonic() < deadline:
+            name = self.rng.choices(names, weights)[0]
+            try:
+                async with self.timed(name):
+                    await SCENARIOS[name](self)
+            except (PlaywrightError, AssertionError) as e:
+                logger.debug(f"[DEBUG] Virtual user {self.index} failed '{name}': {e}")
+            except Exception as e:
+                # Recorded as a failed transaction by timed(); one broken journey must not stop the other users
+                logger.warning(f"[WARNING] Virtual user {self.index} failed '{name}' with {type(e).__name__}: {e}")
+            finally:
+                await self._close_context()
+            self.iteration += 1
+            if self.profile.think_time:
+                await asyncio.sleep(self.profile.think_time)
+
+    async def _close_context(self) -> None:
+        context, self._context = self._context, None
+        if context is not None:
+            try:
+                await context.close()
+            except PlaywrightError:
+                pass
+
+
+async def login_scenario(user: VirtualUser) -> None:
+    login_page: AsyncCustomerLoginPage = await user.open(AsyncCustomerLoginPage)
+    login_form = login_page.login_form
+
+    async with user.timed("login.navigate"):
+        await login_page.navigate()
+    async with user.timed("login.submit"):
+        await login_form.login(CustomerLoginData(email=user.identity.email(), password="************"))
+        await login_form.alert_card.wait_for()
+
+
+async def reset_password_scenario(user: VirtualUser) -> None:
+    login_page: AsyncCustomerLoginPage = await user.open(AsyncCustomerLoginPage)
+    login_form = login_page.login_form
+
+    async with user.timed("reset_password.navigate"):
+        await login_page.navigate()
+    async with user.timed("reset_password.open_modal"):
+        await login_form.click_reset_password_link()
+        await login_form.reset_password_modal.wait_for(state="visible")
+    async with user.timed("reset_password.submit"):
+        async with login_page.page.expect_event("dialog") as dialog_info:
+            await login_form.reset_password(user.identity.email())
+        await login_page.handle_browser_dialog(await dialog_info.value, {})
+
+
+async def signup_scenario(user: VirtualUser) -> None:
+    signup_page: AsyncCustomerSignupPage = await user.open(AsyncCustomerSignupPage)
+    signup_data = replace(
+        user.data_helper.signup_data(index=user.index * 7919 + user.iteration),
+        email=user.identity.email(),
+        phone=user.identity.phone()
+    )
+
+    async with user.timed("signup.navigate"):
+        await signup_page.navigate()
+    async with user.timed("signup.register"):
+        await signup_page.register_account(signup_data)
+        await signup_page.page.wait_for_url(f"**{SignupSuccessPage.PATH}")
+
+
+SCENARIOS: dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "login": login_scenario,
+    "reset_password": reset_password_scenario,
+    "signup": signup_scenario,
+}
+
+
+async def _run_process(profile: LoadProfile, process_index: int, ready: Barrier) -> LoadResult:
+    result = LoadResult()
+    identity = IdentityAllocator(profile.run_id, f"gw{process_index}")
+    data_helper = DataHelper(seed=profile.seed, identities=identity)
+    captcha_strategy = CAPTCHA_STRATEGIES[profile.captcha_strategy]()
+
+    async with async_playwright() as playwright:
+        try:
+            browser = await getattr(playwright, profile.browser_name).launch(headless=profile.headless)
+        except Exception:
+            ready.abort()
+            raise
+        try:
+            # Every process launches its browser first, so the ramp-up starts together once all are up
+            await asyncio.to_thread(ready.wait, READY_TIMEOUT)
+            result.started = time.time()
+            deadline = time.monotonic() + profile.duration
+
+            async def start_user(index: int) -> None:
+                await asyncio.sleep(profile.ramp_up * index / profile.users)
+                user = VirtualUser(index, browser, profile, result, identity, data_helper, captcha_strategy)
+                await user.run(deadline)
+
+            await asyncio.gather(*(start_user(index) for index in profile.users_for(process_index)))
+            result.finished = time.time()
+        finally:
+            await browser.close()
+            data_helper.close()
+
+    return result
+
+
+def run_process(profile: LoadProfile, process_index: int, ready: Barrier, log_level: str = "WARNING") -> dict[str, Any]:
+    logging.basicConfig(level=log_level, format=f"%(asctime)s %(levelname)-6s [gw{process_index}] %(message)s")
+    return asyncio.run(_run_process(profile, process_index, ready)).to_dict()
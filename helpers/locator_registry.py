@@ -0,0 +1,164 @@
+from functools import cache
+from typing import Any, Iterator, overload
+from playwright.sync_api import Locator
+
+
+class _Step:
+
+    __slots__ = ("name", "args", "kwargs")
+
+    def __init__(self, name: str, args: tuple[Any, ...] | None = None, kwargs: dict[str, Any] | None = None) -> None:
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs or {}
+
+    def apply(self, target: Any, instance: object) -> Any:
+        member = getattr(target, self.name)
+        if self.args is None:
+            return member
+        args = [_resolve(arg, instance) for arg in self.args]
+        kwargs = {key: _resolve(value, instance) for key, value in self.kwargs.items()}
+        return member(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        if self.args is None:
+            return self.name
+        params = [repr(arg) for arg in self.args] + [f"{key}={value!r}" for key, value in self.kwargs.items()]
+        return f"{self.name}({', '.join(params)})"
+
+
+def _resolve(value: Any, instance: object) -> Any:
+    return value.__get__(instance, type(instance)) if isinstance(value, LocatorSpec) else value
+
+
+class LocatorSpec:
+
+    __slots__ = ("anchor", "steps", "name")
+
+    def __init__(self, anchor: str, steps: tuple[_Step, ...] = ()) -> None:
+        self.anchor = anchor
+        self.steps = steps
+        self.name: str | None = None
+
+    def _chain(self, method: str, /, *args: Any, **kwargs: Any) -> "LocatorSpec":
+        return LocatorSpec(self.anchor, (*self.steps, _Step(method, args, kwargs)))
+
+    def locator(self, selector: str, **kwargs: Any) -> "LocatorSpec":
+        return self._chain("locator", selector, **kwargs)
+
+    def get_by_role(self, role: str, **kwargs: Any) -> "LocatorSpec":
+        return self._chain("get_by_role", role, **kwargs)
+
+    def get_by_text(self, text: Any, **kwargs: Any) -> "LocatorSpec":
+        return self._chain("get_by_text", text, **kwargs)
+
+    def get_by_placeholder(self, text: Any, **kwargs: Any) -> "LocatorSpec":
+        return self._chain("get_by_placeholder", text, **kwargs)
+
+    def get_by_label(self, text: Any, **kwargs: Any) -> "LocatorSpec":
+        return self._chain("get_by_label", text, **kwargs)
+
+    def filter(self, **kwargs: Any) -> "LocatorSpec":
+        return self._chain("filter", **kwargs)
+
+    def nth(self, index: int) -> "LocatorSpec":
+        return self._chain("nth", index)
+
+    @property
+    def first(self) -> "LocatorSpec":
+        return LocatorSpec(self.anchor, (*self.steps, _Step("first")))
+
+    @property
+    def last(self) -> "LocatorSpec":
+        return LocatorSpec(self.anchor, (*self.steps, _Step("last")))
+
+    @property
+    def content_frame(self) -> "LocatorSpec":
+        return LocatorSpec(self.anchor, (*self.steps, _Step("content_frame")))
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "LocatorSpec": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> Locator: ...
+
+    def __get__(self, instance: object | None, owner: type) -> "LocatorSpec | Locator":
+        if instance is None:
+            return self
+
+        built = instance._locators
+        try:
+            return built[self.name]
+        except KeyError:
+            pass
+
+        target = getattr(instance, self.anchor)
+        for step in self.steps:
+            target = step.apply(target, instance)
+        built[self.name] = target
+        return target
+
+    def __repr__(self) -> str:
+        return ".".join([self.anchor, *map(repr, self.steps)])
+
+
+class ComponentSpec:
+
+    __slots__ = ("component_class", "name")
+
+    def __init__(self, component_class: type) -> None:
+        self.component_class = component_class
+        self.name: str | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object | None, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        built = instance._locators
+        try:
+            return built[self.name]
+        except KeyError:
+            component = built[self.name] = self.component_class(instance.page)
+            return component
+
+    def __repr__(self) -> str:
+        return f"component({self.component_class.__name__})"
+
+
+def within(anchor: str) -> LocatorSpec:
+    return LocatorSpec(anchor)
+
+
+def component(component_class: type) -> ComponentSpec:
+    return ComponentSpec(component_class)
+
+
+on_page = within("page")
+on_root = within("root")
+
+
+@cache
+def declared_locators(owner: type) -> dict[str, LocatorSpec]:
+    locators: dict[str, LocatorSpec] = {}
+    for name in dict.fromkeys(name for klass in reversed(owner.__mro__) for name in vars(klass)):
+        member = getattr(owner, name, None)
+        if isinstance(member, LocatorSpec):
+            locators[name] = member
+        elif isinstance(member, ComponentSpec):
+            for child_name, spec in declared_locators(member.component_class).items():
+                locators[f"{name}.{child_name}"] = spec
+    return locators
+
+
+def iter_locators(instance: object) -> Iterator[tuple[str, Locator]]:
+    for path in declared_locators(type(instance)):
+        target = instance
+        for part in path.split("."):
+            target = getattr(target, part)
+        yield path, target
@@ -0,0 +1,54 @@
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from helpers.duration_history import DurationHistory, lpt_plan, plan_loads, predicted_loads_key
+
+PREFETCH = 2
+
+
+class DurationScheduling(LoadScheduling):
+
+    def __init__(self, config: pytest.Config, log, history: DurationHistory) -> None:
+        super().__init__(config, log)
+        self.history = history
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+
+        estimates = self.history.estimates(self.collection)
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: -estimates[self.collection[index]])
+        if self.history.entries:
+            self.config.stash[predicted_loads_key] = plan_loads(lpt_plan(estimates, len(self.nodes)), estimates)
+
+        # A worker only starts an item once it knows the next one, so every node keeps PREFETCH items queued
+        for _ in range(PREFETCH):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            missing = PREFETCH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
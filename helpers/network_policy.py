@@ -0,0 +1,265 @@
+import json
+import time
+import logging
+from pathlib import Path
+from fnmatch import fnmatch
+from collections import Counter
+from urllib.parse import urlsplit
+from dataclasses import dataclass, field, replace
+from playwright.sync_api import Page, Route, Response
+
+from helpers.file_helper import atomic_write_text, file_lock
+
+logger = logging.getLogger(__name__)
+
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.com",
+    "platform.twitter.com",
+    "hotjar.com",
+    "clarity.ms",
+)
+
+CAPTCHA_DOMAINS = ("hcaptcha.com",)
+
+SIZE_TABLE_MAX_ENTRIES = 2000
+SIZE_TABLE_MAX_SAMPLES = 1000
+
+
+@dataclass(frozen=True)
+class ResponseStub:
+    url_pattern: str
+    body: str = ""
+    status: int = 200
+    content_type: str = "text/plain"
+
+
+@dataclass(frozen=True)
+class NetworkPolicy:
+    name: str = "allow_all"
+    blocked_resource_types: frozenset[str] = frozenset()
+    block_third_party: bool = False
+    allowed_domains: tuple[str, ...] = ()
+    blocked_domains: tuple[str, ...] = ()
+    stubs: tuple[ResponseStub, ...] = ()
+
+    @property
+    def is_noop(self) -> bool:
+        return not (self.blocked_resource_types or self.block_third_party or self.blocked_domains or self.stubs)
+
+    def merge(self, other: "NetworkPolicy") -> "NetworkPolicy":
+        if self == other:
+            return self
+        return NetworkPolicy(
+            name=f"{self.name}+{other.name}",
+            blocked_resource_types=self.blocked_resource_types & other.blocked_resource_types,
+            block_third_party=self.block_third_party and other.block_third_party,
+            allowed_domains=tuple(sorted(set(self.allowed_domains) | set(other.allowed_domains))),
+            blocked_domains=tuple(sorted(set(self.blocked_domains) & set(other.blocked_domains))),
+            stubs=tuple(stub for stub in self.stubs if stub in other.stubs)
+        )
+
+
+ALLOW_ALL = NetworkPolicy()
+
+NO_MEDIA = NetworkPolicy(
+    name="no_media",
+    blocked_resource_types=frozenset({"image", "font", "media"}),
+    blocked_domains=TRACKER_DOMAINS,
+    stubs=(
+        ResponseStub("*://www.googletagmanager.com/gtag/js*", content_type="text/javascript"),
+        ResponseStub("*://www.google-analytics.com/analytics.js", content_type="text/javascript"),
+    )
+)
+
+FIRST_PARTY_ONLY = replace(
+    NO_MEDIA,
+    name="first_party_only",
+    block_third_party=True,
+    allowed_domains=CAPTCHA_DOMAINS
+)
+
+POLICIES = {policy.name: policy for policy in (ALLOW_ALL, NO_MEDIA, FIRST_PARTY_ONLY)}
+
+
+@dataclass
+class NetworkStats:
+    policy: str = ALLOW_ALL.name
+    allowed: int = 0
+    aborted: int = 0
+    stubbed: int = 0
+    bytes_saved: int = 0
+    unknown_size: int = 0
+    aborted_by_type: Counter = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "policy": self.policy,
+            "allowed": self.allowed,
+            "aborted": self.aborted,
+            "stubbed": self.stubbed,
+            "bytes_saved": self.bytes_saved,
+            "unknown_size": self.unknown_size,
+            "aborted_by_type": dict(self.aborted_by_type),
+        }
+
+
+def size_key(url: str, resource_type: str) -> str:
+    # Query strings are mostly cache busters, so they would only multiply the entries of one resource
+    parts = urlsplit(url)
+    return f"{resource_type} {parts.hostname or ''}{parts.path}"
+
+
+class NetworkSizeTable:
+
+    def __init__(self, path: Path | None = None, max_entries: int = SIZE_TABLE_MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.sizes: dict[str, list[float]] = {}
+        self.type_sizes: dict[str, list[int]] = {}
+        self._learned: dict[str, list[float]] = {}
+        self._type_learned: dict[str, list[int]] = {}
+        self._merge(self._read())
+
+    def learn(self, url: str, resource_type: str, size: int) -> None:
+        key = size_key(url, resource_type)
+        self.sizes[key] = self._learned[key] = [size, round(time.time(), 3)]
+        for type_sizes in (self.type_sizes, self._type_learned):
+            total, count = type_sizes.get(resource_type, (0, 0))
+            type_sizes[resource_type] = [total + size, count + 1]
+
+    def estimate(self, url: str, resource_type: str) -> int | None:
+        entry = self.sizes.get(size_key(url, resource_type))
+        if entry:
+            return int(entry[0])
+        # Blocked resources are never downloaded, so unseen ones are estimated from the average of their type
+        total, count = self.type_sizes.get(resource_type, (0, 0))
+        return total // count if count else None
+
+    def flush(self) -> None:
+        if not self.path or not (self._learned or self._type_learned):
+            return
+        # Re-read under the lock so sizes learned by other workers meanwhile are kept
+        with file_lock(self.path.with_name(f"{self.path.name}.lock")):
+            self.sizes, self.type_sizes = {}, {}
+            self._merge(self._read())
+            self._merge({"sizes": self._learned, "types": self._type_learned})
+            atomic_write_text(self.path, json.dumps({"sizes": self.sizes, "types": self.type_sizes}, indent=2, sort_keys=True))
+        logger.debug(f"[DEBUG] Network size table: {len(self._learned)} size(s) learned, {len(self.sizes)} kept in {self.path}")
+        self._learned.clear()
+        self._type_learned.clear()
+
+    def _merge(self, table: dict[str, dict[str, list]]) -> None:
+        for key, entry in table.get("sizes", {}).items():
+            if key not in self.sizes or entry[1] >= self.sizes[key][1]:
+                self.sizes[key] = entry
+        if len(self.sizes) > self.max_entries:
+            latest = sorted(self.sizes.items(), key=lambda item: item[1][1])[-self.max_entries:]
+            self.sizes = dict(latest)
+
+        for resource_type, (total, count) in table.get("types", {}).items():
+            known_total, known_count = self.type_sizes.get(resource_type, (0, 0))
+            total, count = known_total + total, known_count + count
+            # Halving keeps the average moving with the site instead of growing the sample count forever
+            while count > SIZE_TABLE_MAX_SAMPLES:
+                total, count = total // 2, count // 2
+            self.type_sizes[resource_type] = [total, count]
+
+    def _read(self) -> dict[str, dict[str, list]]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning(f"[WARNING] Network size table is corrupted, starting over: {self.path}")
+            return {}
+
+
+def _matches_domain(host: str, domains: tuple[str, ...]) -> bool:
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+class NetworkPolicyController:
+
+    def __init__(self, page: Page, base_url: str, size_table: NetworkSizeTable | None = None) -> None:
+        self.page = page
+        self.size_table = size_table or NetworkSizeTable()
+        self.policy: NetworkPolicy | None = None
+        self.pinned = False
+        self.stats = NetworkStats()
+
+        base_host = urlsplit(base_url).hostname or ""
+        self._first_party_root = base_host.removeprefix("www.")
+        self._routed = False
+        self._stubbed_urls: set[str] = set()
+
+        self.page.on("response", self._on_response)
+
+    def pin(self, policy: NetworkPolicy) -> None:
+        self.policy = policy
+        self.pinned = True
+        self._install()
+
+    def apply(self, policy: NetworkPolicy) -> None:
+        if self.pinned:
+            logger.debug(f"[DEBUG] Network policy pinned by marker, ignoring page policy: '{policy.name}'")
+            return
+        self.policy = policy if self.policy is None else self.policy.merge(policy)
+        self._install()
+
+    def _install(self) -> None:
+        self.stats.policy = self.policy.name
+        if self._routed or self.policy.is_noop:
+            return
+        self.page.route("**/*", self._handle_route)
+        self._routed = True
+        logger.debug(f"[CONFIG] Network policy '{self.policy.name}' installed")
+
+    def _handle_route(self, route: Route) -> None:
+        request = route.request
+        url = request.url
+        policy = self.policy
+
+        for stub in policy.stubs:
+            if fnmatch(url, stub.url_pattern):
+                self.stats.stubbed += 1
+                self._stubbed_urls.add(url)
+                self._count_saved(url, request.resource_type, len(stub.body.encode("utf-8")))
+                route.fulfill(status=stub.status, body=stub.body, content_type=stub.content_type)
+                return
+
+        host = urlsplit(url).hostname or ""
+        resource_type = request.resource_type
+        if (
+            resource_type in policy.blocked_resource_types
+            or _matches_domain(host, policy.blocked_domains)
+            or (policy.block_third_party and self._is_third_party(host) and not _matches_domain(host, policy.allowed_domains))
+        ):
+            self.stats.aborted += 1
+            self.stats.aborted_by_type[resource_type] += 1
+            self._count_saved(url, resource_type)
+            route.abort("blockedbyclient")
+            return
+
+        route.fallback()
+
+    def _is_third_party(self, host: str) -> bool:
+        return bool(host) and not (host == self._first_party_root or host.endswith(f".{self._first_party_root}"))
+
+    def _count_saved(self, url: str, resource_type: str, served: int = 0) -> None:
+        size = self.size_table.estimate(url, resource_type)
+        if size is None:
+            self.stats.unknown_size += 1
+        else:
+            self.stats.bytes_saved += max(size - served, 0)
+
+    def _on_response(self, response: Response) -> None:
+        if response.url in self._stubbed_urls:
+            return
+        self.stats.allowed += 1
+        content_length = response.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            self.size_table.learn(response.url, response.request.resource_type, int(content_length))
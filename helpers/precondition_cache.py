@@ -0,0 +1,135 @@
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from helpers.file_helper import atomic_write_text, file_lock
+from models.data_models import CustomerSignupData
+
+logger = logging.getLogger(__name__)
+
+def precondition_key(data: CustomerSignupData, namespace: str) -> str:
+    payload = json.dumps({"namespace": namespace, "data": asdict(data)}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedPrecondition:
+    key: str
+    account: CustomerSignupData
+    from_cache: bool
+
+
+class PreconditionCache:
+
+    INDEX_FILE = "index.json"
+    LOCK_FILE = "index.lock"
+
+    def __init__(self, root: Path, namespace: str, ttl: float, max_entries: int) -> None:
+        self.root = Path(root)
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.locks_dir = self.root / "locks"
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+
+        self.index_path = self.root / self.INDEX_FILE
+        self.lock_path = self.root / self.LOCK_FILE
+
+    def get(self, data: CustomerSignupData) -> CachedPrecondition | None:
+        key = precondition_key(data, self.namespace)
+
+        with file_lock(self.lock_path):
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None or self._is_expired(entry, time.time()):
+                return None
+
+            entry["last_used"] = time.time()
+            self._write_index(index)
+
+        logger.debug(f"[DEBUG] Precondition cache hit for key: {key[:12]}")
+        return self._to_precondition(key, entry, from_cache=True)
+
+    def put(self, data: CustomerSignupData, account: CustomerSignupData) -> CachedPrecondition:
+        key = precondition_key(data, self.namespace)
+        now = time.time()
+        entry = {
+            "namespace": self.namespace,
+            "account": asdict(account),
+            "created_at": now,
+            "last_used": now,
+        }
+
+        with file_lock(self.lock_path):
+            index = self._read_index()
+            index[key] = entry
+            self._evict(index, now)
+            self._write_index(index)
+
+        logger.debug(f"[DEBUG] Precondition cached under key: {key[:12]}")
+        return self._to_precondition(key, entry, from_cache=False)
+
+    def get_or_create(
+        self,
+        data: CustomerSignupData,
+        create: Callable[[CustomerSignupData], CustomerSignupData]
+    ) -> CachedPrecondition:
+        cached = self.get(data)
+        if cached:
+            return cached
+
+        key = precondition_key(data, self.namespace)
+        with file_lock(self.locks_dir / f"{key}.lock"):
+            cached = self.get(data)
+            if cached:
+                return cached
+
+            logger.info(f"[PRE-CONDITION] Cache miss. Creating precondition for: '{data.first_name} {data.last_name}'...")
+            return self.put(data, create(data))
+
+    def invalidate(self, data: CustomerSignupData) -> None:
+        key = precondition_key(data, self.namespace)
+        with file_lock(self.lock_path):
+            index = self._read_index()
+            if index.pop(key, None) is None:
+                return
+            self._write_index(index)
+
+    def _evict(self, index: dict[str, dict[str, Any]], now: float) -> None:
+        expired = [key for key, entry in index.items() if self._is_expired(entry, now)]
+        overflow = len(index) - len(expired) - self.max_entries
+        if overflow > 0:
+            alive = sorted(
+                (key for key in index if key not in expired),
+                key=lambda key: index[key]["last_used"]
+            )
+            expired.extend(alive[:overflow])
+
+        for key in expired:
+            index.pop(key)
+
+        if expired:
+            logger.debug(f"[DEBUG] Evicted {len(expired)} precondition cache entries")
+
+    def _is_expired(self, entry: dict[str, Any], now: float) -> bool:
+        return now - entry["created_at"] > self.ttl
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            logger.warning(f"[WARNING] Precondition cache index is corrupted, starting over: {self.index_path}")
+            return {}
+
+    def _write_index(self, index: dict[str, dict[str, Any]]) -> None:
+        atomic_write_text(self.index_path, json.dumps(index, indent=2, sort_keys=True))
+
+    def _to_precondition(self, key: str, entry: dict[str, Any], from_cache: bool) -> CachedPrecondition:
+        return CachedPrecondition(key=key, account=CustomerSignupData(**entry["account"]), from_cache=from_cache)
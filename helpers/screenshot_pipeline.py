@@ -0,0 +1,114 @@
+import io
+import allure
+import logging
+import hashlib
+import pytest
+import allure_commons
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from playwright.sync_api import Page
+
+from helpers.allure_compat import reference_attachment, supports_referenced_attachments
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+SCREENSHOT_MODES = ("always", "failure", "off")
+SCREENSHOT_FORMATS = {
+    "png": ("image/png", "png"),
+    "jpeg": ("image/jpeg", "jpg"),
+    "webp": ("image/webp", "webp"),
+}
+
+
+@dataclass(frozen=True)
+class ScreenshotPolicy:
+    mode: str = "always"
+    full_page: bool = True
+    image_format: str = "png"
+    quality: int = 80
+    max_height: int = 0
+
+    def should_capture(self, failed: bool) -> bool:
+        return self.mode == "always" or (self.mode == "failure" and failed)
+
+    @property
+    def capture_type(self) -> str:
+        return "png" if self.image_format == "webp" else self.image_format
+
+
+class ScreenshotPipeline:
+
+    def __init__(self, policy: ScreenshotPolicy, listener: object | None, workers: int = 2) -> None:
+        self.policy = policy
+        self.listener = listener
+        self.referenced = supports_referenced_attachments(listener)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self._digests: set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.listener is not None and self.policy.mode != "off"
+
+    def capture(self, page: Page, name: str, failed: bool) -> None:
+        if not self.enabled or not self.policy.should_capture(failed):
+            return
+
+        logger.info(f"[ACTION] Capturing screenshot '{name}' ({self.policy.image_format}, {'full page' if self.policy.full_page else 'viewport'})...")
+        screenshot = page.screenshot(**self._screenshot_args(page))
+        mime_type, extension = SCREENSHOT_FORMATS[self.policy.image_format]
+
+        if not self.referenced:
+            allure.attach(self._encode(screenshot), name=name, attachment_type=mime_type, extension=extension)
+            logger.info("[SUCCESS] Screenshot attached to Allure")
+            return
+
+        digest = hashlib.blake2b(screenshot, digest_size=16).hexdigest()
+        file_name = reference_attachment(self.listener, digest, name, mime_type, extension)
+
+        if digest in self._digests:
+            logger.info(f"[SUCCESS] Screenshot identical to an earlier one, referencing attachment: {file_name}")
+            return
+        self._digests.add(digest)
+
+        self._executor.submit(self._write, screenshot, file_name).add_done_callback(self._on_written)
+        logger.info(f"[SUCCESS] Screenshot queued for Allure: {file_name}")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _screenshot_args(self, page: Page) -> dict[str, object]:
+        policy = self.policy
+        args: dict[str, object] = {"type": policy.capture_type, "animations": "disabled", "full_page": policy.full_page}
+        if policy.capture_type == "jpeg":
+            args["quality"] = policy.quality
+
+        if policy.full_page and policy.max_height:
+            width, height = page.evaluate(
+                "() => [document.documentElement.scrollWidth, document.documentElement.scrollHeight]"
+            )
+            if height > policy.max_height:
+                args["clip"] = {"x": 0, "y": 0, "width": width, "height": policy.max_height}
+        return args
+
+    def _encode(self, screenshot: bytes) -> bytes:
+        if self.policy.image_format != "webp":
+            return screenshot
+        with Image.open(io.BytesIO(screenshot)) as image:
+            buffer = io.BytesIO()
+            image.save(buffer, "WEBP", quality=self.policy.quality, method=4)
+            return buffer.getvalue()
+
+    def _write(self, screenshot: bytes, file_name: str) -> None:
+        allure_commons.plugin_manager.hook.report_attached_data(body=self._encode(screenshot), file_name=file_name)
+
+    def _on_written(self, future: Future) -> None:
+        if future.exception():
+            logger.warning(f"[WARNING] Could not write screenshot attachment: {future.exception()}")
+
+
+screenshot_pipeline_key = pytest.StashKey[ScreenshotPipeline]()
@@ -0,0 +1,39 @@
+import json
+import heapq
+import statistics
+from pathlib import Path
+
+DEFAULT_WEIGHT = 1.0
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    index, _, total = value.partition("/")
+    try:
+        index, total = int(index), int(total)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected 'i/N' such as '1/4'") from None
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', the index must be between 1 and {max(total, 1)}")
+    return index, total
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    if not path.is_file():
+        return {}
+    return {nodeid: float(duration) for nodeid, duration in json.loads(path.read_text(encoding="utf-8")).items()}
+
+
+def group_weights(groups: dict[str, list[str]], durations: dict[str, float]) -> dict[str, float]:
+    default = statistics.median(durations.values()) if durations else DEFAULT_WEIGHT
+    return {key: sum(durations.get(nodeid, default) for nodeid in nodeids) for key, nodeids in groups.items()}
+
+
+def partition(weights: dict[str, float], total: int) -> dict[str, int]:
+    # Sorting by (-weight, key) and breaking load ties by shard number keeps the result identical on every machine
+    shards = [(0.0, shard) for shard in range(1, total + 1)]
+    assignment = {}
+    for key in sorted(weights, key=lambda key: (-weights[key], key)):
+        load, shard = heapq.heappop(shards)
+        assignment[key] = shard
+        heapq.heappush(shards, (load + weights[key], shard))
+    return assignment
@@ -0,0 +1,188 @@
+import time
+import inspect
+import functools
+import itertools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+SPAN_ATTRIBUTE = "__span_name__"
+BAR_WIDTH = 24
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+_recorder: "SpanRecorder | None" = None
+
+
+@dataclass
+class Span:
+    id: int
+    parent: int | None
+    depth: int
+    name: str
+    thread: str
+    start_ns: int
+    end_ns: int = 0
+    child_ns: int = 0
+    error: str | None = None
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+    @property
+    def self_ns(self) -> int:
+        return self.duration_ns - self.child_ns
+
+
+class SpanRecorder:
+
+    def __init__(self, nodeid: str) -> None:
+        self.nodeid = nodeid
+        self.spans: list[Span] = []
+        self.started_ns = time.perf_counter_ns()
+        self.started_at = time.time()
+        self._ids = itertools.count(1)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        parent = _current_span.get()
+        span = Span(
+            id=next(self._ids),
+            parent=parent.id if parent else None,
+            depth=parent.depth + 1 if parent else 0,
+            name=name,
+            thread=threading.current_thread().name,
+            start_ns=time.perf_counter_ns()
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            if parent:
+                parent.child_ns += span.duration_ns
+            self.spans.append(span)
+
+    def ordered(self) -> list[Span]:
+        return sorted(self.spans, key=lambda span: (span.start_ns, span.depth))
+
+    def breakdown(self) -> str:
+        spans = self.ordered()
+        if not spans:
+            return "No page-object spans were recorded."
+
+        total_ns = sum(span.duration_ns for span in spans if span.parent is None) or 1
+        lines = [f"{'total':>10} {'self':>10} {'share':>6}  {'':<{BAR_WIDTH}}  span"]
+        for span in spans:
+            share = span.duration_ns / total_ns
+            bar = "█" * max(1, round(share * BAR_WIDTH))
+            error = f"  !! {span.error}" if span.error else ""
+            lines.append(
+                f"{span.duration_ns / 1e6:>8.1f}ms {span.self_ns / 1e6:>8.1f}ms {share:>6.1%}  "
+                f"{bar:<{BAR_WIDTH}}  {'  ' * span.depth}{span.name}{error}"
+            )
+
+        totals: dict[str, list[int]] = {}
+        for span in spans:
+            entry = totals.setdefault(span.name, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += span.duration_ns
+            entry[2] += span.self_ns
+
+        lines += ["", f"{'calls':>6} {'total':>10} {'self':>10}  span (by self time)"]
+        for name, (calls, duration_ns, self_ns) in sorted(totals.items(), key=lambda item: -item[1][2]):
+            lines.append(f"{calls:>6} {duration_ns / 1e6:>8.1f}ms {self_ns / 1e6:>8.1f}ms  {name}")
+        return "\n".join(lines)
+
+    def timeline(self, **extra: Any) -> Iterator[dict[str, Any]]:
+        for span in self.ordered():
+            offset_ns = span.start_ns - self.started_ns
+            yield {
+                **extra,
+                "nodeid": self.nodeid,
+                "id": span.id,
+                "parent": span.parent,
+                "depth": span.depth,
+                "name": span.name,
+                "thread": span.thread,
+                "ts": round(self.started_at + offset_ns / 1e9, 6),
+                "start_ms": round(offset_ns / 1e6, 3),
+                "duration_ms": round(span.duration_ns / 1e6, 3),
+                "self_ms": round(span.self_ns / 1e6, 3),
+                "error": span.error,
+            }
+
+
+def start_recording(nodeid: str) -> SpanRecorder:
+    global _recorder
+    _recorder = SpanRecorder(nodeid)
+    return _recorder
+
+
+def stop_recording() -> SpanRecorder | None:
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span | None]:
+    recorder = _recorder
+    if recorder is None:
+        yield None
+        return
+    with recorder.span(name) as current:
+        yield current
+
+
+def _traced(name: str, func: Callable) -> Callable:
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return await func(*args, **kwargs)
+            with recorder.span(name):
+                return await func(*args, **kwargs)
+        wrapper = async_wrapper
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.span(name):
+                return func(*args, **kwargs)
+
+    setattr(wrapper, SPAN_ATTRIBUTE, name)
+    return wrapper
+
+
+def instrument(cls: type) -> int:
+    wrapped = 0
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member) or hasattr(member, SPAN_ATTRIBUTE):
+            continue
+        setattr(cls, name, _traced(f"{cls.__name__}.{name}", member))
+        wrapped += 1
+    return wrapped
+
+
+def instrument_hierarchy(*roots: type) -> int:
+    seen: set[type] = set()
+    pending = list(roots)
+    wrapped = 0
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        wrapped += instrument(cls)
+        pending.extend(cls.__subclasses__())
+    return wrapped
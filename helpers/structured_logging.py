@@ -0,0 +1,114 @@
+import re
+import json
+import queue
+import logging
+import datetime
+from pathlib import Path
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+
+TAG_PATTERN = re.compile(r"^\[(?P<tag>[A-Z][A-Z-]*)\]\s*")
+
+
+class TestQueueHandler(QueueHandler):
+    __test__ = False
+
+    def __init__(self, log_queue: queue.SimpleQueue, worker: str) -> None:
+        super().__init__(log_queue)
+        self.worker = worker
+        self.nodeid: str | None = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        match = TAG_PATTERN.match(record.msg)
+        record.tag = match["tag"] if match else None
+        record.text = record.msg[match.end():] if match else record.msg
+        record.nodeid = self.nodeid
+        record.worker = self.worker
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            "time": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "worker": getattr(record, "worker", None),
+            "nodeid": getattr(record, "nodeid", None),
+            "tag": getattr(record, "tag", None),
+            "message": getattr(record, "text", record.getMessage()),
+            "logger": record.name,
+            "source": f"{record.filename}:{record.lineno}",
+        }, ensure_ascii=False)
+
+
+class TestLogBuffer(logging.Handler):
+    __test__ = False
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self.records: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def render(self, formatter: logging.Formatter) -> str:
+        return "\n".join(formatter.format(record) for record in list(self.records))
+
+
+class StructuredLogging:
+
+    def __init__(
+        self,
+        jsonl_path: Path,
+        worker: str,
+        level: int = logging.INFO,
+        console_formatter: logging.Formatter | None = None,
+        buffer_size: int = 5000
+    ) -> None:
+        self.jsonl_path = jsonl_path
+        self.level = level
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.queue_handler = TestQueueHandler(self.queue, worker)
+        self.buffer = TestLogBuffer(buffer_size)
+        self.buffer_formatter = console_formatter or logging.Formatter("%(asctime)s %(levelname)-6s %(message)s")
+
+        self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        jsonl_handler = logging.FileHandler(self.jsonl_path, mode="w", encoding="utf-8")
+        jsonl_handler.setFormatter(JsonLinesFormatter())
+        handlers: list[logging.Handler] = [jsonl_handler]
+        if console_formatter:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(console_formatter)
+            handlers.append(console_handler)
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+
+    def start(self) -> None:
+        root = logging.getLogger()
+        root.setLevel(self.level)
+        root.addHandler(self.queue_handler)
+        root.addHandler(self.buffer)
+        self.listener.start()
+
+    def stop(self) -> None:
+        root = logging.getLogger()
+        root.removeHandler(self.queue_handler)
+        root.removeHandler(self.buffer)
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+
+    def begin_test(self, nodeid: str) -> None:
+        self.queue_handler.nodeid = nodeid
+        self.buffer.clear()
+
+    def end_test(self) -> None:
+        self.queue_handler.nodeid = None
+        self.buffer.clear()
+
+    def buffered_log(self) -> str:
+        return self.buffer.render(self.buffer_formatter)
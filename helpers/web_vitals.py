@@ -0,0 +1,220 @@
+import json
+import time
+import logging
+import statistics
+import warnings
+from pathlib import Path
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from helpers.file_helper import atomic_write_text, file_lock
+
+logger = logging.getLogger(__name__)
+
+WEB_VITALS_MODES = ("off", "warn", "fail")
+
+METRICS = ("ttfb", "fcp", "lcp", "cls", "dom_content_loaded", "load", "transfer_kb")
+
+# Differences below these are noise, whatever the relative change to the baseline
+NOISE_FLOORS = {"ttfb": 50, "fcp": 100, "lcp": 100, "cls": 0.02, "dom_content_loaded": 100, "load": 100, "transfer_kb": 10}
+
+WEB_VITALS_INIT_SCRIPT = """(() => {
+    if (window.__webVitals) return;
+    const vitals = window.__webVitals = { fcp: null, lcp: null, cls: 0 };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (e) {}
+    };
+    observe("paint", (entry) => {
+        if (entry.name === "first-contentful-paint") vitals.fcp = entry.startTime;
+    });
+    observe("largest-contentful-paint", (entry) => {
+        vitals.lcp = entry.renderTime || entry.loadTime || entry.startTime;
+    });
+    observe("layout-shift", (entry) => {
+        if (!entry.hadRecentInput) vitals.cls += entry.value;
+    });
+})();
+"""
+
+COLLECT_SCRIPT = """() => {
+    const vitals = window.__webVitals || {};
+    const [navigation] = performance.getEntriesByType("navigation");
+    const resources = performance.getEntriesByType("resource");
+    const [paint] = performance.getEntriesByName("first-contentful-paint");
+    const transferred = resources.reduce((total, entry) => total + (entry.transferSize || 0), navigation ? navigation.transferSize || 0 : 0);
+    return {
+        ttfb: navigation ? navigation.responseStart - navigation.startTime : null,
+        fcp: vitals.fcp ?? (paint ? paint.startTime : null),
+        lcp: vitals.lcp ?? null,
+        cls: window.__webVitals ? vitals.cls : null,
+        dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd || null : null,
+        load: navigation ? navigation.loadEventEnd || null : null,
+        transfer_kb: transferred / 1024,
+        resource_count: resources.length,
+        slowest_resources: [...resources]
+            .sort((a, b) => b.duration - a.duration)
+            .slice(0, 5)
+            .map((entry) => ({ name: entry.name, initiator: entry.initiatorType, duration: entry.duration, transfer_size: entry.transferSize })),
+    };
+}"""
+
+
+class WebVitalsWarning(UserWarning):
+    pass
+
+
+@dataclass(frozen=True)
+class PerfBudget:
+    ttfb: float | None = None
+    fcp: float | None = None
+    lcp: float | None = None
+    cls: float | None = None
+    dom_content_loaded: float | None = None
+    load: float | None = None
+    transfer_kb: float | None = None
+
+
+GOOD_WEB_VITALS = PerfBudget(ttfb=800, fcp=1800, lcp=2500, cls=0.1)
+
+
+@dataclass
+class WebVitalsSample:
+    page: str
+    url: str
+    metrics: dict[str, float | None]
+    resources: dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+    findings: list[str] = field(default_factory=list)
+
+
+class WebVitalsHistory:
+
+    def __init__(self, path: Path, window: int = 20) -> None:
+        self.path = path
+        self.window = window
+        self._series: dict[tuple[str, str], deque[float]] = {}
+        self._pending: list[dict[str, Any]] = []
+        for record in self._read():
+            self._remember(record["page"], record["metrics"])
+
+    def baseline(self, page: str, metric: str, min_samples: int) -> float | None:
+        series = self._series.get((page, metric))
+        if not series or len(series) < min_samples:
+            return None
+        return statistics.median(series)
+
+    def append(self, sample: WebVitalsSample) -> None:
+        self._remember(sample.page, sample.metrics)
+        self._pending.append({"timestamp": round(sample.timestamp, 3), "page": sample.page, "url": sample.url, "metrics": sample.metrics})
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        # Re-read under the lock so samples flushed by other workers meanwhile are kept
+        with file_lock(self.path.with_name(f"{self.path.name}.lock")):
+            records = self._compact(self._read() + self._pending)
+            atomic_write_text(self.path, "".join(json.dumps(record) + "\n" for record in records))
+        logger.debug(f"[DEBUG] Web vitals history: {len(self._pending)} sample(s) saved, {len(records)} kept in {self.path}")
+        self._pending.clear()
+
+    def _read(self) -> list[dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        records = []
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+    def _compact(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        kept: dict[str, deque[dict[str, Any]]] = {}
+        for record in sorted(records, key=lambda record: record["timestamp"]):
+            kept.setdefault(record["page"], deque(maxlen=self.window)).append(record)
+        return sorted((record for page_records in kept.values() for record in page_records), key=lambda record: record["timestamp"])
+
+    def _remember(self, page: str, metrics: dict[str, float | None]) -> None:
+        for metric, value in metrics.items():
+            if value is not None:
+                self._series.setdefault((page, metric), deque(maxlen=self.window)).append(value)
+
+
+@dataclass(frozen=True)
+class WebVitalsPolicy:
+    mode: str = "warn"
+    tolerance: float = 0.25
+    min_samples: int = 5
+
+
+class WebVitalsRecorder:
+
+    _recorders: "WeakKeyDictionary[Any, WebVitalsRecorder]" = WeakKeyDictionary()
+
+    def __init__(self, page: Any, history: WebVitalsHistory, policy: WebVitalsPolicy) -> None:
+        self.page = page
+        self.history = history
+        self.policy = policy
+        self.samples: list[WebVitalsSample] = []
+
+    @classmethod
+    def for_page(cls, page: Any) -> "WebVitalsRecorder | None":
+        return cls._recorders.get(page)
+
+    def watch(self) -> None:
+        if self.policy.mode == "off":
+            return
+        self.page.add_init_script(WEB_VITALS_INIT_SCRIPT)
+        self._recorders[self.page] = self
+
+    async def watch_async(self) -> None:
+        if self.policy.mode == "off":
+            return
+        await self.page.add_init_script(WEB_VITALS_INIT_SCRIPT)
+        self._recorders[self.page] = self
+
+    def unwatch(self) -> None:
+        self._recorders.pop(self.page, None)
+
+    def capture(self, page_name: str, budget: PerfBudget | None) -> WebVitalsSample:
+        return self._check(page_name, budget, self.page.url, self.page.evaluate(COLLECT_SCRIPT))
+
+    async def capture_async(self, page_name: str, budget: PerfBudget | None) -> WebVitalsSample:
+        return self._check(page_name, budget, self.page.url, await self.page.evaluate(COLLECT_SCRIPT))
+
+    def _check(self, page_name: str, budget: PerfBudget | None, url: str, raw: dict[str, Any]) -> WebVitalsSample:
+        metrics = {metric: None if raw.get(metric) is None else round(raw[metric], 4) for metric in METRICS}
+        resources = {"count": raw.get("resource_count", 0), "slowest": raw.get("slowest_resources", [])}
+        sample = WebVitalsSample(page_name, url, metrics, resources)
+
+        for metric, value in metrics.items():
+            if value is None:
+                continue
+            limit = getattr(budget, metric) if budget else None
+            if limit is not None and value > limit:
+                sample.findings.append(f"{metric} {value:g} exceeds the {page_name} budget of {limit:g}")
+
+            baseline = self.history.baseline(page_name, metric, self.policy.min_samples)
+            if baseline is not None and value > baseline * (1 + self.policy.tolerance) and value - baseline > NOISE_FLOORS[metric]:
+                sample.findings.append(
+                    f"{metric} {value:g} regressed more than {self.policy.tolerance:.0%} from the rolling baseline {baseline:g}"
+                )
+
+        self.history.append(sample)
+        self.samples.append(sample)
+        logger.info(f"[EVENT] Web vitals for {page_name}: {', '.join(f'{k}={v:g}' for k, v in metrics.items() if v is not None)}")
+
+        if sample.findings:
+            message = f"Web vitals of {page_name} ({url}): " + "; ".join(sample.findings)
+            if self.policy.mode == "fail":
+                raise AssertionError(message)
+            logger.warning(f"[WARNING] {message}")
+            warnings.warn(WebVitalsWarning(message), stacklevel=4)
+        return sample
+
+    def as_dict(self) -> list[dict[str, Any]]:
+        return [asdict(sample) for sample in self.samples]
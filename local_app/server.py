@@ -0,0 +1,299 @@
+import json
+import uuid
+import secrets
+import logging
+import threading
+from html import escape
+from pathlib import Path
+from string import Template
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from helpers.captcha import HCAPTCHA_TEST_RESPONSE
+from models.countries import COUNTRIES
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+STATIC_DIR = Path(__file__).parent / "static"
+
+SESSION_COOKIE = "phptravels_session"
+CSRF_FIELD = "csrf_token"
+CSRF_HEADER = "X-CSRF-TOKEN"
+
+CONTENT_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".svg": "image/svg+xml",
+}
+
+PLACEHOLDER_PAGES = {
+    "/flights": "Flights",
+    "/hotels": "Hotels",
+    "/tours": "Tours",
+    "/cars": "Cars",
+    "/visa": "Visa",
+    "/blogs": "Blogs",
+    "/agents/login": "Agents Login",
+    "/agents/signup": "Agents Signup",
+    "/about-us": "About Us",
+    "/privacy-policy": "Privacy Policy",
+    "/file-a-claim": "File A Claim",
+    "/contact-us": "Contact Us",
+    "/become-a-supplier": "Become A Supplier",
+    "/careers-and-jobs": "Careers And Jobs",
+    "/faq": "Faq",
+    "/how-to-book": "How To Book",
+    "/terms-of-use": "Terms Of Use",
+    "/cookies-policy": "Cookies Policy",
+    "/booking-tips": "Booking Tips",
+}
+
+TEMPLATES = {path.stem: Template(path.read_text(encoding="utf-8")) for path in TEMPLATES_DIR.glob("*.html")}
+STATIC_FILES = {path.name: path.read_bytes() for path in STATIC_DIR.iterdir()}
+
+COUNTRY_OPTIONS = "\n".join(
+    f'                                <option value="{code}">{escape(name)}</option>' for code, name in COUNTRIES
+)
+COUNTRY_ITEMS = "\n".join(
+    f'                                    <li role="option" data-value="{code}">{escape(name)}</li>' for code, name in COUNTRIES
+)
+
+NOT_ACTIVE_ALERT = ("Account not active", "Please contact admin to activate your account")
+INVALID_LOGIN_ALERT = ("Invalid Login", "Please check your email and password")
+RESET_PASSWORD_NOT_FOUND_MSG = "Invalid or no account found with this email"
+RESET_PASSWORD_SENT_MSG = "Password reset link has been sent to your email"
+
+SIGNUP_FIELDS = ("first_name", "last_name", "country", "phone", "email", "password")
+
+
+class AccountStore:
+
+    def __init__(self) -> None:
+        self._accounts: dict[str, dict[str, str | bool]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, account: dict[str, str]) -> bool:
+        email = account["email"].lower()
+        with self._lock:
+            if email in self._accounts:
+                return False
+            self._accounts[email] = {**account, "active": False}
+            return True
+
+    def get(self, email: str) -> dict[str, str | bool] | None:
+        with self._lock:
+            return self._accounts.get(email.lower())
+
+    def activate(self, email: str) -> None:
+        with self._lock:
+            self._accounts[email.lower()]["active"] = True
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+
+class _LocalHTTPServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], captcha_solve_delay_ms: int) -> None:
+        super().__init__(address, LocalAppRequestHandler)
+        self.accounts = AccountStore()
+        self.sessions: dict[str, str] = {}
+        self.captcha_solve_delay_ms = captcha_solve_delay_ms
+
+
+class LocalAppServer:
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, captcha_solve_delay_ms: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self.captcha_solve_delay_ms = captcha_solve_delay_ms
+        self.instance_id = uuid.uuid4().hex
+        self._httpd: _LocalHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def accounts(self) -> AccountStore:
+        return self._httpd.accounts
+
+    def start(self) -> None:
+        self._httpd = _LocalHTTPServer((self.host, self.port), self.captcha_solve_delay_ms)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            name="local-app-server",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[CONFIG] Local stand-in application started at: '{self.url}'.")
+
+    def stop(self) -> None:
+        if not self._httpd:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        logger.info(f"[CONFIG] Local stand-in application at '{self.url}' stopped.")
+
+    def __enter__(self) -> "LocalAppServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class LocalAppRequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    server: _LocalHTTPServer
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"[DEBUG] Local app: {format % args}")
+
+    def do_GET(self) -> None:
+        self._reset_session()
+        path = urlsplit(self.path).path
+
+        if path == "/":
+            self._send_page("Home", "page", heading="Let's book your next trip!", message="Find flights, hotels, tours and cars.")
+        elif path == "/login":
+            self._send_login_page()
+        elif path == "/signup":
+            self._send_signup_page()
+        elif path == "/signup_success":
+            self._send_page("Signup Success", "signup_success")
+        elif path == "/dashboard":
+            self._send_page("Dashboard", "page", heading="Dashboard", message="Welcome back!")
+        elif path == "/captcha/api.js":
+            self._send_static("captcha_api.js")
+        elif path == "/captcha/checkbox":
+            body = TEMPLATES["captcha_checkbox"].substitute(
+                token=HCAPTCHA_TEST_RESPONSE,
+                solve_delay_ms=self.server.captcha_solve_delay_ms
+            )
+            self._send(200, body.encode("utf-8"), "text/html; charset=utf-8")
+        elif path.startswith("/assets/") and path.removeprefix("/assets/") in STATIC_FILES:
+            self._send_static(path.removeprefix("/assets/"))
+        elif path in PLACEHOLDER_PAGES:
+            heading = PLACEHOLDER_PAGES[path]
+            self._send_page(heading, "page", heading=heading, message=f"{heading} page of the local stand-in.")
+        else:
+            self._send_page("Not Found", "page", status=404, heading="404", message="Page not found.")
+
+    def do_POST(self) -> None:
+        self._reset_session()
+        path = urlsplit(self.path).path
+        form = self._read_form()
+
+        if form.get(CSRF_FIELD, self.headers.get(CSRF_HEADER)) != self._csrf_token():
+            self._send_page("Page Expired", "page", status=419, heading="419", message="Page expired. Please refresh and try again.")
+        elif path == "/login":
+            self._handle_login(form)
+        elif path == "/signup":
+            self._handle_signup(form)
+        elif path == "/reset_password":
+            self._handle_reset_password(form)
+        elif path == "/newsletter":
+            self._send_page("Newsletter", "page", heading="Newsletter", message="Thank you for subscribing.")
+        else:
+            self._send_page("Not Found", "page", status=404, heading="404", message="Page not found.")
+
+    def _handle_login(self, form: dict[str, str]) -> None:
+        account = self.server.accounts.get(form.get("email", ""))
+
+        if account is None or account["password"] != form.get("password"):
+            self._send_login_page(alert=INVALID_LOGIN_ALERT, email=form.get("email", ""))
+        elif not account["active"]:
+            self._send_login_page(alert=NOT_ACTIVE_ALERT, email=form.get("email", ""))
+        else:
+            self._redirect("/dashboard")
+
+    def _handle_signup(self, form: dict[str, str]) -> None:
+        if not all(form.get(field) for field in SIGNUP_FIELDS):
+            self._send_signup_page(alert=("Signup failed", "Please fill in all required fields"))
+        elif form.get("h-captcha-response") != HCAPTCHA_TEST_RESPONSE:
+            self._send_signup_page(alert=("Signup failed", "Please complete the captcha verification"))
+        elif not self.server.accounts.create({field: form[field] for field in SIGNUP_FIELDS}):
+            self._send_signup_page(alert=("Signup failed", "Email already exists"))
+        else:
+            self._redirect("/signup_success")
+
+    def _handle_reset_password(self, form: dict[str, str]) -> None:
+        if self.server.accounts.get(form.get("email", "")) is None:
+            result = {"status": False, "message": RESET_PASSWORD_NOT_FOUND_MSG}
+        else:
+            result = {"status": True, "message": RESET_PASSWORD_SENT_MSG}
+        self._send(200, json.dumps(result).encode("utf-8"), "application/json")
+
+    def _send_login_page(self, alert: tuple[str, str] | None = None, email: str = "") -> None:
+        self._send_page("Login", "login", alert=self._render_alert(alert), email=escape(email))
+
+    def _send_signup_page(self, alert: tuple[str, str] | None = None) -> None:
+        self._send_page(
+            "Signup",
+            "signup",
+            alert=self._render_alert(alert),
+            country_options=COUNTRY_OPTIONS,
+            country_items=COUNTRY_ITEMS
+        )
+
+    def _render_alert(self, alert: tuple[str, str] | None) -> str:
+        if not alert:
+            return ""
+        heading, message = alert
+        return TEMPLATES["alert"].substitute(heading=heading, message=message)
+
+    def _send_page(self, title: str, template: str, status: int = 200, **values: str) -> None:
+        csrf_token = self._csrf_token()
+        content = TEMPLATES[template].substitute(csrf_token=csrf_token, **values)
+        body = TEMPLATES["layout"].substitute(title=title, content=content, csrf_token=csrf_token)
+        self._send(status, body.encode("utf-8"), "text/html; charset=utf-8")
+
+    def _send_static(self, name: str) -> None:
+        content_type = CONTENT_TYPES.get(Path(name).suffix, "application/octet-stream")
+        self._send(200, STATIC_FILES[name], content_type, {"Cache-Control": "max-age=3600"})
+
+    def _redirect(self, location: str) -> None:
+        self._send(303, b"", "text/plain", {"Location": location})
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self._session_cookie:
+            self.send_header("Set-Cookie", self._session_cookie)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reset_session(self) -> None:
+        self._session_token: str | None = None
+        self._session_cookie: str | None = None
+
+    def _csrf_token(self) -> str:
+        if self._session_token is None:
+            morsel = SimpleCookie(self.headers.get("Cookie", "")).get(SESSION_COOKIE)
+            self._session_token = self.server.sessions.get(morsel.value) if morsel else None
+
+            if self._session_token is None:
+                session_id, self._session_token = secrets.token_hex(16), secrets.token_hex(16)
+                self.server.sessions[session_id] = self._session_token
+                self._session_cookie = f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly; SameSite=Lax"
+
+        return self._session_token
+
+    def _read_form(self) -> dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length).decode("utf-8") if length else ""
+        return {key: values[0] for key, values in parse_qs(raw_body, keep_blank_values=True).items()}
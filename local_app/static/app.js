@@ -0,0 +1,101 @@
+(() => {
+    const normalize = (text) => text.normalize("NFD").replace(/[\u0300-\u036f]/g, "").toLowerCase().trim();
+
+    const closeMenus = (except) => {
+        document.querySelectorAll(".dropdown-menu").forEach((menu) => {
+            if (menu !== except) {
+                menu.hidden = true;
+            }
+        });
+    };
+
+    const refreshCountryLabel = (select) => {
+        const label = select.parentElement.querySelector(".filter-option");
+        const option = select.selectedOptions[0];
+        label.textContent = option ? option.textContent : "Select Country";
+    };
+
+    document.addEventListener("click", (event) => {
+        const toggle = event.target.closest("[data-menu-toggle], [data-bs-toggle='dropdown']");
+        if (toggle) {
+            const menu = toggle.nextElementSibling;
+            menu.hidden = !menu.hidden;
+            toggle.setAttribute("aria-expanded", String(!menu.hidden));
+            closeMenus(menu);
+            const search = menu.querySelector("[role='combobox']");
+            if (search && !menu.hidden) {
+                search.focus();
+            }
+            return;
+        }
+
+        const option = event.target.closest(".country-select [role='option']");
+        if (option) {
+            const select = option.closest(".country-select").querySelector("select");
+            select.value = option.dataset.value;
+            select.dispatchEvent(new Event("change", { bubbles: true }));
+            closeMenus(null);
+            return;
+        }
+
+        const modalOpener = event.target.closest("[data-modal-open]");
+        if (modalOpener) {
+            event.preventDefault();
+            document.getElementById(modalOpener.dataset.modalOpen).hidden = false;
+            return;
+        }
+
+        const modalCloser = event.target.closest("[data-modal-close]");
+        if (modalCloser) {
+            document.getElementById(modalCloser.dataset.modalClose).hidden = true;
+            return;
+        }
+
+        const resetButton = event.target.closest("#reset_password_button");
+        if (resetButton) {
+            const email = document.getElementById("reset_email").value.trim();
+            if (!email) {
+                alert("Please add email address to reset password");
+                return;
+            }
+            fetch(resetButton.dataset.resetUrl, {
+                method: "POST",
+                headers: {
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "X-CSRF-TOKEN": document.querySelector("meta[name='csrf-token']").content,
+                },
+                body: new URLSearchParams({ email }),
+            })
+                .then((response) => response.json())
+                .then((result) => alert(result.message));
+            return;
+        }
+
+        if (!event.target.closest(".dropdown-menu")) {
+            closeMenus(null);
+        }
+    });
+
+    document.addEventListener("input", (event) => {
+        if (!event.target.matches(".country-select [role='combobox']")) {
+            return;
+        }
+        const query = normalize(event.target.value);
+        event.target.closest(".dropdown-menu").querySelectorAll("[role='option']").forEach((option) => {
+            option.hidden = !normalize(option.textContent).includes(query);
+        });
+    });
+
+    document.addEventListener("change", (event) => {
+        if (event.target.matches(".country-select select")) {
+            refreshCountryLabel(event.target);
+        }
+    });
+
+    document.addEventListener("submit", (event) => {
+        const button = event.target.querySelector("[data-loading-text]");
+        if (button) {
+            button.textContent = button.dataset.loadingText;
+        }
+    });
+})();
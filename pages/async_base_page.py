@@ -0,0 +1,41 @@
+import allure
+import logging
+from playwright.async_api import Dialog
+
+from helpers.locator_registry import component
+from helpers.async_support import async_mirror
+from helpers.web_vitals import WebVitalsRecorder
+from pages.base_page import BasePage
+
+from components.async_navbar_component import AsyncNavbarComponent
+from components.async_footer_component import AsyncFooterComponent
+from components.async_mobile_app_component import AsyncMobileAppComponent
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncBasePage(BasePage):
+
+    navbar = component(AsyncNavbarComponent)
+    mobile_app = component(AsyncMobileAppComponent)
+    footer = component(AsyncFooterComponent)
+
+    async def handle_browser_dialog(self, dialog: Dialog, dialog_result: dict[str, str]) -> None:
+        logger.info(f"[EVENT] Browser dialog detected with message: '{dialog.message}'.")
+        
+        dialog_result["message"] = dialog.message
+
+        allure.attach(
+            f"Alert dialog content: {dialog.message}",
+            name="Log_Output_DialogContent",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+        logger.info(f"[ACTION] Accepting browser dialog: '{dialog.message}'...")
+        await dialog.accept()
+        logger.info("[SUCCESS] Browser dialog accepted.")
+
+    async def record_web_vitals(self) -> None:
+        recorder = WebVitalsRecorder.for_page(self.page)
+        if recorder:
+            await recorder.capture_async(type(self).__name__, self.PERF_BUDGET)
\ No newline at end of file
@@ -0,0 +1,20 @@
+import logging
+
+from helpers.locator_registry import component
+from helpers.async_support import async_mirror
+from pages.async_base_page import AsyncBasePage
+from pages.customer_login_page import CustomerLoginPage
+from components.async_login_form_component import AsyncLoginFormComponent
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncCustomerLoginPage(AsyncBasePage, CustomerLoginPage):
+
+    login_form = component(AsyncLoginFormComponent)
+
+    async def navigate(self) -> None:
+        logger.info(f"[ACTION] Navigating to URL: '{self.url}'...")
+        await self.page.goto(self.url)
+        logger.info(f"[SUCCESS] Navigation to URL: '{self.url}' completed.")
+        await self.record_web_vitals()
\ No newline at end of file
@@ -0,0 +1,101 @@
+import logging
+
+from helpers.common_helper import mask_text
+from helpers.country_index import READ_OPTIONS_SCRIPT, CountryIndex
+from helpers.async_support import async_mirror
+from helpers.form_filler import AsyncFormFiller
+from models.data_models import CustomerSignupData
+from pages.async_base_page import AsyncBasePage
+from pages.customer_signup_page import CustomerSignupPage
+
+logger = logging.getLogger(__name__)
+
+@async_mirror
+class AsyncCustomerSignupPage(AsyncBasePage, CustomerSignupPage):
+
+    async def navigate(self) -> None:
+        logger.info(f"[ACTION] Navigating to URL: '{self.url}'...")
+        await self.page.goto(self.url)
+        logger.info(f"[SUCCESS] Navigation to URL: '{self.url}' completed.")
+        await self.record_web_vitals()
+
+    async def enter_first_name(self, first_name: str) -> None:
+        logger.info(f"[INPUT] Entering first name: '{first_name}'...")
+        await self.first_name_input.fill(first_name)
+        logger.info("[SUCCESS] First name entered.")
+
+    async def enter_last_name(self, last_name: str) -> None:
+        logger.info(f"[INPUT] Entering last name: '{last_name}'...")
+        await self.last_name_input.fill(last_name)
+        logger.info("[SUCCESS] Last name entered.")
+
+    async def select_country(self, country_name: str) -> None:
+        logger.info(f"[INPUT] Selecting country: '{country_name}'...")
+        country_index = await self._country_index()
+        if country_index:
+            option = country_index.resolve(country_name)
+            await self.country_select.select_option(value=option.value, force=True)
+            logger.info(f"[SUCCESS] Country '{option.label}' ({option.value}) selected.")
+            return
+
+        await self.country_dropdown.click()
+        await self.country_search_input.fill(country_name)
+        await self.page.get_by_role("option", name=country_name).first.click()
+        logger.info(f"[SUCCESS] Country '{country_name}' selected.")
+
+    async def _country_index(self) -> CountryIndex | None:
+        country_index = CountryIndex.cached(self.base_url)
+        if country_index is None:
+            options = await self.country_select.locator("option").evaluate_all(READ_OPTIONS_SCRIPT)
+            if not options:
+                logger.debug("[DEBUG] No country <select> options found, selecting through the search dropdown")
+                return None
+            country_index = CountryIndex.store(self.base_url, options)
+        return country_index
+
+    async def enter_phone(self, phone: str) -> None:
+        logger.info(f"[INPUT] Entering phone number: '{phone}'...")
+        await self.phone_input.fill(phone)
+        logger.info("[SUCCESS] Phone number entered.")
+
+    async def enter_email(self, email: str) -> None:
+        logger.info(f"[INPUT] Entering email address: '{email}'...")
+        await self.email_input.fill(email)
+        logger.info("[SUCCESS] Email address entered.")
+
+    async def enter_password(self, password: str) -> None:
+        logger.info(f"[INPUT] Entering password: '{mask_text(password)}'...")
+        logger.debug(f"[DEBUG-DATA] Entering password: {password}...")
+        await self.password_input.fill(password)
+        logger.info("[SUCCESS] Password entered.")
+
+    async def click_signup_button(self) -> None:
+        logger.info("[ACTION] Clicking 'Signup' button...")
+        await self.signup_button.click()
+        logger.info("[SUCCESS] 'Signup' button clicked.")
+
+    async def click_captcha_checkbox(self) -> None:
+        logger.info("[ACTION] Clicking captcha checkbox...")
+        await self.captcha_checkbox.click()
+        logger.info("[SUCCESS] Captcha checkbox clicked.")
+
+    async def wait_for_solve_captcha(self, timeout: int | None = None) -> None:
+        logger.info(f"[EVENT] Waiting for captcha to be solved ({self.captcha_strategy.name} strategy)...")
+        await self.captcha_strategy.wait_until_solved_async(self.captcha_frame.content_frame, timeout)
+        logger.info("[SUCCESS] Captcha solved.")
+
+    async def solve_captcha(self) -> None:
+        logger.info(f"[ACTION] Solving captcha with '{self.captcha_strategy.name}' strategy...")
+        await self.captcha_strategy.solve_async(self.captcha_frame.content_frame)
+        logger.info("[SUCCESS] Captcha solved.")
+
+    async def register_account(self, user_data: CustomerSignupData) -> None:
+        logger.info(f"[ACTION] Registering account for email: '{user_data.email}'...")
+
+        await AsyncFormFiller(self, self.SIGNUP_FORM).fill(user_data)
+
+        await self.solve_captcha()
+
+        await self.click_signup_button()
+
+        logger.info("[SUCCESS] Registration sequence completed.")
\ No newline at end of file
@@ -0,0 +1,7 @@
+from helpers.async_support import async_mirror
+from pages.async_base_page import AsyncBasePage
+from pages.signup_success_page import SignupSuccessPage
+
+@async_mirror
+class AsyncSignupSuccessPage(AsyncBasePage, SignupSuccessPage):
+    pass
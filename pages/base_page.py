@@ -2,20 +2,33 @@ import allure
 import logging
 from playwright.sync_api import Page, Dialog
 
+from helpers.network_policy import ALLOW_ALL
+from helpers.web_vitals import PerfBudget, WebVitalsRecorder
+from helpers.locator_registry import component
+
 from components.navbar_component import NavbarComponent
 from components.footer_component import FooterComponent
 from components.mobile_app_component import MobileAppComponent
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://www.phptravels.net"
+
 class BasePage:
-    
-    def __init__(self, page: Page) -> None:
-        self.page = page
 
-        self.navbar = NavbarComponent(self.page)
-        self.mobile_app = MobileAppComponent(self.page)
-        self.footer = FooterComponent(self.page)
+    PATH = "/"
+    NETWORK_POLICY = ALLOW_ALL
+    PERF_BUDGET: PerfBudget | None = None
+
+    navbar = component(NavbarComponent)
+    mobile_app = component(MobileAppComponent)
+    footer = component(FooterComponent)
+
+    def __init__(self, page: Page, base_url: str = DEFAULT_BASE_URL) -> None:
+        self.page = page
+        self.base_url = base_url.rstrip("/")
+        self.url = f"{self.base_url}{self.PATH}"
+        self._locators: dict[str, object] = {}
 
     def handle_browser_dialog(self, dialog: Dialog, dialog_result: dict[str, str]) -> None:
         logger.info(f"[EVENT] Browser dialog detected with message: '{dialog.message}'.")
@@ -30,4 +43,9 @@ class BasePage:
 
         logger.info(f"[ACTION] Accepting browser dialog: '{dialog.message}'...")
         dialog.accept()
-        logger.info("[SUCCESS] Browser dialog accepted.")
\ No newline at end of file
+        logger.info("[SUCCESS] Browser dialog accepted.")
+
+    def record_web_vitals(self) -> None:
+        recorder = WebVitalsRecorder.for_page(self.page)
+        if recorder:
+            recorder.capture(type(self).__name__, self.PERF_BUDGET)
\ No newline at end of file
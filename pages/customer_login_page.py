@@ -1,20 +1,23 @@
 import logging
-from playwright.sync_api import Page
 
 from pages.base_page import BasePage
+from helpers.network_policy import NO_MEDIA
+from helpers.web_vitals import GOOD_WEB_VITALS
+from helpers.locator_registry import component
 from components.login_form_component import LoginFormComponent
 
 logger = logging.getLogger(__name__)
 
 class CustomerLoginPage(BasePage):
 
-    URL = "https://www.phptravels.net/login"
+    PATH = "/login"
+    NETWORK_POLICY = NO_MEDIA
+    PERF_BUDGET = GOOD_WEB_VITALS
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
-        self.login_form = LoginFormComponent(self.page)
+    login_form = component(LoginFormComponent)
 
     def navigate(self) -> None:
-        logger.info(f"[ACTION] Navigating to URL: '{self.URL}'...")
-        self.page.goto(self.URL)
-        logger.info(f"[SUCCESS] Navigation to URL: '{self.URL}' completed.")
\ No newline at end of file
+        logger.info(f"[ACTION] Navigating to URL: '{self.url}'...")
+        self.page.goto(self.url)
+        logger.info(f"[SUCCESS] Navigation to URL: '{self.url}' completed.")
+        self.record_web_vitals()
\ No newline at end of file
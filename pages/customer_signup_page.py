@@ -1,38 +1,62 @@
 import logging
 from playwright.sync_api import Page
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from helpers.captcha import CaptchaStrategy, ManualCaptcha
+from helpers.form_filler import FormField, FormFiller, FormSpec
 from helpers.common_helper import mask_text
+from helpers.country_index import READ_OPTIONS_SCRIPT, CountryIndex
+from helpers.network_policy import NO_MEDIA
+from helpers.web_vitals import GOOD_WEB_VITALS
+from helpers.locator_registry import on_page, within
 from models.data_models import CustomerSignupData
 
 logger = logging.getLogger(__name__)
 
 class CustomerSignupPage(BasePage):
 
-    URL = "https://www.phptravels.net/signup"
-
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        self.first_name_input = self.page.get_by_role("textbox", name="First Name")
-        self.last_name_input = self.page.get_by_role("textbox", name="Last Name")
-        self.country_dropdown = self.page.locator("button[data-bs-toggle='dropdown']")
-        self.country_search_input = self.page.get_by_role("combobox", name="Search")
-        self.phone_input = self.page.get_by_role("spinbutton", name="Phone")
-        self.email_input = self.page.get_by_role("textbox", name="Email Address")
-        self.password_input = self.page.get_by_role("textbox", name="Password")
-        
-        self.captcha_frame = self.page.locator("iframe[title=\"Widget containing checkbox for hCaptcha security challenge\"]")
-        self.captcha_frame_selector = "iframe[title=\"Widget containing checkbox for hCaptcha security challenge\"]"
-        self.captcha_checkbox = self.captcha_frame.content_frame.locator("#checkbox")
-        
-        self.signup_button = self.page.get_by_role("button", name="Signup", exact=True)
-        self.loading_spinner = self.page.get_by_role("button", name="Creating account...")
+    PATH = "/signup"
+    NETWORK_POLICY = NO_MEDIA
+    PERF_BUDGET = GOOD_WEB_VITALS
+
+    first_name_input = on_page.get_by_role("textbox", name="First Name")
+    last_name_input = on_page.get_by_role("textbox", name="Last Name")
+    country_select = on_page.locator("select#country")
+    country_dropdown = on_page.locator("button[data-bs-toggle='dropdown']")
+    country_search_input = on_page.get_by_role("combobox", name="Search")
+    phone_input = on_page.get_by_role("spinbutton", name="Phone")
+    email_input = on_page.get_by_role("textbox", name="Email Address")
+    password_input = on_page.get_by_role("textbox", name="Password")
+
+    captcha_frame_selector = "iframe[title=\"Widget containing checkbox for hCaptcha security challenge\"]"
+    captcha_frame = on_page.locator(captcha_frame_selector)
+    captcha_checkbox = within("captcha_frame").content_frame.locator("#checkbox")
+
+    signup_button = on_page.get_by_role("button", name="Signup", exact=True)
+    loading_spinner = on_page.get_by_role("button", name="Creating account...")
+
+    SIGNUP_FORM = FormSpec(
+        name="signup form",
+        root="body",
+        fields={
+            "first_name": FormField("#first_name", "enter_first_name"),
+            "last_name": FormField("#last_name", "enter_last_name"),
+            "country": FormField("select#country", "select_country"),
+            "phone": FormField("#phone", "enter_phone"),
+            "email": FormField("#user_email", "enter_email"),
+            "password": FormField("#password", "enter_password"),
+        }
+    )
+
+    def __init__(self, page: Page, base_url: str = DEFAULT_BASE_URL, captcha_strategy: CaptchaStrategy | None = None):
+        super().__init__(page, base_url)
+        self.captcha_strategy = captcha_strategy or ManualCaptcha()
 
     def navigate(self) -> None:
-        logger.info(f"[ACTION] Navigating to URL: '{self.URL}'...")
-        self.page.goto(self.URL)
-        logger.info(f"[SUCCESS] Navigation to URL: '{self.URL}' completed.")
+        logger.info(f"[ACTION] Navigating to URL: '{self.url}'...")
+        self.page.goto(self.url)
+        logger.info(f"[SUCCESS] Navigation to URL: '{self.url}' completed.")
+        self.record_web_vitals()
 
     def enter_first_name(self, first_name: str) -> None:
         logger.info(f"[INPUT] Entering first name: '{first_name}'...")
@@ -46,11 +70,28 @@ class CustomerSignupPage(BasePage):
 
     def select_country(self, country_name: str) -> None:
         logger.info(f"[INPUT] Selecting country: '{country_name}'...")
+        country_index = self._country_index()
+        if country_index:
+            option = country_index.resolve(country_name)
+            self.country_select.select_option(value=option.value, force=True)
+            logger.info(f"[SUCCESS] Country '{option.label}' ({option.value}) selected.")
+            return
+
         self.country_dropdown.click()
         self.country_search_input.fill(country_name)
         self.page.get_by_role("option", name=country_name).first.click()
         logger.info(f"[SUCCESS] Country '{country_name}' selected.")
 
+    def _country_index(self) -> CountryIndex | None:
+        country_index = CountryIndex.cached(self.base_url)
+        if country_index is None:
+            options = self.country_select.locator("option").evaluate_all(READ_OPTIONS_SCRIPT)
+            if not options:
+                logger.debug("[DEBUG] No country <select> options found, selecting through the search dropdown")
+                return None
+            country_index = CountryIndex.store(self.base_url, options)
+        return country_index
+
     def enter_phone(self, phone: str) -> None:
         logger.info(f"[INPUT] Entering phone number: '{phone}'...")
         self.phone_input.fill(phone)
@@ -77,26 +118,22 @@ class CustomerSignupPage(BasePage):
         self.captcha_checkbox.click()
         logger.info("[SUCCESS] Captcha checkbox clicked.")
 
-    def wait_for_solve_captcha(self, timeout: int = 30000) -> None:
-        logger.info("[EVENT] Waiting for captcha to be solved...")
-        self.captcha_frame.content_frame.locator("#checkbox[aria-checked='true']").wait_for(
-            state="attached", 
-            timeout=timeout
-        )
+    def wait_for_solve_captcha(self, timeout: int | None = None) -> None:
+        logger.info(f"[EVENT] Waiting for captcha to be solved ({self.captcha_strategy.name} strategy)...")
+        self.captcha_strategy.wait_until_solved(self.captcha_frame.content_frame, timeout)
+        logger.info("[SUCCESS] Captcha solved.")
+
+    def solve_captcha(self) -> None:
+        logger.info(f"[ACTION] Solving captcha with '{self.captcha_strategy.name}' strategy...")
+        self.captcha_strategy.solve(self.captcha_frame.content_frame)
         logger.info("[SUCCESS] Captcha solved.")
 
     def register_account(self, user_data: CustomerSignupData) -> None:
         logger.info(f"[ACTION] Registering account for email: '{user_data.email}'...")
 
-        self.enter_first_name(user_data.first_name)
-        self.enter_last_name(user_data.last_name)
-        self.select_country(user_data.country)
-        self.enter_phone(user_data.phone)
-        self.enter_email(user_data.email)
-        self.enter_password(user_data.password)
+        FormFiller(self, self.SIGNUP_FORM).fill(user_data)
 
-        self.click_captcha_checkbox()
-        self.wait_for_solve_captcha()
+        self.solve_captcha()
 
         self.click_signup_button()
 
@@ -1,16 +1,17 @@
 import logging
-from playwright.sync_api import Page
 
 from pages.base_page import BasePage
+from helpers.network_policy import NO_MEDIA
+from helpers.web_vitals import GOOD_WEB_VITALS
+from helpers.locator_registry import on_page
 
 logger = logging.getLogger(__name__)
 
 class SignupSuccessPage(BasePage):
 
-    URL = "https://www.phptravels.net/signup_success"
+    PATH = "/signup_success"
+    NETWORK_POLICY = NO_MEDIA
+    PERF_BUDGET = GOOD_WEB_VITALS
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        self.activate_account_mgs = ["Your account has been created", "Please check your mailbox for activation"]
-        self.notification_card = self.page.locator("div").filter(has_text="Your account has been created").nth(2)
+    activate_account_mgs = ("Your account has been created", "Please check your mailbox for activation")
+    notification_card = on_page.locator("div").filter(has_text="Your account has been created").nth(2)
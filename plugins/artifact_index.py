@@ -0,0 +1,12 @@
+import pytest
+import logging
+from pathlib import Path
+
+from helpers.artifact_index import ARTIFACT_INDEX_PLUGIN, ArtifactIndex
+
+logger = logging.getLogger(__name__)
+
+def pytest_configure(config: pytest.Config) -> None:
+    output_dir = Path(config.getoption("--output") or "test-results").absolute()
+    config.pluginmanager.register(ArtifactIndex(output_dir), ARTIFACT_INDEX_PLUGIN)
+    logger.debug(f"[CONFIG] Artifact index registered for: {output_dir}")
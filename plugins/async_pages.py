@@ -0,0 +1,102 @@
+import pytest
+import logging
+from typing import Any, Generator, TypeVar
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Error
+
+from helpers.allure_compat import rebind_thread_context
+from helpers.captcha import CaptchaStrategy
+from helpers.async_support import AsyncRunner
+from pages.async_base_page import AsyncBasePage
+from pages.async_customer_signup_page import AsyncCustomerSignupPage
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P", bound=AsyncBasePage)
+
+
+class AsyncPageFactory:
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: dict[str, Any],
+        base_url: str,
+        captcha_strategy: CaptchaStrategy
+    ) -> None:
+        self.browser = browser
+        self.context_args = context_args
+        self.base_url = base_url
+        self.captcha_strategy = captcha_strategy
+        self._contexts: list[BrowserContext] = []
+
+    async def new_page(self, page_class: type[P]) -> P:
+        context = await self.browser.new_context(**self.context_args)
+        self._contexts.append(context)
+        page = await context.new_page()
+
+        if issubclass(page_class, AsyncCustomerSignupPage):
+            await self.captcha_strategy.prepare_async(page)
+            return page_class(page, self.base_url, self.captcha_strategy)
+        return page_class(page, self.base_url)
+
+    async def close(self) -> None:
+        contexts, self._contexts = self._contexts, []
+        for context in contexts:
+            try:
+                await context.close()
+            except Error as e:
+                logger.debug(f"[DEBUG] Ignoring error while closing async context: {e}")
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+
+async def _start_browser(
+    browser_name: str,
+    launch_args: dict[str, Any],
+    connect_options: dict[str, Any] | None
+) -> tuple[Playwright, Browser]:
+    playwright = await async_playwright().start()
+    browser_type = getattr(playwright, browser_name)
+    if connect_options:
+        browser = await browser_type.connect(**connect_options)
+    else:
+        browser = await browser_type.launch(**launch_args)
+    return playwright, browser
+
+async def _stop_browser(playwright: Playwright, browser: Browser) -> None:
+    await browser.close()
+    await playwright.stop()
+
+@pytest.fixture(scope="session")
+def async_runner() -> Generator[AsyncRunner, None, None]:
+    runner = AsyncRunner().start()
+    yield runner
+    runner.stop()
+
+@pytest.fixture(scope="session")
+def async_browser(
+    async_runner: AsyncRunner,
+    browser_name: str,
+    browser_type_launch_args: dict,
+    connect_options: dict | None
+) -> Generator[Browser, None, None]:
+    logger.info(f"[CONFIG] {'Connecting' if connect_options else 'Launching'} async '{browser_name}' browser on the shared event loop...")
+    playwright, browser = async_runner.run(_start_browser(browser_name, browser_type_launch_args, connect_options))
+    yield browser
+    async_runner.run(_stop_browser(playwright, browser))
+
+@pytest.fixture()
+def async_page_factory(
+    async_runner: AsyncRunner,
+    async_browser: Browser,
+    browser_context_args: dict,
+    base_url: str,
+    captcha_strategy: CaptchaStrategy
+) -> Generator[AsyncPageFactory, None, None]:
+    rebind_thread_context(async_runner.thread)
+    context_args = {key: value for key, value in browser_context_args.items() if key != "record_video_dir"}
+    factory = AsyncPageFactory(async_browser, context_args, base_url, captcha_strategy)
+    yield factory
+    logger.debug(f"[DEBUG] Closing {len(factory)} async context(s)")
+    async_runner.run(factory.close())
@@ -0,0 +1,20 @@
+import pytest
+import logging
+from pathlib import Path
+
+from helpers.attachment_store import LinkedAttachmentStore, attachment_store_key
+
+logger = logging.getLogger(__name__)
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    config.stash[attachment_store_key] = LinkedAttachmentStore(
+        Path(report_dir).absolute() if report_dir else Path(),
+        listener=config.pluginmanager.getplugin("allure_listener") if report_dir else None
+    )
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    store = session.config.stash.get(attachment_store_key, None)
+    if store and store.stats:
+        logger.debug(f"[CONFIG] Allure file attachments: {dict(store.stats)}")
@@ -0,0 +1,59 @@
+import pytest
+import logging
+from pathlib import Path
+from typing import Any
+from _pytest.nodes import Item
+
+from helpers.browser_server import BROWSER_SERVER_DIR, CLIENT_ONLY_OPTIONS, BrowserServer, BrowserServerError
+
+logger = logging.getLogger(__name__)
+
+browser_server_key = pytest.StashKey[BrowserServer]()
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=None,
+        help="Connect to a persistent local browser server (started on first use) instead of launching a browser (default: browser_server ini)."
+    )
+    parser.addini("browser_server", help="Reuse a persistent local browser server across pytest runs.", type="bool", default=False)
+    parser.addini("browser_server_idle_timeout", help="Seconds without a test after which the browser server shuts down.", default="900")
+
+def browser_server_enabled(config: pytest.Config) -> bool:
+    return bool(config.getoption("browser_server") or config.getini("browser_server"))
+
+@pytest.fixture(scope="session")
+def connect_options(pytestconfig: pytest.Config, browser_name: str, browser_type_launch_args: dict) -> dict[str, Any] | None:
+    if not browser_server_enabled(pytestconfig):
+        return None
+
+    server = BrowserServer(
+        Path(pytestconfig.rootpath, BROWSER_SERVER_DIR),
+        browser_name,
+        browser_type_launch_args,
+        idle_timeout=float(pytestconfig.getini("browser_server_idle_timeout"))
+    )
+    try:
+        state = server.ensure()
+    except BrowserServerError as e:
+        logger.warning(f"[WARNING] Browser server unavailable, launching the browser locally instead: {e}")
+        return None
+
+    pytestconfig.stash[browser_server_key] = server
+    logger.info(f"[CONFIG] Connecting to browser server '{server.key}' at {state.ws_endpoint}")
+    # Launch-only options such as headless are fixed by the server; client-side ones still apply per connection
+    return {
+        "ws_endpoint": state.ws_endpoint,
+        **{name: value for name, value in browser_type_launch_args.items() if name in CLIENT_ONLY_OPTIONS}
+    }
+
+def pytest_runtest_setup(item: Item) -> None:
+    server = item.config.stash.get(browser_server_key, None)
+    if server:
+        server.touch()
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    server = session.config.stash.get(browser_server_key, None)
+    if server:
+        server.touch()
@@ -0,0 +1,33 @@
+import pytest
+import logging
+
+from plugins.local_app import local_app_key
+from helpers.captcha import CAPTCHA_STRATEGIES, CaptchaStrategy
+
+logger = logging.getLogger(__name__)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--captcha-strategy",
+        choices=["auto", *CAPTCHA_STRATEGIES],
+        default=None,
+        help="How the signup captcha is solved (default: captcha_strategy ini)."
+    )
+    parser.addini(
+        "captcha_strategy",
+        help="Signup captcha strategy: auto (stub on the local stand-in, manual elsewhere), manual, test_key or stub.",
+        default="auto"
+    )
+
+@pytest.fixture(scope="session")
+def captcha_strategy(pytestconfig: pytest.Config, base_url: str) -> CaptchaStrategy:
+    name = pytestconfig.getoption("captcha_strategy") or pytestconfig.getini("captcha_strategy")
+
+    if name == "auto":
+        local_app = pytestconfig.stash.get(local_app_key, None)
+        name = "stub" if local_app and local_app.url == base_url else "manual"
+    if name not in CAPTCHA_STRATEGIES:
+        raise pytest.UsageError(f"Unknown captcha strategy '{name}'. Available: auto, {', '.join(CAPTCHA_STRATEGIES)}")
+
+    logger.info(f"[CONFIG] Signup captcha strategy: '{name}'")
+    return CAPTCHA_STRATEGIES[name]()
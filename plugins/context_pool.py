@@ -0,0 +1,228 @@
+import pytest
+import logging
+from pathlib import Path
+from typing import Any, Generator
+from dataclasses import dataclass, field
+from slugify import slugify
+from playwright.sync_api import Browser, BrowserContext, Page, Error
+
+from helpers.flaky import flaky_attempt_key
+from helpers.artifact_index import get_artifact_index
+
+logger = logging.getLogger(__name__)
+
+RESET_PATH = "/__context_pool_reset__"
+RESET_PAGE_HTML = "<!DOCTYPE html><title>reset</title>"
+
+@dataclass
+class PooledContext:
+    context: BrowserContext
+    page: Page | None = None
+    pooled: bool = True
+    recorded: bool = False
+    pages: list[Page] = field(default_factory=list)
+
+    def track_page(self, page: Page) -> None:
+        self.pages.append(page)
+
+
+class ContextPool:
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: dict[str, Any],
+        capture_trace: bool,
+        warm_size: int = 1,
+        recording_dir: str | None = None
+    ) -> None:
+        self.browser = browser
+        self.context_args = context_args
+        self.capture_trace = capture_trace
+        self.warm_size = warm_size
+        self.recording_dir = recording_dir
+        self._idle: list[PooledContext] = []
+        self._leased: list[PooledContext] = []
+
+    def warm_up(self) -> None:
+        while len(self._idle) < self.warm_size:
+            self._idle.append(self._create())
+        logger.debug(f"[CONFIG] Context pool warmed up with {len(self._idle)} context(s)")
+
+    def acquire(self, extra_context_args: dict[str, Any] | None = None, record: bool = False) -> PooledContext:
+        if record:
+            logger.debug("[CONFIG] Creating dedicated context with trace and video recording")
+            lease = self._create({**(extra_context_args or {}), "record_video_dir": self.recording_dir}, pooled=False, capture_trace=True)
+            lease.recorded = True
+        elif extra_context_args:
+            logger.debug(f"[CONFIG] Creating dedicated context with args: {extra_context_args}")
+            lease = self._create(extra_context_args, pooled=False)
+        elif self._idle:
+            lease = self._idle.pop()
+        else:
+            lease = self._create()
+
+        # Opened on acquire so the page's video starts with the test, not when the previous test released the context
+        lease.page = lease.context.new_page()
+        lease.pages = [lease.page]
+        lease.context.on("page", lease.track_page)
+        self._leased.append(lease)
+        return lease
+
+    def release(self, lease: PooledContext) -> None:
+        self._leased.remove(lease)
+        lease.context.remove_listener("page", lease.track_page)
+
+        if not lease.pooled:
+            self._close(lease)
+            return
+
+        try:
+            self._reset(lease)
+        except Error as e:
+            logger.warning(f"[WARNING] Could not reset pooled context, recreating it: {e}")
+            self._close(lease)
+            lease = self._create()
+
+        self._idle.append(lease)
+
+    def close(self) -> None:
+        for lease in self._idle + self._leased:
+            self._close(lease)
+        self._idle.clear()
+        self._leased.clear()
+
+    def _create(
+        self,
+        extra_context_args: dict[str, Any] | None = None,
+        pooled: bool = True,
+        capture_trace: bool | None = None
+    ) -> PooledContext:
+        context = self.browser.new_context(**{**self.context_args, **(extra_context_args or {})})
+        if self.capture_trace if capture_trace is None else capture_trace:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        return PooledContext(context=context, pooled=pooled)
+
+    def _reset(self, lease: PooledContext) -> None:
+        context = lease.context
+        for page in context.pages:
+            page.close()
+
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+
+        origins = [origin["origin"] for origin in context.storage_state()["origins"]]
+        if origins:
+            self._clear_origin_storage(context, origins)
+
+        lease.page = None
+
+    def _clear_origin_storage(self, context: BrowserContext, origins: list[str]) -> None:
+        page = context.new_page()
+        page.route(f"**{RESET_PATH}", lambda route: route.fulfill(body=RESET_PAGE_HTML, content_type="text/html"))
+        for origin in origins:
+            page.goto(f"{origin}{RESET_PATH}")
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        page.close()
+        if page.video:
+            page.video.delete()
+
+    def _close(self, lease: PooledContext) -> None:
+        try:
+            lease.context.close()
+        except Error as e:
+            logger.debug(f"[DEBUG] Ignoring error while closing context: {e}")
+
+
+def _finish_lease(lease: PooledContext, pytestconfig: pytest.Config, output_path: str, failed: bool) -> list[Path]:
+    artifacts: list[Path] = []
+
+    tracing_option = pytestconfig.getoption("--tracing")
+    if lease.recorded or tracing_option in ["on", "retain-on-failure"]:
+        if lease.recorded or tracing_option == "on" or failed:
+            trace_path = Path(output_path) / "trace.zip"
+            lease.context.tracing.stop_chunk(path=trace_path)
+            artifacts.append(trace_path)
+        else:
+            lease.context.tracing.stop_chunk()
+
+    for page in lease.context.pages:
+        page.close()
+
+    video_option = pytestconfig.getoption("--video")
+    if not lease.recorded and video_option not in ["on", "retain-on-failure"]:
+        return artifacts
+
+    preserve_video = lease.recorded or video_option == "on" or failed
+    for index, page in enumerate(lease.pages):
+        try:
+            if not page.video:
+                continue
+            if preserve_video:
+                video_path = Path(output_path) / ("video.webm" if len(lease.pages) == 1 else f"video-{index + 1}.webm")
+                page.video.save_as(video_path)
+                artifacts.append(video_path)
+            else:
+                page.video.delete()
+        except Error:
+            pass
+
+    return artifacts
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addini(
+        "context_pool_size",
+        help="Number of pre-warmed browser contexts kept per worker.",
+        default="1"
+    )
+
+@pytest.fixture(scope="session")
+def context_pool(
+    browser: Browser,
+    browser_context_args: dict,
+    pytestconfig: pytest.Config,
+    tmp_path_factory: pytest.TempPathFactory
+) -> Generator[ContextPool, None, None]:
+    pool = ContextPool(
+        browser,
+        browser_context_args,
+        capture_trace=pytestconfig.getoption("--tracing") in ["on", "retain-on-failure"],
+        warm_size=int(pytestconfig.getini("context_pool_size")),
+        recording_dir=browser_context_args.get("record_video_dir") or str(tmp_path_factory.mktemp("recordings"))
+    )
+    pool.warm_up()
+    yield pool
+    pool.close()
+
+@pytest.fixture()
+def context_lease(
+    context_pool: ContextPool,
+    request: pytest.FixtureRequest,
+    pytestconfig: pytest.Config,
+    output_path: str
+) -> Generator[PooledContext, None, None]:
+    context_args_marker = request.node.get_closest_marker("browser_context_args")
+    attempt = request.node.stash.get(flaky_attempt_key, 1)
+    lease = context_pool.acquire(context_args_marker.kwargs if context_args_marker else None, record=attempt > 1)
+    artifacts_path = str(Path(output_path) / f"retry-{attempt - 1}") if lease.recorded else output_path
+
+    if context_pool.capture_trace or lease.recorded:
+        lease.context.tracing.start_chunk(title=slugify(request.node.nodeid))
+
+    yield lease
+
+    failed = request.node.rep_call.failed if hasattr(request.node, "rep_call") else True
+    artifact_index = get_artifact_index(pytestconfig)
+    artifact_index.register_folder(request.node.nodeid, output_path)
+    for artifact in _finish_lease(lease, pytestconfig, artifacts_path, failed):
+        artifact_index.record(request.node.nodeid, artifact)
+    context_pool.release(lease)
+
+@pytest.fixture()
+def context(context_lease: PooledContext) -> BrowserContext:
+    return context_lease.context
+
+@pytest.fixture()
+def page(context_lease: PooledContext) -> Page:
+    return context_lease.page
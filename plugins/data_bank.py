@@ -0,0 +1,34 @@
+import pytest
+import logging
+from typing import Generator
+
+from helpers.identity import IdentityAllocator
+from helpers.data_helper import DEFAULT_BANK_DIR, DEFAULT_SEED, DataHelper
+
+logger = logging.getLogger(__name__)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addini(
+        "data_bank_seed",
+        help="Seed of the pre-generated test data bank (same seed = same data on every worker and run).",
+        default=str(DEFAULT_SEED)
+    )
+    parser.addini(
+        "data_bank_size",
+        help="Records generated per locale group and character class.",
+        default="256"
+    )
+
+@pytest.fixture(scope="session")
+def data_helper(pytestconfig: pytest.Config, identity: IdentityAllocator) -> Generator[DataHelper, None, None]:
+    cache = getattr(pytestconfig, "cache", None)
+    bank_dir = cache.mkdir("data_bank") if cache else DEFAULT_BANK_DIR
+    helper = DataHelper(
+        seed=int(pytestconfig.getini("data_bank_seed")),
+        bank_dir=bank_dir,
+        bank_size=int(pytestconfig.getini("data_bank_size")),
+        identities=identity
+    )
+    logger.debug(f"[CONFIG] Data helper seeded with {helper.seed}, bank directory: {bank_dir}")
+    yield helper
+    helper.close()
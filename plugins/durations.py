@@ -0,0 +1,112 @@
+import json
+import time
+import pytest
+import logging
+from pathlib import Path
+
+from helpers.duration_history import (
+    DurationHistory,
+    duration_history_key,
+    lpt_plan,
+    plan_loads,
+    predicted_loads_key
+)
+
+logger = logging.getLogger(__name__)
+
+DURATION_RECORDER_PLUGIN = "duration_recorder"
+MAIN_WORKER = "main"
+
+
+class DurationRecorder:
+
+    def __init__(self, config: pytest.Config, history: DurationHistory) -> None:
+        self.config = config
+        self.history = history
+        self.worker_loads: dict[str, float] = {}
+        self.started = time.monotonic()
+        self.report: dict | None = None
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        if session.items and self.history.entries and predicted_loads_key not in self.config.stash:
+            estimates = self.history.estimates([item.nodeid for item in session.items])
+            self.config.stash[predicted_loads_key] = plan_loads(lpt_plan(estimates, 1), estimates)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.history.add(report.nodeid, report.duration)
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else MAIN_WORKER
+        self.worker_loads[worker] = self.worker_loads.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if not self.worker_loads:
+            return
+
+        predicted_loads = self.config.stash.get(predicted_loads_key, [])
+        actual_loads = {worker: round(load, 3) for worker, load in sorted(self.worker_loads.items())}
+        current = self.history.current
+        predicted_makespan = max(predicted_loads, default=None)
+        actual_makespan = max(actual_loads.values())
+
+        self.report = {
+            "workers": len(actual_loads),
+            "tests": len(current),
+            "predicted_makespan": predicted_makespan,
+            "actual_makespan": actual_makespan,
+            "makespan_error": round(actual_makespan / predicted_makespan - 1, 4) if predicted_makespan else None,
+            "wall_time": round(time.monotonic() - self.started, 3),
+            "predicted_loads": predicted_loads,
+            "actual_loads": actual_loads,
+            "longest_tests": dict(sorted(((nodeid, round(duration, 3)) for nodeid, duration in current.items()), key=lambda item: -item[1])[:5]),
+            "durations": {nodeid: round(duration, 3) for nodeid, duration in sorted(current.items())},
+        }
+        self.history.save(getattr(self.config, "cache", None))
+        # The medians of the duration history are what scripts/merge_reports.py --durations writes to the shard_durations file
+        self.report["median_durations"] = {nodeid: self.history.predict(nodeid) for nodeid in sorted(current)}
+
+        report_path = Path(self.config.rootpath, self.config.getini("duration_report"))
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(self.report, indent=4), encoding="utf-8")
+        logger.debug(f"[DEBUG] Makespan report written: {report_path}")
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.report:
+            return
+        report = self.report
+        terminalreporter.write_sep("-", "duration scheduling")
+        if report["predicted_makespan"] is None:
+            predicted = "predicted makespan n/a (no history yet)"
+        else:
+            predicted = f"predicted makespan {report['predicted_makespan']:.1f}s ({report['makespan_error']:+.1%})"
+        terminalreporter.write_line(
+            f"{predicted}, actual {report['actual_makespan']:.1f}s, wall time {report['wall_time']:.1f}s on {report['workers']} worker(s)"
+        )
+        loads = ", ".join(f"{worker} {load:.1f}s" for worker, load in report["actual_loads"].items())
+        terminalreporter.write_line(f"worker loads: {loads}")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addini(
+        "duration_scheduling",
+        help="Send the longest tests first (by duration history) when running with pytest-xdist --dist load.",
+        type="bool",
+        default=True
+    )
+    parser.addini("duration_history_size", help="Number of recent durations kept per test.", default="5")
+    parser.addini("duration_report", help="JSON file comparing predicted and actual makespan.", default="reports/durations/makespan.json")
+
+def pytest_configure(config: pytest.Config) -> None:
+    if hasattr(config, "workerinput"):
+        return
+    history = DurationHistory.load(getattr(config, "cache", None), int(config.getini("duration_history_size")))
+    config.stash[duration_history_key] = history
+    config.pluginmanager.register(DurationRecorder(config, history), DURATION_RECORDER_PLUGIN)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    if not config.getini("duration_scheduling") or config.getoption("dist") != "load":
+        return None
+
+    from helpers.lpt_scheduling import DurationScheduling
+    logger.info("[CONFIG] Scheduling tests longest-processing-time-first from the duration history")
+    return DurationScheduling(config, log, config.stash[duration_history_key])
@@ -0,0 +1,170 @@
+import json
+import pytest
+import logging
+from pathlib import Path
+from typing import Generator
+from _pytest.nodes import Item, Node
+from _pytest.runner import runtestprotocol
+
+from helpers.flaky import FlakeHistory, flaky_attempt_key
+from helpers.allure_compat import close_test_result
+
+logger = logging.getLogger(__name__)
+
+FLAKE_RECORDER_PLUGIN = "flake_recorder"
+RERUN_OUTCOME = "rerun"
+
+attempt_failed_key = pytest.StashKey[bool]()
+
+
+class RetryBoundary:
+    # Passed as nextitem so the teardown of a failed attempt stops at the test itself, keeping the browser and higher scoped fixtures alive
+    def __init__(self, item: Item, nextitem: Item | None, retry_allowed: bool) -> None:
+        self.item = item
+        self.nextitem = nextitem
+        self.retry_allowed = retry_allowed
+
+    @property
+    def retrying(self) -> bool:
+        return self.retry_allowed and self.item.stash.get(attempt_failed_key, False) and not self.item.session.shouldstop
+
+    def listchain(self) -> list[Node]:
+        if self.retrying:
+            return self.item.listchain()[:-1]
+        return self.nextitem.listchain() if self.nextitem else []
+
+
+class FlakeRecorder:
+
+    def __init__(self, config: pytest.Config, history: FlakeHistory) -> None:
+        self.config = config
+        self.history = history
+        self.attempts: dict[str, int] = {}
+        self.failed: set[str] = set()
+        self.report: dict | None = None
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if "flaky" not in report.keywords:
+            return
+        if report.when == "teardown":
+            self.attempts[report.nodeid] = self.attempts.get(report.nodeid, 0) + 1
+        if report.failed:
+            self.failed.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if not self.attempts:
+            return
+        for nodeid, attempts in self.attempts.items():
+            self.history.add(nodeid, attempts, passed=nodeid not in self.failed)
+        self.history.save(getattr(self.config, "cache", None))
+
+        quarantine_rate = float(self.config.getini("flaky_quarantine_rate"))
+        min_runs = int(self.config.getini("flaky_quarantine_min_runs"))
+        rates = self.history.rates()
+        self.report = {
+            "this_run": {nodeid: {"attempts": attempts, "passed": nodeid not in self.failed} for nodeid, attempts in sorted(self.attempts.items())},
+            "flake_rates": {nodeid: rate.as_dict() for nodeid, rate in rates.items()},
+            "quarantine_candidates": [
+                nodeid for nodeid, rate in rates.items() if rate.runs >= min_runs and rate.rate >= quarantine_rate
+            ],
+        }
+
+        report_path = Path(self.config.rootpath, self.config.getini("flaky_report"))
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(self.report, indent=4), encoding="utf-8")
+        logger.debug(f"[DEBUG] Flake report written: {report_path}")
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.report:
+            return
+        terminalreporter.write_sep("-", "flaky tests")
+        for nodeid, outcome in self.report["this_run"].items():
+            rate = self.report["flake_rates"][nodeid]
+            result = "passed" if outcome["passed"] else "failed"
+            terminalreporter.write_line(
+                f"{nodeid}: {result} after {outcome['attempts']} attempt(s), "
+                f"flake rate {rate['flake_rate']:.0%} over {rate['runs']} run(s)"
+            )
+        for nodeid in self.report["quarantine_candidates"]:
+            terminalreporter.write_line(f"quarantine candidate: {nodeid}", yellow=True)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--flaky-retries",
+        type=int,
+        default=None,
+        help="Retries of a failed @pytest.mark.flaky test in the same worker (default: flaky_retries ini, 0 disables)."
+    )
+    parser.addini("flaky_retries", help="Retries of a failed @pytest.mark.flaky test on a fresh, recorded context.", default="1")
+    parser.addini("flaky_history_size", help="Number of recent runs kept per flaky test.", default="20")
+    parser.addini("flaky_quarantine_rate", help="Flake rate from which a flaky test is reported as a quarantine candidate.", default="0.3")
+    parser.addini("flaky_quarantine_min_runs", help="Runs needed before a flaky test can be a quarantine candidate.", default="5")
+    parser.addini("flaky_report", help="JSON file with the attempts and flake rates of the flaky tests.", default="reports/flaky/flake-rates.json")
+
+def pytest_configure(config: pytest.Config) -> None:
+    if hasattr(config, "workerinput"):
+        return
+    history = FlakeHistory.load(getattr(config, "cache", None), int(config.getini("flaky_history_size")))
+    config.pluginmanager.register(FlakeRecorder(config, history), FLAKE_RECORDER_PLUGIN)
+
+def retry_budget(item: Item) -> int:
+    marker = item.get_closest_marker("flaky")
+    if marker is None:
+        return 0
+    if "retries" in marker.kwargs:
+        return int(marker.kwargs["retries"])
+    retries = item.config.getoption("flaky_retries")
+    return int(retries if retries is not None else item.config.getini("flaky_retries"))
+
+def _close_allure_attempt(item: Item) -> None:
+    # A new Allure result per attempt: results sharing a historyId are shown as retries of the final one
+    listener = item.config.pluginmanager.getplugin("allure_listener")
+    if listener is not None:
+        close_test_result(listener, item.nodeid)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item: Item, nextitem: Item | None) -> bool | None:
+    retries = retry_budget(item)
+    if retries <= 0:
+        return None
+
+    ihook = item.ihook
+    ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+
+    for attempt in range(1, retries + 2):
+        item.stash[flaky_attempt_key] = attempt
+        item.stash[attempt_failed_key] = False
+        item.__dict__.pop("rep_call", None)
+        boundary = RetryBoundary(item, nextitem, retry_allowed=attempt <= retries)
+        reports = runtestprotocol(item, log=False, nextitem=boundary)
+
+        if not boundary.retrying:
+            for report in reports:
+                ihook.pytest_runtest_logreport(report=report)
+            break
+
+        for report in reports:
+            if report.failed:
+                report.outcome = RERUN_OUTCOME
+            ihook.pytest_runtest_logreport(report=report)
+        _close_allure_attempt(item)
+        logger.warning(
+            f"[WARNING] Flaky test failed on attempt {attempt}/{retries + 1}, "
+            f"retrying on a fresh recorded context: {item.nodeid}"
+        )
+
+    ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item, call: pytest.CallInfo) -> Generator:
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and report.when in ("setup", "call"):
+        item.stash[attempt_failed_key] = True
+
+def pytest_report_teststatus(report: pytest.TestReport, config: pytest.Config):
+    if report.outcome == RERUN_OUTCOME:
+        return RERUN_OUTCOME, "R", ("RERUN", {"yellow": True})
+    return None
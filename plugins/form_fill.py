@@ -0,0 +1,22 @@
+import pytest
+import logging
+
+from helpers.form_filler import FORM_FILL_MODES, FormFiller
+
+logger = logging.getLogger(__name__)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--form-fill",
+        choices=FORM_FILL_MODES,
+        default=None,
+        help="How page objects fill forms: fast (one evaluate per form) or strict (a real fill per field) (default: form_fill ini)."
+    )
+    parser.addini("form_fill", help="Form filling mode: fast or strict.", default="fast")
+
+def pytest_configure(config: pytest.Config) -> None:
+    mode = config.getoption("form_fill") or config.getini("form_fill")
+    if mode not in FORM_FILL_MODES:
+        raise pytest.UsageError(f"Unknown form_fill mode '{mode}'. Available: {', '.join(FORM_FILL_MODES)}")
+    FormFiller.mode = mode
+    logger.debug(f"[CONFIG] Form filling mode: {mode}")
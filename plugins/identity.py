@@ -0,0 +1,27 @@
+import pytest
+import logging
+
+from helpers.identity import IdentityAllocator, new_run_id
+
+logger = logging.getLogger(__name__)
+
+RUN_ID_KEY = "identity_run_id"
+
+identity_allocator_key = pytest.StashKey[IdentityAllocator]()
+
+def pytest_configure(config: pytest.Config) -> None:
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput:
+        allocator = IdentityAllocator(workerinput[RUN_ID_KEY], workerinput["workerid"])
+    else:
+        allocator = IdentityAllocator(new_run_id())
+    config.stash[identity_allocator_key] = allocator
+    logger.debug(f"[CONFIG] Identity allocator ready: run '{allocator.run_id}', worker '{allocator.worker_id}'")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    node.workerinput[RUN_ID_KEY] = node.config.stash[identity_allocator_key].run_id
+
+@pytest.fixture(scope="session")
+def identity(pytestconfig: pytest.Config) -> IdentityAllocator:
+    return pytestconfig.stash[identity_allocator_key]
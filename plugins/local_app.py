@@ -0,0 +1,35 @@
+import pytest
+import logging
+from typing import Generator
+
+from local_app.server import LocalAppServer
+
+logger = logging.getLogger(__name__)
+
+local_app_key = pytest.StashKey[LocalAppServer]()
+
+@pytest.fixture(scope="session")
+def local_app(pytestconfig: pytest.Config) -> Generator[LocalAppServer, None, None]:
+    logger.debug("[CONFIG] Starting local stand-in application for this worker")
+    with LocalAppServer() as server:
+        pytestconfig.stash[local_app_key] = server
+        yield server
+        del pytestconfig.stash[local_app_key]
+
+@pytest.fixture(scope="session")
+def target_namespace(pytestconfig: pytest.Config, base_url: str) -> str:
+    local_app = pytestconfig.stash.get(local_app_key, None)
+    if local_app and local_app.url == base_url:
+        return f"{base_url}#{local_app.instance_id}"
+    return base_url
+
+@pytest.fixture(scope="session")
+def base_url(request: pytest.FixtureRequest, pytestconfig: pytest.Config) -> str:
+    configured_url = pytestconfig.getoption("base_url") or pytestconfig.getini("base_url")
+    if configured_url:
+        logger.info(f"[CONFIG] Running against configured target: '{configured_url}'")
+        return configured_url.rstrip("/")
+
+    local_app: LocalAppServer = request.getfixturevalue("local_app")
+    logger.info(f"[CONFIG] No --base-url given. Running against local stand-in: '{local_app.url}'")
+    return local_app.url
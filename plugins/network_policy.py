@@ -0,0 +1,59 @@
+import json
+import allure
+import pytest
+import logging
+import tempfile
+from pathlib import Path
+from typing import Generator
+from playwright.sync_api import Page
+
+from helpers.network_policy import POLICIES, NetworkPolicy, NetworkPolicyController, NetworkSizeTable
+
+logger = logging.getLogger(__name__)
+
+def _resolve_marker_policy(marker: pytest.Mark) -> NetworkPolicy:
+    policy = marker.args[0] if marker.args else NetworkPolicy(**marker.kwargs)
+    if isinstance(policy, NetworkPolicy):
+        return policy
+    if policy not in POLICIES:
+        raise pytest.UsageError(f"Unknown network policy '{policy}'. Available: {', '.join(POLICIES)}")
+    return POLICIES[policy]
+
+@pytest.fixture(scope="session")
+def network_size_table(pytestconfig: pytest.Config) -> Generator[NetworkSizeTable, None, None]:
+    cache = getattr(pytestconfig, "cache", None)
+    directory = Path(cache.mkdir("network_policy")) if cache else Path(tempfile.gettempdir()) / "phptravels-network-policy"
+    directory.mkdir(parents=True, exist_ok=True)
+
+    size_table = NetworkSizeTable(directory / "sizes.json")
+    yield size_table
+    size_table.flush()
+
+@pytest.fixture()
+def network_policy(
+    request: pytest.FixtureRequest,
+    page: Page,
+    base_url: str,
+    network_size_table: NetworkSizeTable
+) -> Generator[NetworkPolicyController, None, None]:
+    controller = NetworkPolicyController(page, base_url, network_size_table)
+
+    marker = request.node.get_closest_marker("network_policy")
+    if marker:
+        controller.pin(_resolve_marker_policy(marker))
+
+    yield controller
+
+    stats = controller.stats
+    if controller.policy is None or controller.policy.is_noop:
+        return
+
+    logger.info(
+        f"[EVENT] Network policy '{stats.policy}': {stats.aborted} aborted {dict(stats.aborted_by_type)}, "
+        f"{stats.stubbed} stubbed, {stats.allowed} allowed, ~{stats.bytes_saved} bytes saved ({stats.unknown_size} without a known size)."
+    )
+    allure.attach(
+        json.dumps(stats.as_dict(), indent=4),
+        name="Log_Network_Policy",
+        attachment_type=allure.attachment_type.JSON
+    )
@@ -0,0 +1,110 @@
+import pytest
+import logging
+from pathlib import Path
+from dataclasses import replace
+from typing import Callable, Generator
+
+from helpers.common_helper import mask_text
+from helpers.identity import IdentityAllocator
+from helpers.api_client import PhpTravelsApiClient
+from models.data_models import CustomerSignupData
+from pages.customer_signup_page import CustomerSignupPage
+from pages.signup_success_page import SignupSuccessPage
+from helpers.precondition_cache import CachedPrecondition, PreconditionCache
+from plugins.local_app import local_app_key
+
+logger = logging.getLogger(__name__)
+
+# Cache key of the precondition; the seeded account gets its email and phone from the identity allocator
+UNACTIVATED_ACCOUNT = CustomerSignupData(
+    first_name="Ha Lan",
+    last_name="Nguyen",
+    country="Viet Nam",
+    phone="",
+    email="",
+    password="************"
+)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addini(
+        "precondition_cache_ttl",
+        help="Seconds a cached precondition (seeded account) stays valid.",
+        default="86400"
+    )
+    parser.addini(
+        "precondition_cache_max_entries",
+        help="Maximum number of cached preconditions kept on disk.",
+        default="50"
+    )
+    parser.addini(
+        "precondition_seeding",
+        help="How preconditions are created on a cache miss: 'api' (direct HTTP) or 'ui' (browser flow).",
+        default="api"
+    )
+
+@pytest.fixture(scope="session")
+def precondition_cache(
+    pytestconfig: pytest.Config,
+    base_url: str,
+    target_namespace: str,
+    tmp_path_factory: pytest.TempPathFactory
+) -> PreconditionCache:
+    local_app = pytestconfig.stash.get(local_app_key, None)
+    cache = getattr(pytestconfig, "cache", None)
+    if local_app and local_app.url == base_url:
+        # The stand-in forgets its accounts when it stops, so its preconditions only live as long as the session
+        cache_dir = tmp_path_factory.mktemp("preconditions")
+    elif cache is not None:
+        cache_dir = cache.mkdir("preconditions")
+    else:
+        cache_dir = Path(pytestconfig.rootpath) / ".pytest_cache" / "d" / "preconditions"
+
+    logger.debug(f"[CONFIG] Precondition cache directory: {cache_dir}")
+    return PreconditionCache(
+        cache_dir,
+        namespace=target_namespace,
+        ttl=float(pytestconfig.getini("precondition_cache_ttl")),
+        max_entries=int(pytestconfig.getini("precondition_cache_max_entries"))
+    )
+
+@pytest.fixture(scope="session")
+def api_client(base_url: str) -> Generator[PhpTravelsApiClient, None, None]:
+    client = PhpTravelsApiClient(base_url)
+    yield client
+    client.close()
+
+@pytest.fixture()
+def seed_accounts(api_client: PhpTravelsApiClient) -> Callable[[list[CustomerSignupData]], list[CustomerSignupData]]:
+    return api_client.signup_many
+
+@pytest.fixture()
+def unactivated_account(
+    request: pytest.FixtureRequest,
+    pytestconfig: pytest.Config,
+    precondition_cache: PreconditionCache,
+    identity: IdentityAllocator
+) -> CachedPrecondition:
+
+    def register_via_api(user_data: CustomerSignupData) -> None:
+        api_client: PhpTravelsApiClient = request.getfixturevalue("api_client")
+        api_client.signup(user_data)
+
+    def register_via_ui(user_data: CustomerSignupData) -> None:
+        customer_signup_page: CustomerSignupPage = request.getfixturevalue("customer_signup_page")
+        signup_success_page: SignupSuccessPage = request.getfixturevalue("signup_success_page")
+        customer_signup_page.navigate()
+        customer_signup_page.register_account(user_data)
+        customer_signup_page.page.wait_for_url(signup_success_page.url)
+
+    seeding = pytestconfig.getini("precondition_seeding")
+    register = register_via_ui if seeding == "ui" else register_via_api
+
+    def seed(profile: CustomerSignupData) -> CustomerSignupData:
+        user_data = replace(profile, email=identity.email("unactivated"), phone=identity.phone())
+        register(user_data)
+        return user_data
+
+    account = precondition_cache.get_or_create(UNACTIVATED_ACCOUNT, seed)
+    source = "cache" if account.from_cache else f"{seeding} seeding"
+    logger.info(f"[PRE-CONDITION] Unactivated account ready from {source}: '{account.account.email}' / '{mask_text(account.account.password)}'")
+    return account
@@ -0,0 +1,63 @@
+import pytest
+import logging
+
+from helpers.screenshot_pipeline import (
+    SCREENSHOT_FORMATS,
+    SCREENSHOT_MODES,
+    Image,
+    ScreenshotPipeline,
+    ScreenshotPolicy,
+    screenshot_pipeline_key
+)
+
+logger = logging.getLogger(__name__)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--report-screenshot",
+        choices=SCREENSHOT_MODES,
+        default=None,
+        help="When to attach a screenshot of the page to Allure after the test call (default: report_screenshot ini)."
+    )
+    parser.addini("report_screenshot", help="When to attach Allure screenshots: always, failure or off.", default="always")
+    parser.addini("report_screenshot_full_page", help="Capture the full scrollable page instead of the viewport.", type="bool", default=True)
+    parser.addini("report_screenshot_format", help="Screenshot format: png, jpeg or webp (webp needs Pillow).", default="png")
+    parser.addini("report_screenshot_quality", help="JPEG/WebP quality (0-100).", default="80")
+    parser.addini("report_screenshot_max_height", help="Maximum height in pixels of a full page screenshot (0 = unlimited).", default="0")
+    parser.addini("report_screenshot_workers", help="Threads encoding and writing screenshot attachments.", default="2")
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    mode = config.getoption("report_screenshot") or config.getini("report_screenshot")
+    image_format = config.getini("report_screenshot_format")
+
+    if mode not in SCREENSHOT_MODES:
+        raise pytest.UsageError(f"Unknown report_screenshot mode '{mode}'. Available: {', '.join(SCREENSHOT_MODES)}")
+    if image_format not in SCREENSHOT_FORMATS:
+        raise pytest.UsageError(f"Unknown report_screenshot_format '{image_format}'. Available: {', '.join(SCREENSHOT_FORMATS)}")
+    if image_format == "webp" and Image is None:
+        logger.warning("[WARNING] Pillow is not installed, falling back to JPEG screenshots")
+        image_format = "jpeg"
+
+    policy = ScreenshotPolicy(
+        mode=mode,
+        full_page=config.getini("report_screenshot_full_page"),
+        image_format=image_format,
+        quality=int(config.getini("report_screenshot_quality")),
+        max_height=int(config.getini("report_screenshot_max_height"))
+    )
+    pipeline = ScreenshotPipeline(
+        policy,
+        listener=config.pluginmanager.getplugin("allure_listener"),
+        workers=int(config.getini("report_screenshot_workers"))
+    )
+    if pipeline.listener is not None and not pipeline.referenced:
+        logger.warning("[WARNING] Unsupported allure-python-commons version, screenshots are attached synchronously")
+    config.stash[screenshot_pipeline_key] = pipeline
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    pipeline = session.config.stash.get(screenshot_pipeline_key, None)
+    if pipeline:
+        logger.debug("[CONFIG] Waiting for pending screenshot attachments")
+        pipeline.close()
@@ -0,0 +1,76 @@
+import pytest
+import logging
+from pathlib import Path
+from _pytest.nodes import Item
+
+from helpers.sharding import group_weights, load_durations, parse_shard, partition
+
+logger = logging.getLogger(__name__)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--shard",
+        default=None,
+        help="Run only shard i of N (e.g. 2/4). Shards are balanced by shard_durations and identical on every machine."
+    )
+    parser.addini(
+        "shard_durations",
+        help="Committed JSON file of nodeid -> seconds used to balance shards, written by scripts/merge_reports.py --durations from the duration history.",
+        default=".test_durations.json"
+    )
+    parser.addini(
+        "shard_affinity_fixtures",
+        help="Expensive fixtures: tests of one class that share one of them stay on the same shard.",
+        type="args",
+        default=["async_browser", "api_client", "precondition_cache"]
+    )
+
+def _affinity_key(item: Item, affinity_fixtures: list[str]) -> str:
+    marker = item.get_closest_marker("shard_group")
+    if marker:
+        return f"group:{marker.args[0]}"
+    if getattr(item, "cls", None) is None:
+        return item.nodeid
+
+    class_id = item.nodeid.rsplit("::", 1)[0]
+    fixturenames = getattr(item, "fixturenames", ())
+    for fixture in affinity_fixtures:
+        if fixture in fixturenames:
+            return f"{class_id}[{fixture}]"
+    return item.nodeid
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[Item]) -> None:
+    shard = config.getoption("shard")
+    if not shard:
+        return
+    try:
+        index, total = parse_shard(shard)
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from None
+
+    affinity_fixtures = config.getini("shard_affinity_fixtures")
+    groups: dict[str, list[str]] = {}
+    item_groups = {}
+    for item in items:
+        key = item_groups[item.nodeid] = _affinity_key(item, affinity_fixtures)
+        groups.setdefault(key, []).append(item.nodeid)
+
+    # Not the per-machine duration history: every shard must compute the same partition from the same weights
+    durations_path = Path(config.rootpath, config.getini("shard_durations"))
+    durations = load_durations(durations_path)
+    weights = group_weights(groups, durations)
+    assignment = partition(weights, total)
+
+    selected = [item for item in items if assignment[item_groups[item.nodeid]] == index]
+    deselected = [item for item in items if assignment[item_groups[item.nodeid]] != index]
+    shard_weight = sum(weight for key, weight in weights.items() if assignment[key] == index)
+
+    logger.info(
+        f"[CONFIG] Shard {index}/{total}: {len(selected)} of {len(items)} tests in "
+        f"{sum(1 for key in groups if assignment[key] == index)} group(s), ~{shard_weight:.1f}s "
+        f"({f'weighted by {durations_path.name}' if durations else f'{durations_path.name} not found, equal weights'})"
+    )
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
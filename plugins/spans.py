@@ -0,0 +1,58 @@
+import json
+import allure
+import pytest
+import logging
+from pathlib import Path
+from typing import Generator
+from _pytest.nodes import Item
+
+from helpers import spans
+from plugins.identity import identity_allocator_key
+from pages.base_page import BasePage
+from components.base_component import BaseComponent
+
+logger = logging.getLogger(__name__)
+
+span_timeline_key = pytest.StashKey[Path]()
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--spans",
+        action="store_true",
+        default=None,
+        help="Time page-object and component methods (default: spans ini)."
+    )
+    parser.addini("spans", help="Record nested timing spans for page-object and component methods.", type="bool", default=False)
+    parser.addini("spans_dir", help="Folder of the JSONL span timelines (one file per worker).", default="reports/spans")
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    if not (config.getoption("spans") or config.getini("spans")):
+        return
+
+    wrapped = spans.instrument_hierarchy(BasePage, BaseComponent)
+    allocator = config.stash[identity_allocator_key]
+    timeline = Path(config.rootpath, config.getini("spans_dir"), f"timeline-{allocator.worker_id}.jsonl")
+    timeline.parent.mkdir(parents=True, exist_ok=True)
+    config.stash[span_timeline_key] = timeline
+    logger.info(f"[CONFIG] Span timing enabled for {wrapped} page-object methods. Timeline: {timeline}")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: Item) -> None:
+    if span_timeline_key in item.config.stash:
+        spans.start_recording(item.nodeid)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: Item) -> Generator:
+    yield
+    recorder = spans.stop_recording()
+    if recorder is None:
+        return
+
+    allure.attach(recorder.breakdown(), name="Log_Span_Breakdown", attachment_type=allure.attachment_type.TEXT)
+
+    run_id = item.config.stash[identity_allocator_key].run_id
+    with open(item.config.stash[span_timeline_key], "a", encoding="utf-8") as timeline:
+        for record in recorder.timeline(run_id=run_id):
+            timeline.write(json.dumps(record, ensure_ascii=False) + "\n")
+    logger.debug(f"[DEBUG] Recorded {len(recorder.spans)} span(s) for: {item.nodeid}")
@@ -0,0 +1,75 @@
+import allure
+import pytest
+import logging
+from pathlib import Path
+from typing import Generator
+from _pytest.nodes import Item
+
+from helpers.structured_logging import StructuredLogging
+
+logger = logging.getLogger(__name__)
+
+MAIN_WORKER = "main"
+TEST_LOG_RECORDER_PLUGIN = "test_log_recorder"
+
+test_failed_key = pytest.StashKey[bool]()
+
+
+class TestLogRecorder:
+    __test__ = False
+
+    def __init__(self, structured_logging: StructuredLogging) -> None:
+        self.structured_logging = structured_logging
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: Item) -> None:
+        item.stash[test_failed_key] = False
+        self.structured_logging.begin_test(item.nodeid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: Item, call: pytest.CallInfo) -> Generator:
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed:
+            item.stash[test_failed_key] = True
+        if report.when == "teardown" and item.stash.get(test_failed_key, False):
+            logger.info(f"[ATTACH] Attaching the buffered test log of: {item.nodeid}")
+            allure.attach(self.structured_logging.buffered_log(), name="Log_Test_Output", attachment_type=allure.attachment_type.TEXT)
+
+    def pytest_runtest_logfinish(self, nodeid: str) -> None:
+        self.structured_logging.end_test()
+
+    def pytest_unconfigure(self, config: pytest.Config) -> None:
+        self.structured_logging.stop()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addini(
+        "log_queue",
+        help="Send log records through a queue to a background thread writing JSONL (and the console with -s).",
+        type="bool",
+        default=True
+    )
+    parser.addini("log_jsonl_dir", help="Folder of the per-worker JSONL log files.", default="reports/logs")
+    parser.addini("log_buffer_size", help="Log records kept in memory per test for the Allure attachment on failure.", default="5000")
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getini("log_queue"):
+        return
+
+    workerinput = getattr(config, "workerinput", None)
+    worker = workerinput["workerid"] if workerinput else MAIN_WORKER
+    live_logging = config.getoption("log_cli_level") is not None or config.getini("log_cli")
+    console = not workerinput and not live_logging and config.getoption("capture") == "no"
+
+    structured_logging = StructuredLogging(
+        Path(config.rootpath, config.getini("log_jsonl_dir"), f"log-{worker}.jsonl"),
+        worker,
+        level=logging.getLevelName((config.getoption("log_cli_level") or config.getini("log_cli_level") or "INFO").upper()),
+        console_formatter=logging.Formatter(config.getini("log_cli_format"), config.getini("log_cli_date_format")) if console else None,
+        buffer_size=int(config.getini("log_buffer_size"))
+    )
+    structured_logging.start()
+    config.pluginmanager.register(TestLogRecorder(structured_logging), TEST_LOG_RECORDER_PLUGIN)
+    logger.debug(f"[CONFIG] Queued structured logging to: {structured_logging.jsonl_path}")
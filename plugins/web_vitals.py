@@ -0,0 +1,69 @@
+import json
+import allure
+import pytest
+import logging
+import tempfile
+from pathlib import Path
+from typing import Generator
+from slugify import slugify
+from playwright.sync_api import Page
+
+from plugins.local_app import local_app_key
+from helpers.web_vitals import WEB_VITALS_MODES, WebVitalsHistory, WebVitalsPolicy, WebVitalsRecorder
+
+logger = logging.getLogger(__name__)
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--web-vitals",
+        choices=WEB_VITALS_MODES,
+        default=None,
+        help="What to do when navigate() breaks a page budget or regresses from its baseline (default: web_vitals ini)."
+    )
+    parser.addini("web_vitals", help="Web vitals check on navigate(): off, warn or fail.", default="warn")
+    parser.addini("web_vitals_tolerance", help="Allowed relative regression from the rolling baseline (0.25 = 25%).", default="0.25")
+    parser.addini("web_vitals_window", help="Number of previous samples per page and metric in the rolling baseline.", default="20")
+    parser.addini("web_vitals_min_samples", help="Samples needed before regressions are checked.", default="5")
+
+@pytest.fixture(scope="session")
+def web_vitals_policy(pytestconfig: pytest.Config) -> WebVitalsPolicy:
+    mode = pytestconfig.getoption("web_vitals") or pytestconfig.getini("web_vitals")
+    if mode not in WEB_VITALS_MODES:
+        raise pytest.UsageError(f"Unknown web_vitals mode '{mode}'. Available: {', '.join(WEB_VITALS_MODES)}")
+    return WebVitalsPolicy(
+        mode=mode,
+        tolerance=float(pytestconfig.getini("web_vitals_tolerance")),
+        min_samples=int(pytestconfig.getini("web_vitals_min_samples"))
+    )
+
+@pytest.fixture(scope="session")
+def web_vitals_history(pytestconfig: pytest.Config, base_url: str) -> Generator[WebVitalsHistory, None, None]:
+    local_app = pytestconfig.stash.get(local_app_key, None)
+    target = "local-stand-in" if local_app and local_app.url == base_url else slugify(base_url)
+
+    cache = getattr(pytestconfig, "cache", None)
+    directory = Path(cache.mkdir("web_vitals")) if cache else Path(tempfile.gettempdir()) / "phptravels-web-vitals"
+    directory.mkdir(parents=True, exist_ok=True)
+
+    history = WebVitalsHistory(directory / f"{target}.jsonl", window=int(pytestconfig.getini("web_vitals_window")))
+    logger.debug(f"[CONFIG] Web vitals history: {history.path}")
+    yield history
+    history.flush()
+
+@pytest.fixture()
+def web_vitals(
+    page: Page,
+    web_vitals_history: WebVitalsHistory,
+    web_vitals_policy: WebVitalsPolicy
+) -> Generator[WebVitalsRecorder, None, None]:
+    recorder = WebVitalsRecorder(page, web_vitals_history, web_vitals_policy)
+
+    yield recorder
+
+    recorder.unwatch()
+    if recorder.samples:
+        allure.attach(
+            json.dumps(recorder.as_dict(), indent=4),
+            name="Log_Web_Vitals",
+            attachment_type=allure.attachment_type.JSON
+        )
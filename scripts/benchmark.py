@@ -0,0 +1,303 @@
+import sys
+import logging
+import argparse
+import tempfile
+import itertools
+from pathlib import Path
+from types import SimpleNamespace
+from dataclasses import asdict, replace
+from typing import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pytest
+import allure_commons
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import TestResult
+from allure_commons.reporter import AllureReporter
+from playwright.sync_api import sync_playwright, Browser, Page
+
+import conftest
+from local_app.server import LocalAppServer
+from helpers.captcha import StubCaptcha
+from helpers.common_helper import mask_text
+from helpers.data_bank import generate_bank
+from helpers.data_helper import DataHelper
+from helpers.identity import IdentityAllocator
+from helpers.benchmarking import BenchmarkHistory, BenchmarkResult, compare, current_commit, current_environment, measure
+from helpers.screenshot_pipeline import ScreenshotPipeline, ScreenshotPolicy, screenshot_pipeline_key
+from models.data_models import CustomerLoginData
+from pages.base_page import BasePage
+from pages.customer_login_page import CustomerLoginPage
+from pages.customer_signup_page import CustomerSignupPage
+from pages.signup_success_page import SignupSuccessPage
+from plugins.context_pool import ContextPool
+
+DEFAULT_HISTORY = ROOT / ".benchmarks" / "history.jsonl"
+
+# A changing counter in the viewport, so each screenshot is new content and not a deduplicated reference
+MARK_SCRIPT = """n => {
+    let mark = document.getElementById("__benchmark_mark");
+    if (!mark) {
+        mark = document.createElement("div");
+        mark.id = "__benchmark_mark";
+        mark.style.cssText = "position:fixed;top:0;left:0;z-index:2147483647;background:#fff;font:16px monospace";
+        document.body.append(mark);
+    }
+    mark.textContent = String(n);
+}"""
+
+Benchmark = Callable[["BenchmarkEnvironment"], Iterator[Callable[[], object]]]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = contextmanager(func)
+        return func
+    return register
+
+
+class BenchmarkEnvironment:
+
+    def __init__(self, stack: ExitStack, seed: int) -> None:
+        self.stack = stack
+        self.seed = seed
+        self.identity = IdentityAllocator.for_process()
+        self.work_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="phptravels-bench-")))
+        self._server: LocalAppServer | None = None
+        self._browser: Browser | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            self._server = self.stack.enter_context(LocalAppServer())
+        return self._server.url
+
+    @property
+    def browser(self) -> Browser:
+        if self._browser is None:
+            playwright = self.stack.enter_context(sync_playwright())
+            self._browser = playwright.chromium.launch()
+            self.stack.callback(self._browser.close)
+        return self._browser
+
+    def new_page(self) -> Page:
+        context = self.browser.new_context(base_url=self.base_url)
+        self.stack.callback(context.close)
+        return context.new_page()
+
+
+@benchmark("page_object.construct")
+def bench_page_object(env: BenchmarkEnvironment):
+    page = env.new_page()
+
+    def construct() -> object:
+        base_page = BasePage(page, env.base_url)
+        return base_page.navbar, base_page.mobile_app, base_page.footer
+    yield construct
+
+
+@benchmark("fixture.page_setup_teardown")
+def bench_fixture(env: BenchmarkEnvironment):
+    pool = ContextPool(env.browser, {"base_url": env.base_url}, capture_trace=False, warm_size=1)
+    pool.warm_up()
+    login_url = f"{env.base_url}{CustomerLoginPage.PATH}"
+
+    def lease_cycle() -> None:
+        lease = pool.acquire()
+        lease.page.goto(login_url)
+        pool.release(lease)
+    yield lease_cycle
+    pool.close()
+
+
+def _makereport_cycle(env: BenchmarkEnvironment, screenshot_mode: str):
+    page = env.new_page()
+    page.goto(f"{env.base_url}{CustomerLoginPage.PATH}")
+
+    reporter = AllureReporter()
+    iterations = itertools.count()
+    file_logger = AllureFileLogger(str(env.work_dir / f"allure-{screenshot_mode}"))
+    allure_commons.plugin_manager.register(file_logger)
+
+    pipeline = ScreenshotPipeline(
+        ScreenshotPolicy(mode=screenshot_mode, full_page=False, image_format="jpeg", quality=80, max_height=4000),
+        listener=SimpleNamespace(allure_logger=reporter)
+    )
+    stash = pytest.Stash()
+    stash[screenshot_pipeline_key] = pipeline
+    item = SimpleNamespace(name="benchmark", nodeid="benchmark.py::benchmark", funcargs={"page": page}, config=SimpleNamespace(stash=stash))
+    report = SimpleNamespace(when="call", passed=True, failed=False, longrepr=None)
+    outcome = SimpleNamespace(get_result=lambda: report)
+
+    def makereport() -> None:
+        iteration = next(iterations)
+        uuid = f"benchmark-{iteration}"
+        reporter.schedule_test(uuid, TestResult(uuid=uuid, name="benchmark"))
+        page.evaluate(MARK_SCRIPT, iteration)
+
+        hook = conftest.pytest_runtest_makereport(item, None)
+        next(hook)
+        try:
+            hook.send(outcome)
+        except StopIteration:
+            pass
+        reporter.close_test(uuid)
+    yield makereport
+
+    pipeline.close()
+    allure_commons.plugin_manager.unregister(file_logger)
+
+
+@benchmark("makereport.no_screenshot")
+def bench_makereport(env: BenchmarkEnvironment):
+    yield from _makereport_cycle(env, "off")
+
+
+@benchmark("makereport.screenshot")
+def bench_makereport_screenshot(env: BenchmarkEnvironment):
+    yield from _makereport_cycle(env, "always")
+
+
+@benchmark("data.mask_asdict")
+def bench_masking(env: BenchmarkEnvironment):
+    login_data = CustomerLoginData(email=env.identity.email(), password="P@ssw0rd-for-benchmarks")
+
+    def mask() -> dict:
+        masked = asdict(login_data)
+        masked["password"] = mask_text(login_data.password)
+        return masked
+    yield mask
+
+
+@benchmark("data.helper_construct")
+def bench_data_helper(env: BenchmarkEnvironment):
+    bank_dir = env.work_dir / "bank"
+    DataHelper(seed=env.seed, bank_dir=bank_dir).close()
+
+    def construct() -> object:
+        data_helper = DataHelper(seed=env.seed, bank_dir=bank_dir, identities=env.identity)
+        record = data_helper.signup_data()
+        data_helper.close()
+        return record
+    yield construct
+
+
+@benchmark("data.signup_record")
+def bench_signup_record(env: BenchmarkEnvironment):
+    data_helper = DataHelper(seed=env.seed, bank_dir=env.work_dir / "bank", identities=env.identity)
+    sections = [(group, char_class) for group in DataHelper.langs for char_class in DataHelper.chars]
+    counter = iter(range(1 << 62))
+
+    def record() -> object:
+        index = next(counter)
+        group, char_class = sections[index % len(sections)]
+        return data_helper.signup_data(group, char_class, index)
+    yield record
+    data_helper.close()
+
+
+@benchmark("data.bank_generate")
+def bench_bank_generate(env: BenchmarkEnvironment):
+    yield lambda: generate_bank(env.seed, DataHelper.langs, DataHelper.chars, 16)
+
+
+@benchmark("flow.login")
+def bench_login(env: BenchmarkEnvironment):
+    customer_login_page = CustomerLoginPage(env.new_page(), env.base_url)
+    login_form = customer_login_page.login_form
+
+    def login() -> None:
+        customer_login_page.navigate()
+        login_form.login(CustomerLoginData(email=env.identity.email(), password="************"))
+        login_form.alert_card.wait_for()
+    yield login
+
+
+@benchmark("flow.register_account")
+def bench_register_account(env: BenchmarkEnvironment):
+    captcha_strategy = StubCaptcha()
+    page = env.new_page()
+    captcha_strategy.prepare(page)
+    customer_signup_page = CustomerSignupPage(page, env.base_url, captcha_strategy)
+    data_helper = DataHelper(seed=env.seed, bank_dir=env.work_dir / "bank", identities=env.identity)
+
+    def register() -> None:
+        customer_signup_page.navigate()
+        customer_signup_page.register_account(
+            replace(data_helper.signup_data(), email=env.identity.email(), phone=env.identity.phone())
+        )
+        page.wait_for_url(f"**{SignupSuccessPage.PATH}")
+    yield register
+    data_helper.close()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure the harness's own overhead and compare it with earlier commits.")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Benchmarks to run (default: all).")
+    parser.add_argument("--rounds", type=int, default=30, help="Samples per benchmark.")
+    parser.add_argument("--seed", type=int, default=4197)
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSONL file with the results of earlier runs.")
+    parser.add_argument("--baseline", help="Commit to compare with (default: the latest run of another commit).")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the Mann-Whitney U test.")
+    parser.add_argument("--min-effect", type=float, default=0.05, help="Smallest median slowdown reported as a regression.")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the history.")
+    return parser.parse_args(argv)
+
+
+def format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)-6s %(message)s")
+
+    names = args.only or list(BENCHMARKS)
+    results: dict[str, BenchmarkResult] = {}
+    with ExitStack() as stack:
+        env = BenchmarkEnvironment(stack, args.seed)
+        for name in names:
+            print(f"Running {name}...", flush=True)
+            with BENCHMARKS[name](env) as operation:
+                result = measure(operation, args.rounds)
+            result.name = name
+            results[name] = result
+
+    commit = current_commit(ROOT)
+    environment = current_environment()
+    history = BenchmarkHistory(args.history)
+    baseline = history.baseline(commit, names, environment, args.baseline)
+    comparisons = compare(results, baseline, args.alpha, args.min_effect)
+
+    print(f"\nCommit {commit} ({args.rounds} rounds, alpha {args.alpha}, min effect {args.min_effect:.0%})")
+    header = f"{'benchmark':<30}{'median':>10}{'iqr':>10}{'baseline':>10}{'change':>9}{'p-value':>10}  verdict"
+    print(header)
+    print("-" * len(header))
+    for comparison in comparisons:
+        result = results[comparison.name]
+        change = "-" if comparison.change is None else f"{comparison.change:+.1%}"
+        p_value = "-" if comparison.p_value is None else f"{comparison.p_value:.4f}"
+        verdict = "REGRESSION" if comparison.regressed else "improved" if comparison.improved else "ok" if comparison.baseline else "new"
+        print(f"{comparison.name:<30}{format_time(result.median):>10}{format_time(result.iqr):>10}"
+              f"{format_time(comparison.baseline):>10}{change:>9}{p_value:>10}  {verdict}")
+    if history.runs and not any(run.get("environment") == environment for run in history.runs):
+        print(f"\nNo comparable baseline: none of the {len(history.runs)} recorded run(s) used Python {environment['python']} on {environment['platform']}")
+
+    if not args.no_save:
+        history.append(commit, results, environment)
+        print(f"\nResults appended to {args.history}")
+
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from helpers.browser_server import BROWSER_SERVER_DIR, DEFAULT_IDLE_TIMEOUT, BrowserServer, BrowserServerError
+
+logger = logging.getLogger("browser_server")
+
+BROWSERS = ("chromium", "firefox", "webkit")
+
+
+def launch_options(args: argparse.Namespace) -> dict:
+    # Same keys as pytest-playwright's browser_type_launch_args, so pytest --browser-server finds this daemon
+    options = {}
+    if args.headed:
+        options["headless"] = False
+    if args.browser_channel:
+        options["channel"] = args.browser_channel
+    return options
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Manage the persistent browser servers used by pytest --browser-server.")
+    parser.add_argument("command", choices=("start", "stop", "status"))
+    parser.add_argument("--browser", choices=BROWSERS, default="chromium", help="Browser of the server to start.")
+    parser.add_argument("--headed", action="store_true", help="Start a headed browser (matches pytest --headed).")
+    parser.add_argument("--browser-channel", help="Browser channel, e.g. chrome or msedge (matches pytest --browser-channel).")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, help="Seconds without a test after which the server shuts down.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-6s %(message)s")
+    root = ROOT / BROWSER_SERVER_DIR
+
+    if args.command == "start":
+        server = BrowserServer(root, args.browser, launch_options(args), args.idle_timeout)
+        try:
+            state = server.ensure()
+        except BrowserServerError as e:
+            logger.error(f"[ERROR] {e}")
+            return 1
+        logger.info(f"[SUCCESS] '{server.key}' (pid {state.pid}) serving {state.ws_endpoint}")
+        return 0
+
+    servers = BrowserServer.running(root)
+    if not servers:
+        logger.info("[EVENT] No browser server running")
+        return 0
+
+    for server in servers:
+        if args.command == "stop":
+            server.stop()
+            continue
+        state = server.state()
+        if not state:
+            continue
+        health = "healthy" if state.is_healthy() else "NOT RESPONDING"
+        logger.info(
+            f"[EVENT] '{server.key}' (pid {state.pid}) {health}: {state.ws_endpoint}, "
+            f"options {state.launch_options}, idle for {server.idle_for():.0f} s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
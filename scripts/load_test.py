@@ -0,0 +1,118 @@
+import sys
+import json
+import logging
+import argparse
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from local_app.server import LocalAppServer
+from helpers.captcha import CAPTCHA_STRATEGIES
+from helpers.identity import new_run_id
+from helpers.load_runner import SCENARIOS, LoadProfile, LoadResult, run_process
+
+logger = logging.getLogger("load_test")
+
+DEFAULT_OUTPUT = Path("reports") / "load" / "load-report.json"
+
+
+def parse_scenarios(value: str) -> dict[str, float]:
+    scenarios = {}
+    for item in value.split(","):
+        name, _, weight = item.strip().partition(":")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario '{name}'. Available: {', '.join(SCENARIOS)}")
+        scenarios[name] = float(weight or 1)
+    return scenarios
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ramp virtual users through the page-object journeys and report latency percentiles.")
+    parser.add_argument("--base-url", help="Target deployment (default: start the local stand-in).")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users.")
+    parser.add_argument("--processes", type=int, default=2, help="Browser processes the users are spread across.")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds of load after the run starts.")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds over which users are started.")
+    parser.add_argument("--scenarios", type=parse_scenarios, default=parse_scenarios("login:3,reset_password:1,signup:1"),
+                        help="Weighted journeys, e.g. 'login:3,reset_password:1,signup:1'.")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause in seconds between iterations of a user.")
+    parser.add_argument("--captcha-strategy", choices=["auto", *CAPTCHA_STRATEGIES], default="auto")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--seed", type=int, default=4197)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON report path.")
+    parser.add_argument("--log-level", default="INFO")
+    return parser.parse_args(argv)
+
+
+def print_report(report: dict) -> None:
+    header = f"{'action':<28}{'count':>8}{'errors':>8}{'req/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+    print(f"\nLoad run {report['run_id']} against {report['base_url']}: "
+          f"{report['users']} users / {report['processes']} processes / {report['duration_s']} s (latency in ms)")
+    print(header)
+    print("-" * len(header))
+    for action, stats in report["actions"].items():
+        print(f"{action:<28}{stats['count']:>8}{stats['errors']:>8}{stats['throughput_per_s']:>9.2f}"
+              f"{stats['p50']:>10.1f}{stats['p95']:>10.1f}{stats['p99']:>10.1f}{stats['max']:>10.1f}")
+    for action, stats in report["actions"].items():
+        if stats["error_types"]:
+            print(f"errors of {action}: {', '.join(f'{name} x{count}' for name, count in stats['error_types'].items())}")
+
+
+def run(args: argparse.Namespace, base_url: str) -> dict:
+    captcha_strategy = args.captcha_strategy
+    if captcha_strategy == "auto":
+        captcha_strategy = "manual" if args.base_url else "stub"
+
+    processes = max(1, min(args.processes, args.users))
+    profile = LoadProfile(
+        base_url=base_url,
+        users=args.users,
+        processes=processes,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        scenarios=args.scenarios,
+        run_id=new_run_id(),
+        captcha_strategy=captcha_strategy,
+        browser_name=args.browser,
+        headless=not args.headed,
+        think_time=args.think_time,
+        seed=args.seed,
+    )
+    logger.info(f"[CONFIG] Load run {profile.run_id}: {profile.users} users over {processes} processes for {profile.duration} s")
+
+    result = LoadResult()
+    spawn = multiprocessing.get_context("spawn")
+    with spawn.Manager() as manager, ProcessPoolExecutor(processes, mp_context=spawn) as executor:
+        ready = manager.Barrier(processes)
+        futures = [
+            executor.submit(run_process, profile, index, ready, args.log_level.upper())
+            for index in range(processes)
+        ]
+        for future in futures:
+            result.merge(LoadResult.from_dict(future.result()))
+
+    return result.report(profile)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)-6s %(message)s")
+
+    if args.base_url:
+        report = run(args, args.base_url.rstrip("/"))
+    else:
+        with LocalAppServer() as server:
+            report = run(args, server.url)
+
+    print_report(report)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+    logger.info(f"[SUCCESS] Load report written: {args.output}")
+    return 1 if any(stats["errors"] for stats in report["actions"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+import sys
+import json
+import logging
+import argparse
+from pathlib import Path
+from collections import Counter
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from helpers.attachment_store import LinkedAttachmentStore, content_digest
+
+logger = logging.getLogger("merge_reports")
+
+ALLURE_RESULTS = "allure-results"
+ARTIFACTS = "playwright-artifacts"
+MAKESPAN_REPORT = Path("durations") / "makespan.json"
+ATTACHMENT_MARKER = "-attachment"
+FIRST_WINS = ("categories.json", "executor.json")
+
+
+def rewrite_sources(node: Any, renames: dict[str, str]) -> None:
+    if isinstance(node, dict):
+        for attachment in node.get("attachments", ()):
+            attachment["source"] = renames.get(attachment.get("source"), attachment.get("source"))
+        for value in node.values():
+            rewrite_sources(value, renames)
+    elif isinstance(node, list):
+        for value in node:
+            rewrite_sources(value, renames)
+
+
+def merge_properties(sources: list[Path]) -> str:
+    values: dict[str, list[str]] = {}
+    for source in sources:
+        for line in source.read_text(encoding="utf-8").splitlines():
+            key, separator, value = line.partition("=")
+            if not separator or line.lstrip().startswith("#"):
+                continue
+            bucket = values.setdefault(key.strip(), [])
+            if value.strip() not in bucket:
+                bucket.append(value.strip())
+    return "".join(f"{key}={', '.join(value)}\n" for key, value in values.items())
+
+
+class ReportMerger:
+
+    def __init__(self, output: Path) -> None:
+        self.output = output
+        self.results_dir = output / ALLURE_RESULTS
+        self.artifacts_dir = output / ARTIFACTS
+        self.store = LinkedAttachmentStore(self.results_dir, listener=None)
+        self.stats: Counter = Counter()
+        self._attachments_by_digest: dict[str, str] = {}
+        self._properties: list[Path] = []
+
+    def merge(self, shard_roots: list[Path]) -> None:
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+        for shard_number, root in enumerate(shard_roots, 1):
+            logger.info(f"[ACTION] Merging shard {shard_number}: '{root}'...")
+            results = root / ALLURE_RESULTS
+            if results.is_dir():
+                self._merge_results(results)
+            artifacts = root / ARTIFACTS
+            if artifacts.is_dir():
+                self._merge_artifacts(artifacts, shard_number)
+
+        if self._properties:
+            (self.results_dir / "environment.properties").write_text(merge_properties(self._properties), encoding="utf-8")
+
+    def _merge_results(self, results: Path) -> None:
+        renames: dict[str, str] = {}
+        documents: list[Path] = []
+
+        for source in sorted(results.iterdir()):
+            if not source.is_file():
+                continue
+            if ATTACHMENT_MARKER in source.name:
+                renames[source.name] = self._merge_attachment(source)
+            elif source.suffix == ".json" and source.name not in FIRST_WINS:
+                documents.append(source)
+            elif source.name == "environment.properties":
+                self._properties.append(source)
+            elif not (self.results_dir / source.name).exists():
+                self.store.place(source, self.results_dir / source.name)
+
+        for source in documents:
+            document = json.loads(source.read_text(encoding="utf-8"))
+            rewrite_sources(document, renames)
+            destination = self.results_dir / source.name
+            if destination.exists():
+                self.stats["duplicate_results"] += 1
+                logger.warning(f"[WARNING] Result '{source.name}' exists in more than one shard, keeping the first")
+                continue
+            destination.write_text(json.dumps(document), encoding="utf-8")
+            self.stats["results"] += 1
+
+    def _merge_attachment(self, source: Path) -> str:
+        digest = content_digest(source)
+        existing = self._attachments_by_digest.get(digest)
+        if existing:
+            self.stats["attachments_deduplicated"] += 1
+            return existing
+
+        name = source.name
+        if (self.results_dir / name).exists():
+            name = f"{digest}{ATTACHMENT_MARKER}{source.suffix}"
+        self.stats[f"attachments_{self.store.place(source, self.results_dir / name)}"] += 1
+        self._attachments_by_digest[digest] = name
+        return name
+
+    def _merge_artifacts(self, artifacts: Path, shard_number: int) -> None:
+        for folder in sorted(artifacts.iterdir()):
+            if not folder.is_dir():
+                continue
+            destination = self.artifacts_dir / folder.name
+            if destination.exists():
+                destination = self.artifacts_dir / f"{folder.name}-shard{shard_number}"
+            for source in sorted(folder.rglob("*")):
+                if source.is_file():
+                    target = destination / source.relative_to(folder)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    self.stats[f"artifacts_{self.store.place(source, target)}"] += 1
+
+
+def merge_durations(shard_roots: list[Path], durations_path: Path) -> int:
+    durations = {}
+    if durations_path.is_file():
+        durations.update(json.loads(durations_path.read_text(encoding="utf-8")))
+    for root in shard_roots:
+        report = root / MAKESPAN_REPORT
+        if report.is_file():
+            makespan = json.loads(report.read_text(encoding="utf-8"))
+            durations.update(makespan.get("median_durations") or makespan.get("durations", {}))
+    durations_path.write_text(json.dumps(dict(sorted(durations.items())), indent=2) + "\n", encoding="utf-8")
+    return len(durations)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Merge the reports folders of several --shard runs into one Allure report.")
+    parser.add_argument("shards", nargs="+", type=Path, help="reports folders of the shards (each with allure-results/ and playwright-artifacts/).")
+    parser.add_argument("--output", type=Path, default=Path("reports") / "merged", help="Folder of the merged report.")
+    parser.add_argument("--durations", type=Path, help="Update this shard_durations file (e.g. .test_durations.json) with the median durations the shards recorded.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-6s %(message)s")
+
+    missing = [root for root in args.shards if not root.is_dir()]
+    if missing:
+        logger.error(f"[ERROR] Shard folders not found: {', '.join(map(str, missing))}")
+        return 2
+
+    merger = ReportMerger(args.output)
+    merger.merge(args.shards)
+    logger.info(f"[SUCCESS] Merged {len(args.shards)} shard(s) into '{args.output}': {dict(sorted(merger.stats.items()))}")
+
+    if args.durations:
+        count = merge_durations(args.shards, args.durations)
+        logger.info(f"[SUCCESS] {args.durations} now holds durations for {count} test(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import allure
+import pytest
+import threading
+from allure_commons.reporter import ThreadContextItems
+
+from helpers import allure_compat
+from helpers.allure_compat import close_test_result, rebind_thread_context
+
+
+class FakeTestCache:
+
+    def __init__(self, items: dict[str, str]) -> None:
+        self.items = items
+
+    def pop(self, nodeid: str) -> str | None:
+        return self.items.pop(nodeid, None)
+
+
+class FakeReporter:
+
+    def __init__(self) -> None:
+        self.closed = []
+
+    def close_test(self, uuid: str) -> None:
+        self.closed.append(uuid)
+
+
+class FakeListener:
+
+    def __init__(self, items: dict[str, str]) -> None:
+        self._cache = FakeTestCache(items)
+        self.allure_logger = FakeReporter()
+
+@allure.parent_suite("Framework")
+@allure.suite("Allure Compatibility")
+@pytest.mark.unit
+class TestAllureCompat:
+
+    @pytest.fixture()
+    def unsupported(self, monkeypatch):
+        monkeypatch.setattr(allure_compat, "_package_version", lambda package: (3, 1))
+
+    @allure.title("The thread context of a foreign thread is dropped on a supported allure")
+    def test_rebind_thread_context(self):
+        thread = threading.Thread(name="loop")
+        ThreadContextItems._thread_context[thread]["uuid"] = "earlier test"
+
+        assert rebind_thread_context(thread)
+        assert thread not in ThreadContextItems._thread_context
+
+    @allure.title("Rebinding is skipped on an unsupported allure")
+    def test_rebind_thread_context_unsupported(self, unsupported):
+        thread = threading.Thread(name="loop")
+        ThreadContextItems._thread_context[thread]["uuid"] = "earlier test"
+
+        assert not rebind_thread_context(thread)
+        assert ThreadContextItems._thread_context.pop(thread) == {"uuid": "earlier test"}
+
+    @allure.title("The running result of a test is closed so the next attempt starts a new one")
+    def test_close_test_result(self):
+        listener = FakeListener({"tests/test_x.py::test_y": "uuid-1"})
+
+        assert close_test_result(listener, "tests/test_x.py::test_y")
+        assert close_test_result(listener, "tests/test_x.py::test_y")
+        assert listener.allure_logger.closed == ["uuid-1"]
+        assert not close_test_result(object(), "tests/test_x.py::test_y")
+
+    @allure.title("Attempts are not split when allure-pytest is unsupported")
+    def test_close_test_result_unsupported(self, unsupported):
+        listener = FakeListener({"tests/test_x.py::test_y": "uuid-1"})
+
+        assert not close_test_result(listener, "tests/test_x.py::test_y")
+        assert listener.allure_logger.closed == []
@@ -0,0 +1,33 @@
+import allure
+import pytest
+from dataclasses import replace
+
+from helpers.api_client import PhpTravelsApiClient
+from helpers.identity import IdentityAllocator, new_run_id
+from local_app.server import LocalAppServer
+from models.data_models import CustomerSignupData
+
+PROFILE = CustomerSignupData(first_name="Bulk", last_name="Seeded", country="Vietnam", phone="", email="", password="Secret123")
+
+@allure.parent_suite("Framework")
+@allure.suite("API Client")
+@pytest.mark.unit
+class TestApiClient:
+
+    @allure.title("Concurrent seeding keeps one session and CSRF token per thread")
+    def test_signup_many_uses_a_session_per_thread(self):
+        identity = IdentityAllocator(new_run_id())
+        accounts = [replace(PROFILE, email=identity.email("bulk"), phone=identity.phone()) for _ in range(24)]
+
+        with LocalAppServer() as server:
+            client = PhpTravelsApiClient(server.url)
+            try:
+                client.signup_many(accounts, max_workers=4)
+                sessions = list(client._sessions)
+            finally:
+                client.close()
+
+            assert len(server.accounts) == len(accounts)
+        assert 1 <= len(sessions) <= 4
+        assert len({session.cookies.get("phptravels_session") for session in sessions}) == len(sessions)
+        assert client._sessions == []
@@ -0,0 +1,89 @@
+import allure
+import pytest
+
+from helpers.batch_expect import CONTAINS_TEXT, HIDDEN, URL, VISIBLE, BatchExpect, Expectation, describe_locator
+
+
+class FakeLocator:
+
+    def __init__(self, selector: str, snapshots: list[dict]) -> None:
+        self.selector = selector
+        self.snapshots = snapshots
+
+    def evaluate_all(self, script: str) -> dict:
+        return self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+
+    def __repr__(self) -> str:
+        return f"<Locator frame=<Frame name= url='http://127.0.0.1:8000/login'> selector={self.selector!r}>"
+
+
+class FakePage:
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.waits: list[float] = []
+
+    def wait_for_timeout(self, timeout: float) -> None:
+        self.waits.append(timeout)
+
+
+def snapshot(count: int = 1, visible_count: int | None = None, text: str | None = "") -> dict:
+    return {"count": count, "visible_count": count if visible_count is None else visible_count, "text": text}
+
+@allure.parent_suite("Framework")
+@allure.suite("Batched Expectations")
+@pytest.mark.unit
+class TestBatchExpect:
+
+    @allure.title("A hidden check fails when any of several matching elements is visible")
+    def test_hidden_checks_every_match(self):
+        hidden = Expectation(HIDDEN, locator=FakeLocator(".alert", []))
+
+        assert hidden.mismatch("", snapshot(count=2, visible_count=1)) == "expected hidden, 1 of 2 matching element(s) visible"
+        assert hidden.mismatch("", snapshot(count=2, visible_count=0)) is None
+        assert hidden.mismatch("", snapshot(count=0)) is None
+
+    @allure.title("Visible and text checks report strict mode violations, missing and hidden elements")
+    def test_visible_and_text_mismatches(self):
+        locator = FakeLocator(".alert", [])
+        visible = Expectation(VISIBLE, locator=locator)
+        contains = Expectation(CONTAINS_TEXT, "Wrong credentials", locator)
+
+        assert visible.mismatch("", snapshot(count=2)) == "strict mode violation, the locator resolved to 2 elements"
+        assert visible.mismatch("", snapshot(count=0)) == "expected visible, element not found"
+        assert visible.mismatch("", snapshot(visible_count=0)) == "expected visible, actual hidden"
+        assert visible.mismatch("", None) == "could not be evaluated (the page was navigating)"
+        assert contains.mismatch("", snapshot(text="Wrong  credentials. Try again")) == "expected to contain 'Wrong credentials', actual text 'Wrong  credentials. Try again'"
+        assert contains.mismatch("", snapshot(text="Wrong credentials. Try again")) is None
+        assert Expectation(URL, "http://x/login").mismatch("http://x/login", None) is None
+
+    @allure.title("Targets are named after the locator's selector")
+    def test_describe_locator(self):
+        assert describe_locator(FakeLocator("#login >> .alert", [])) == "#login >> .alert"
+        assert describe_locator("not a locator") == "'not a locator'"
+        assert Expectation(VISIBLE, locator=FakeLocator(".alert", []), name="alert card").target == "alert card"
+        assert Expectation(URL, "http://x").target == "page"
+
+    @allure.title("verify() polls until every expectation is met")
+    def test_verify_polls_until_met(self):
+        page = FakePage("http://x/login")
+        alert = FakeLocator(".alert", [snapshot(count=0), snapshot(visible_count=0), snapshot(text="Wrong credentials")])
+
+        BatchExpect(page, timeout=5000).to_have_url("http://x/login").to_contain_text(alert, "Wrong credentials").verify()
+
+        assert page.waits == [100, 250]
+
+    @allure.title("A timeout lists every unmet expectation in one message")
+    def test_failure_message_lists_unmet(self):
+        page = FakePage("http://x/signup")
+        alert = FakeLocator(".alert", [snapshot(count=2, visible_count=2)])
+        batch = BatchExpect(page, timeout=0).to_have_url("http://x/login").not_to_be_visible(alert, name="alert card")
+
+        with pytest.raises(AssertionError) as error:
+            batch.verify()
+
+        assert str(error.value) == "\n".join([
+            "2 of 2 batched expectations not met after 0 ms:",
+            "  - to_have_url [page]: expected 'http://x/login', actual 'http://x/signup'",
+            "  - not_to_be_visible [alert card]: expected hidden, 2 of 2 matching element(s) visible",
+        ])
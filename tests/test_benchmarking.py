@@ -0,0 +1,39 @@
+import allure
+import pytest
+
+from helpers.benchmarking import BenchmarkHistory, BenchmarkResult, compare
+
+LAPTOP = {"python": "3.12.1", "platform": "macOS-14.2-arm64"}
+CI = {"python": "3.11.9", "platform": "Linux-6.8.0-x86_64"}
+
+@allure.parent_suite("Framework")
+@allure.suite("Benchmarking")
+@pytest.mark.unit
+class TestBenchmarking:
+
+    @allure.title("The baseline only comes from runs recorded in the same environment")
+    def test_baseline_matches_environment(self, tmp_path):
+        history = BenchmarkHistory(tmp_path / "history.jsonl")
+        history.append("aaa", {"flow.login": BenchmarkResult("flow.login", [1.0, 1.1, 1.2])}, LAPTOP)
+        history.append("bbb", {"flow.login": BenchmarkResult("flow.login", [9.0, 9.1, 9.2])}, CI)
+
+        reloaded = BenchmarkHistory(tmp_path / "history.jsonl")
+
+        assert reloaded.baseline("ccc", ["flow.login"], LAPTOP) == {"flow.login": [1.0, 1.1, 1.2]}
+        assert reloaded.baseline("ccc", ["flow.login"], CI, against="aaa") == {}
+        assert reloaded.baseline("ccc", ["flow.login"], {"python": "3.13.0", "platform": "Linux"}) == {}
+
+    @allure.title("Only a significant and large enough slowdown is a regression")
+    def test_compare(self):
+        baseline = {"slow": [1.0, 1.01, 0.99, 1.02, 0.98], "same": [1.0, 1.01, 0.99, 1.02, 0.98]}
+        current = {
+            "slow": BenchmarkResult("slow", [1.5, 1.51, 1.49, 1.52, 1.48]),
+            "same": BenchmarkResult("same", [1.0, 1.02, 0.98, 1.01, 0.99]),
+            "new": BenchmarkResult("new", [1.0, 1.0, 1.0]),
+        }
+
+        comparisons = {comparison.name: comparison for comparison in compare(current, baseline)}
+
+        assert comparisons["slow"].regressed
+        assert not comparisons["same"].regressed and not comparisons["same"].improved
+        assert comparisons["new"].baseline is None
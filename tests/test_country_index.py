@@ -0,0 +1,43 @@
+import allure
+import pytest
+
+from helpers.country_index import CountryIndex, UnknownCountryError, country_key
+
+OPTIONS = [
+    ("VN", "Viet Nam"),
+    ("CI", "Côte d'Ivoire"),
+    ("GB", "United Kingdom"),
+    ("US", "United States"),
+    ("KR", "Korea, Republic of"),
+    ("KP", "Korea, Democratic People's Republic of"),
+]
+
+@allure.parent_suite("Framework")
+@allure.suite("Country Index")
+@pytest.mark.unit
+class TestCountryIndex:
+
+    @allure.title("Countries resolve by label, value, accents and aliases")
+    @pytest.mark.parametrize("name, value", [
+        ("Viet Nam", "VN"),
+        ("Vietnam", "VN"),
+        ("vn", "VN"),
+        ("Cote d'Ivoire", "CI"),
+        ("Ivory Coast", "CI"),
+        ("UK", "GB"),
+        ("South Korea", "KR"),
+        ("North Korea", "KP"),
+    ])
+    def test_resolve(self, name, value):
+        assert CountryIndex(OPTIONS).resolve(name).value == value
+
+    @allure.title("Unknown countries raise with close suggestions")
+    def test_unknown_country(self):
+        with pytest.raises(UnknownCountryError, match=r"Unknown country 'United Statez' \(6 options available\)\. Did you mean: 'United States'"):
+            CountryIndex(OPTIONS).resolve("United Statez")
+        with pytest.raises(UnknownCountryError, match=r"available\)\.$"):
+            CountryIndex(OPTIONS).resolve("Atlantis")
+
+    @allure.title("Country keys ignore case, accents and punctuation")
+    def test_country_key(self):
+        assert country_key("Côte d'Ivoire") == country_key("cote divoire") == "cotedivoire"
@@ -2,15 +2,19 @@ import json
 import allure
 import pytest
 import logging
-from time import time
 from dataclasses import asdict
 from playwright.sync_api import expect
 
 from helpers.common_helper import mask_text
+from helpers.batch_expect import async_expect_all, expect_all
+from helpers.identity import IdentityAllocator
+from helpers.async_support import AsyncRunner
+from helpers.precondition_cache import CachedPrecondition
 from models.data_models import CustomerLoginData
-from models.data_models import CustomerSignupData
 from pages.customer_login_page import CustomerLoginPage
 from pages.customer_signup_page import CustomerSignupPage
+from pages.async_customer_login_page import AsyncCustomerLoginPage
+from plugins.async_pages import AsyncPageFactory
 
 logger = logging.getLogger(__name__)
 
@@ -44,20 +48,13 @@ Verify that the system prevents access and displays a correct warning when a use
     def test_login_with_unactivated_account(
         self, 
         customer_login_page: CustomerLoginPage, 
-        customer_signup_page: CustomerSignupPage
+        unactivated_account: CachedPrecondition
     ) -> None:
         
         logger.info("--- STARTING TEST: [TC-001] - Login with an unactivated account ---")
 
         # Data Preparation
-        signup_user_data = CustomerSignupData(
-            first_name="Ha Lan",
-            last_name="Nguyen",
-            country="Viet Nam",
-            phone="0987356278",
-            email=f"user_{int(time())}@gmail.com",
-            password="************"
-        )
+        signup_user_data = unactivated_account.account
 
         masked_signup_data = asdict(signup_user_data)
         masked_signup_data["password"] = mask_text(signup_user_data.password)
@@ -82,14 +79,8 @@ Verify that the system prevents access and displays a correct warning when a use
             attachment_type=allure.attachment_type.JSON
         )
 
-        logger.info(f"[PRE-CONDITION] Preparing signup data for: {masked_login_data}...")
-        logger.debug(f"[DEBUG-DATA] [PRE-CONDITION] Preparing signup data for: {login_user_data}...")
-
-        # Pre-requisite: Registration
-        logger.info("[PRE-CONDITION] Registering unactivated account...")
-        customer_signup_page.navigate()
-        customer_signup_page.register_account(signup_user_data)
-        logger.info("[SUCCESS] Unactivated account created.")
+        logger.info(f"[PRE-CONDITION] Using unactivated account: {masked_login_data} (from cache: {unactivated_account.from_cache})...")
+        logger.debug(f"[DEBUG-DATA] [PRE-CONDITION] Using unactivated account: {login_user_data}...")
 
         # Execution Steps
         login_form = customer_login_page.login_form
@@ -113,21 +104,13 @@ Verify that the system prevents access and displays a correct warning when a use
 
         with allure.step("Step 5: Verifying Actual Results"):
             
-            with allure.step("Verifying URL remains at Customer Login page"):
-                logger.info(f"[VERIFICATION] Verifying URL remains at: '{customer_login_page.URL}'...")
-                expect(customer_login_page.page).to_have_url(customer_login_page.URL)
-                logger.info("[SUCCESS] URL verified.")
-
-            with allure.step("Verifying the alert card is visible"):
-                logger.info("[VERIFICATION] Verifying alert card visibility...")
-                expect(alert_card).to_be_visible()
-                logger.info("[SUCCESS] Alert card visible.")
-
-            with allure.step("Verifying the alert content is correct"):
-                logger.info("[VERIFICATION] Verifying alert content...")
-                for msg in not_active_account_alert_msgs:
-                    expect(alert_card).to_contain_text(msg)
-                logger.info("[SUCCESS] Alert content verified.")
+            with allure.step("Verifying URL remains at Customer Login page, the alert card is visible and its content is correct"):
+                logger.info(f"[VERIFICATION] Verifying URL remains at: '{customer_login_page.url}', alert card visibility and content...")
+                with expect_all(customer_login_page.page) as check:
+                    check.to_have_url(customer_login_page.url)
+                    check.to_be_visible(alert_card, name="alert card")
+                    check.to_contain_text(alert_card, *not_active_account_alert_msgs, name="alert card")
+                logger.info("[SUCCESS] URL, alert card visibility and alert content verified.")
 
         # Finalize
         logger.info("--- TEST COMPLETED: [TC-001] ---")
@@ -149,13 +132,13 @@ Verify that the system correctly handles login attempts with emails that are not
     @allure.tag("Login")
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.auth
-    def test_login_with_not_existed_account(self, customer_login_page: CustomerLoginPage) -> None:
+    def test_login_with_not_existed_account(self, customer_login_page: CustomerLoginPage, identity: IdentityAllocator) -> None:
         
         logger.info("--- STARTING TEST: [TC-002] - Login in with non-existent credentials ---")
         
         # Data Preparation
         login_user_data = CustomerLoginData(
-            email=f"user_{int(time())}@gmail.com",
+            email=identity.email(),
             password="************"
         )
 
@@ -193,16 +176,12 @@ Verify that the system correctly handles login attempts with emails that are not
 
         with allure.step("Step 5: Verifying Actual Results"):
 
-            with allure.step("Verifying the alert card is visible"):
-                logger.info("[VERIFICATION] Verifying alert card visibility...")
-                expect(alert_card).to_be_visible()
-                logger.info("[SUCCESS] Alert card visible.")
-
-            with allure.step("Verifying the alert content is correct"):
-                logger.info("[VERIFICATION] Verifying error text content...")
-                for msg in invalid_login_alert_msgs:
-                    expect(alert_card).to_contain_text(msg)
-                logger.info("[SUCCESS] Alert content verified.")
+            with allure.step("Verifying the alert card is visible and its content is correct"):
+                logger.info("[VERIFICATION] Verifying alert card visibility and error text content...")
+                with expect_all(customer_login_page.page) as check:
+                    check.to_be_visible(alert_card, name="alert card")
+                    check.to_contain_text(alert_card, *invalid_login_alert_msgs, name="alert card")
+                logger.info("[SUCCESS] Alert card visible and alert content verified.")
 
         # Finalize
         logger.info("--- TEST COMPLETED: [TC-002] ---")
@@ -309,13 +288,13 @@ Verify the system's behavior when trying to reset a password using an email that
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.auth
     @pytest.mark.flaky
-    def test_reset_password_using_not_existent_email(self, customer_login_page: CustomerLoginPage) -> None:
+    def test_reset_password_using_not_existent_email(self, customer_login_page: CustomerLoginPage, identity: IdentityAllocator) -> None:
         
         logger.info("--- STARTING TEST: [TC-005] - Reset password with not existent email ---")
         
         # Execution Steps
         login_form = customer_login_page.login_form
-        reset_email = f"user_{int(time())}@gmail.com"
+        reset_email = identity.email()
         alert_info = {}
 
         with allure.step("Step 1: Navigating to Customer Login page"):
@@ -493,11 +472,70 @@ Verify the navigation from the Login page to the Signup page via the 'Signup' bu
 
         # Assertions (Validation)
         with allure.step("Step 3: Verifying redirection to Customer Signup page"):
-            logger.info(f"[VERIFICATION] Verifying redirection to URL: '{customer_signup_page.URL}'...")
-            expect(customer_login_page.page).to_have_url(customer_signup_page.URL)
+            logger.info(f"[VERIFICATION] Verifying redirection to URL: '{customer_signup_page.url}'...")
+            expect(customer_login_page.page).to_have_url(customer_signup_page.url)
             logger.info("[SUCCESS] URL verified: Redirected to Customer signup page.")
 
         # Finalize
         logger.info("--- TEST COMPLETED: [TC-008] ---")
 
-    
\ No newline at end of file
+    @allure.sub_suite("Negative cases")
+    @allure.id("TC-009")
+    @allure.title("Concurrent logins with non-existent credentials")
+    @allure.description("""
+### Test Objective
+Verify that several independent sessions attempting to log in with unregistered emails at the same time each receive the invalid login alert.
+
+### Pre-conditions
+* Every session uses its own browser context and a unique, randomly generated email.
+
+### Expected Results
+* **Alert Visibility**: An error alert message appears in every session.
+* **Alert Content**: Every session displays an "Invalid Login. Please check your email and password" message.
+""")
+    @allure.tag("Login", "Concurrency")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.auth
+    def test_concurrent_logins_with_not_existed_accounts(
+        self,
+        async_runner: AsyncRunner,
+        async_page_factory: AsyncPageFactory,
+        identity: IdentityAllocator
+    ) -> None:
+
+        logger.info("--- STARTING TEST: [TC-009] - Concurrent logins with non-existent credentials ---")
+
+        # Data Preparation
+        sessions = 4
+        login_users_data = [
+            CustomerLoginData(email=identity.email(), password="************")
+            for _ in range(sessions)
+        ]
+
+        allure.attach(
+            json.dumps([login_user_data.email for login_user_data in login_users_data], indent=4),
+            name="Data_Input_Login",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+        logger.info(f"[PRE-CONDITION] Preparing {sessions} ghost emails...")
+
+        async def login_flow(login_user_data: CustomerLoginData) -> None:
+            customer_login_page = await async_page_factory.new_page(AsyncCustomerLoginPage)
+            login_form = customer_login_page.login_form
+
+            await customer_login_page.navigate()
+            await login_form.login(login_user_data)
+
+            async with async_expect_all(customer_login_page.page) as check:
+                check.to_be_visible(login_form.alert_card, name="alert card")
+                check.to_contain_text(login_form.alert_card, *login_form.invalid_login_alert_msgs, name="alert card")
+
+        # Execution Steps & Assertions (Validation)
+        with allure.step(f"Step 1: Logging in from {sessions} concurrent sessions and verifying the alert in each"):
+            logger.info(f"[VERIFICATION] Running {sessions} concurrent login flows...")
+            async_runner.gather(*(login_flow(login_user_data) for login_user_data in login_users_data))
+            logger.info("[SUCCESS] Invalid login alert verified in every session.")
+
+        # Finalize
+        logger.info("--- TEST COMPLETED: [TC-009] ---")
@@ -2,11 +2,11 @@ import json
 import allure
 import pytest
 import logging
-from time import time
 from dataclasses import asdict
-from playwright.sync_api import expect
 
 from helpers.common_helper import mask_text
+from helpers.batch_expect import expect_all
+from helpers.identity import IdentityAllocator
 from models.data_models import CustomerSignupData
 from pages.signup_success_page import SignupSuccessPage
 from pages.customer_signup_page import CustomerSignupPage
@@ -29,14 +29,14 @@ Verify that a new customer can successfully submit the signup form using valid c
 * User is on the Signup page.
 
 ### Expected Results
-* **Redirection**: System redirects to url: `https://www.phptravels.net/signup_success`.
+* **Redirection**: System redirects to url: `<base_url>/signup_success`.
 * **Notification**: A success message is displayed: *"Your account has been created. Please check your mailbox for activation"*
 """)
     @allure.tag("Signup")
     @allure.severity(allure.severity_level.BLOCKER)
     @pytest.mark.auth
     @pytest.mark.smoke
-    def test_signup_form_submission_success(self, customer_signup_page: CustomerSignupPage, signup_success_page: SignupSuccessPage):
+    def test_signup_form_submission_success(self, customer_signup_page: CustomerSignupPage, signup_success_page: SignupSuccessPage, identity: IdentityAllocator):
         
         logger.info("--- STARTING TEST: [TC-001] - Successful signup form submission ---")
 
@@ -46,7 +46,7 @@ Verify that a new customer can successfully submit the signup form using valid c
             last_name="Nguyen",
             country="Viet Nam",
             phone="0987356278",
-            email=f"user_{int(time())}@gmail.com",
+            email=identity.email(),
             password="************"
         )
 
@@ -97,21 +97,13 @@ Verify that a new customer can successfully submit the signup form using valid c
         logger.info("[VERIFICATION] Verifying signup success redirection and messages...")
 
         with allure.step("Step 11: Verifying Actual Results"):
-            with allure.step("Verifying redirection to the Success Page"):
-                logger.info(f"[VERIFICATION] Verifying redirection to URL: '{signup_success_page.URL}'...")
-                expect(customer_signup_page.page).to_have_url(signup_success_page.URL)
-                logger.info("[SUCCESS] URL verified.")
-            
-            with allure.step("Verifying the activate account notification card is visible"):
-                logger.info("[VERIFICATION] Verifying notification card visibility...")
-                expect(signup_success_page.notification_card).to_be_visible()
-                logger.info("[SUCCESS] Notification card visible.")
-            
-            with allure.step("Verifying the activate account notification content"):
-                logger.info("[VERIFICATION] Verifying notification text content...")
-                for msg in signup_success_page.activate_account_mgs:
-                    expect(signup_success_page.notification_card).to_contain_text(msg)
-                logger.info("[SUCCESS] Notification content verified.")
+            with allure.step("Verifying redirection to the Success Page and the activate account notification"):
+                logger.info(f"[VERIFICATION] Verifying redirection to URL: '{signup_success_page.url}', notification card visibility and content...")
+                with expect_all(customer_signup_page.page) as check:
+                    check.to_have_url(signup_success_page.url)
+                    check.to_be_visible(signup_success_page.notification_card, name="notification card")
+                    check.to_contain_text(signup_success_page.notification_card, *signup_success_page.activate_account_mgs, name="notification card")
+                logger.info("[SUCCESS] URL, notification card visibility and content verified.")
 
         # Finalize
         logger.info("--- TEST COMPLETED: [TC-001] ---")
\ No newline at end of file
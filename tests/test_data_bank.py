@@ -0,0 +1,37 @@
+import os
+import allure
+import pytest
+
+from helpers.data_bank import DataBank
+
+LANGS = {"basic_latinh": ["en_US"]}
+CHARS = {"digit": "0123456789"}
+
+@allure.parent_suite("Framework")
+@allure.suite("Data Bank")
+@pytest.mark.unit
+class TestDataBank:
+
+    @allure.title("The same seed gives the same records from one bank file")
+    def test_same_seed_same_records(self, tmp_path):
+        first = DataBank.open(tmp_path, 7, LANGS, CHARS, size=4)
+        second = DataBank.open(tmp_path, 7, LANGS, CHARS, size=4)
+        other = DataBank.open(tmp_path, 8, LANGS, CHARS, size=4)
+
+        assert second.path == first.path
+        assert [second.signup_data("basic_latinh", "digit", index) for index in range(4)] == [first.signup_data("basic_latinh", "digit", index) for index in range(4)]
+        assert other.signup_data("basic_latinh", "digit", 0) != first.signup_data("basic_latinh", "digit", 0)
+        for bank in (first, second, other):
+            bank.close()
+
+    @allure.title("Only the most recently used banks are kept")
+    def test_evicts_least_recently_used(self, tmp_path):
+        for seed in range(5):
+            DataBank.open(tmp_path, seed, LANGS, CHARS, size=1).close()
+            bank = next(tmp_path.glob(f"bank-{seed}-*.bin"))
+            os.utime(bank, (1_000_000 + seed, 1_000_000 + seed))
+
+        DataBank.evict(tmp_path, keep=2)
+
+        assert sorted(bank.name.split("-")[1] for bank in tmp_path.glob("bank-*.bin")) == ["3", "4"]
+        assert len(list(tmp_path.glob("*.lock"))) == 2
@@ -0,0 +1,49 @@
+import allure
+import pytest
+
+from helpers.duration_history import DEFAULT_ESTIMATE, DURATION_HISTORY_KEY, DurationHistory, lpt_plan, plan_loads
+
+
+class FakeCache:
+
+    def __init__(self) -> None:
+        self.values = {}
+
+    def get(self, key: str, default):
+        return self.values.get(key, default)
+
+    def set(self, key: str, value) -> None:
+        self.values[key] = value
+
+@allure.parent_suite("Framework")
+@allure.suite("Duration History")
+@pytest.mark.unit
+class TestDurationHistory:
+
+    @allure.title("Unknown tests are estimated at the median of the known ones")
+    def test_estimates(self):
+        history = DurationHistory({"a": [1.0, 9.0, 2.0], "b": [4.0], "c": []})
+
+        assert history.estimates(["a", "b", "new"]) == {"a": 2.0, "b": 4.0, "new": 3.0}
+        assert DurationHistory().estimates(["new"]) == {"new": DEFAULT_ESTIMATE}
+        assert DurationHistory.load(None).entries == {}
+
+    @allure.title("Saving keeps the last runs per test and tolerates a missing cache")
+    def test_save_keeps_last_runs(self):
+        cache = FakeCache()
+        for duration in (1.0, 2.0, 3.0):
+            history = DurationHistory.load(cache, keep=2)
+            history.add("a", duration)
+            history.add("a", 0.5)
+            history.save(cache)
+        DurationHistory.load(None).save(None)
+
+        assert cache.values[DURATION_HISTORY_KEY] == {"a": [2.5, 3.5]}
+
+    @allure.title("The longest-first plan balances worker loads")
+    def test_lpt_plan(self):
+        estimates = {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 1.0}
+        plan = lpt_plan(estimates, 2)
+
+        assert plan == [["a", "d"], ["b", "c", "e"]]
+        assert plan_loads(plan, estimates) == [10.0, 10.0]
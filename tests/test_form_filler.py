@@ -0,0 +1,84 @@
+import allure
+import pytest
+
+from helpers.form_filler import STRICT, FormField, FormFiller, FormSpec
+from models.data_models import CustomerLoginData
+
+LOGIN_FORM = FormSpec(
+    name="login form",
+    root="form#login",
+    fields={
+        "email": FormField("#email", "enter_email"),
+        "password": FormField("#password", "enter_password"),
+    }
+)
+
+
+class FakeLocator:
+
+    def __init__(self, rejected: dict[str, str]) -> None:
+        self.rejected = rejected
+        self.calls = []
+
+    def evaluate(self, script: str, payload: dict) -> dict[str, str]:
+        self.calls.append(payload)
+        return self.rejected
+
+
+class FakePage:
+
+    def __init__(self, locator: FakeLocator) -> None:
+        self.root = None
+        self._locator = locator
+
+    def locator(self, selector: str) -> FakeLocator:
+        self.root = selector
+        return self._locator
+
+
+class FakeLoginPage:
+
+    def __init__(self, rejected: dict[str, str] | None = None) -> None:
+        self.page = FakePage(FakeLocator(rejected or {}))
+        self.filled = []
+
+    def enter_email(self, value: str) -> None:
+        self.filled.append(("email", value))
+
+    def enter_password(self, value: str) -> None:
+        self.filled.append(("password", value))
+
+@allure.parent_suite("Framework")
+@allure.suite("Form Filler")
+@pytest.mark.unit
+class TestFormFiller:
+
+    @allure.title("Every form field is sent in one payload keyed by field name")
+    def test_single_payload(self):
+        owner = FakeLoginPage()
+
+        FormFiller(owner, LOGIN_FORM).fill(CustomerLoginData(email="user@example.com", password="Secret123"))
+
+        assert owner.page.root == "form#login"
+        assert owner.page._locator.calls == [{
+            "fields": {"email": "#email", "password": "#password"},
+            "values": {"email": "user@example.com", "password": "Secret123"},
+        }]
+        assert owner.filled == []
+
+    @allure.title("Rejected fields fall back to the page object's fill methods")
+    def test_rejected_fields_fall_back(self):
+        owner = FakeLoginPage(rejected={"password": "disabled or read-only"})
+
+        FormFiller(owner, LOGIN_FORM).fill({"email": "user@example.com", "password": "Secret123", "unused": "x"})
+
+        assert owner.filled == [("password", "Secret123")]
+
+    @allure.title("Strict mode and missing values skip the batched fill")
+    def test_strict_mode_and_missing_values(self):
+        owner = FakeLoginPage()
+
+        FormFiller(owner, LOGIN_FORM, mode=STRICT).fill({"email": "user@example.com", "password": None})
+
+        assert owner.page._locator.calls == []
+        assert owner.filled == [("email", "user@example.com")]
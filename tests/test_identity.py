@@ -0,0 +1,58 @@
+import allure
+import pytest
+
+import re
+from pathlib import Path
+
+from helpers.identity import PHONE_COUNTER_DIGITS, PHONE_LENGTH, IdentityAllocator, new_run_id
+
+SIGNUP_TEMPLATE = Path(__file__).resolve().parent.parent / "local_app" / "templates" / "signup.html"
+RUN_IDS = [f"{1_790_000_000_000 + offset * 977:011x}{offset * 7919 % 65536:04x}" for offset in range(40)]
+WORKER_IDS = ["master", "gw0", "gw1", "gw7", "gw98"]
+
+@allure.parent_suite("Framework")
+@allure.suite("Identity Allocator")
+@pytest.mark.unit
+class TestIdentityAllocator:
+
+    @allure.title("Phones and emails are unique across runs and workers")
+    def test_unique_across_runs_and_workers(self):
+        allocators = [IdentityAllocator(run_id, worker_id) for run_id in RUN_IDS for worker_id in WORKER_IDS]
+        phones = [allocator.phone() for allocator in allocators for _ in range(50)]
+        emails = [allocator.email() for allocator in allocators for _ in range(50)]
+
+        assert len(set(phones)) == len(phones)
+        assert len(set(emails)) == len(emails)
+
+    @allure.title("Phones keep a fixed length the signup phone field accepts")
+    def test_phone_length_fits_signup_field(self):
+        allocator = IdentityAllocator(new_run_id(), "gw3")
+        phones = [allocator.phone() for _ in range(3 * 10 ** PHONE_COUNTER_DIGITS)]
+
+        assert re.search(r'<input type="number" id="phone"', SIGNUP_TEMPLATE.read_text(encoding="utf-8"))
+        assert PHONE_LENGTH <= 15
+        assert {len(phone) for phone in phones} == {PHONE_LENGTH}
+        assert all(phone.isdigit() and int(float(phone)) == int(phone) for phone in phones)
+        assert len(set(phones)) == len(phones)
+        assert allocator.email().endswith("_004_000001@gmail.com")
+
+    @allure.title("Phones sort in allocation order across runs and after the counter rolls over")
+    def test_phones_sort_in_allocation_order(self):
+        phones = [IdentityAllocator(run_id, WORKER_IDS[-1 - offset % len(WORKER_IDS)]).phone() for offset, run_id in enumerate(RUN_IDS)]
+        allocator = IdentityAllocator(new_run_id())
+        phones += [allocator.phone() for _ in range(3 * 10 ** PHONE_COUNTER_DIGITS)]
+
+        assert phones == sorted(phones)
+
+    @allure.title("Worker indexes that do not fit a phone are rejected")
+    def test_rejects_too_many_workers(self):
+        with pytest.raises(ValueError, match="worker digits"):
+            IdentityAllocator(new_run_id(), "gw99")
+
+    @allure.title("Phones depend only on the run, the worker and the counter")
+    def test_phone_prefix_is_stable_per_worker(self):
+        run_id = new_run_id()
+        first, second = IdentityAllocator(run_id, "gw0"), IdentityAllocator(run_id, "gw0")
+
+        assert first.phone() == second.phone()
+        assert IdentityAllocator(run_id, "gw1").phone() != first.phone()
@@ -0,0 +1,42 @@
+import allure
+import pytest
+
+from helpers.latency_histogram import LatencyHistogram
+
+@allure.parent_suite("Framework")
+@allure.suite("Latency Histogram")
+@pytest.mark.unit
+class TestLatencyHistogram:
+
+    @allure.title("Percentiles stay within the configured precision")
+    def test_percentiles_within_precision(self):
+        histogram = LatencyHistogram(significant_digits=2)
+        for value in range(1, 100_001):
+            histogram.record(value)
+
+        for percentile, exact in ((50, 50_000), (95, 95_000), (99, 99_000)):
+            assert abs(histogram.value_at_percentile(percentile) - exact) <= exact / 100
+        assert histogram.value_at_percentile(100) == 100_000
+        assert (histogram.min, histogram.max, histogram.mean) == (1, 100_000, 50_000.5)
+
+    @allure.title("Small values are recorded exactly and out-of-range values are clamped")
+    def test_exact_and_clamped_values(self):
+        histogram = LatencyHistogram(highest_value=1000)
+        for value in (-5, 7, 7, 5000):
+            histogram.record(value)
+
+        assert histogram.summary(percentiles=(50, 75)) == {"count": 4, "min": 0, "mean": 253.5, "max": 1000, "p50": 7, "p75": 7}
+
+    @allure.title("Merged and round-tripped histograms match one recorded in a single process")
+    def test_merge_and_round_trip(self):
+        combined, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for value in range(0, 5000, 3):
+            combined.record(value)
+            (first if value % 2 else second).record(value)
+
+        merged = LatencyHistogram.from_dict(first.to_dict())
+        merged.merge(LatencyHistogram.from_dict(second.to_dict()))
+
+        assert merged.to_dict() == combined.to_dict()
+        with pytest.raises(ValueError):
+            merged.merge(LatencyHistogram(significant_digits=3))
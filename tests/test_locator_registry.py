@@ -0,0 +1,81 @@
+import allure
+import pytest
+
+from helpers.locator_registry import declared_locators, iter_locators
+from pages.customer_login_page import CustomerLoginPage
+from pages.customer_signup_page import CustomerSignupPage
+
+
+class FakeLocator:
+
+    def __init__(self, page: "FakePage", chain: tuple[str, ...] = ()) -> None:
+        self.page = page
+        self.chain = chain
+
+    def __getattr__(self, name: str) -> "FakeLocator":
+        return FakeLocator(self.page, (*self.chain, name))
+
+    def __call__(self, *args, **kwargs) -> "FakeLocator":
+        self.page.calls += 1
+        params = [repr(arg) for arg in args] + [f"{key}={value!r}" for key, value in kwargs.items()]
+        return FakeLocator(self.page, (*self.chain[:-1], f"{self.chain[-1]}({', '.join(params)})"))
+
+    def __repr__(self) -> str:
+        return ".".join(("page", *self.chain))
+
+
+class FakePage(FakeLocator):
+
+    def __init__(self) -> None:
+        super().__init__(self)
+        self.calls = 0
+
+@allure.parent_suite("Framework")
+@allure.suite("Locator Registry")
+@pytest.mark.unit
+class TestLocatorRegistry:
+
+    @allure.title("Locators are built on first access and memoized per instance")
+    def test_lazy_and_memoized(self):
+        page = FakePage()
+        login_page = CustomerLoginPage(page)
+
+        assert page.calls == 0
+
+        email_input = login_page.login_form.email_input
+        assert repr(email_input) == "page.locator('#email')"
+        assert page.calls == 1
+        assert login_page.login_form.email_input is email_input
+        assert login_page.login_form is login_page.login_form
+        assert page.calls == 1
+
+        assert CustomerLoginPage(page).login_form.email_input is not email_input
+        assert page.calls == 2
+
+    @allure.title("Chained locators resolve their anchor through the registry")
+    def test_chained_anchor(self):
+        signup_page = CustomerSignupPage(FakePage())
+
+        assert repr(signup_page.captcha_checkbox) == (
+            "page.locator('iframe[title=\"Widget containing checkbox for hCaptcha security challenge\"]').content_frame.locator('#checkbox')"
+        )
+        assert signup_page._locators["captcha_frame"] is signup_page.captcha_frame
+
+    @allure.title("Declared locators include inherited and component locators")
+    def test_declared_locators(self):
+        login_locators = declared_locators(CustomerLoginPage)
+        signup_locators = declared_locators(CustomerSignupPage)
+
+        assert {"navbar.root", "navbar.flights_link", "footer.root", "login_form.email_input"} <= set(login_locators)
+        assert {"first_name_input", "captcha_checkbox", "navbar.flights_link"} <= set(signup_locators)
+        assert not any(name.startswith("login_form.") for name in signup_locators)
+        assert repr(login_locators["login_form.email_input"]) == "page.locator('#email')"
+
+    @allure.title("iter_locators builds every declared locator of an instance")
+    def test_iter_locators(self):
+        page = FakePage()
+        built = dict(iter_locators(CustomerLoginPage(page)))
+
+        assert list(built) == list(declared_locators(CustomerLoginPage))
+        assert all(isinstance(locator, FakeLocator) for locator in built.values())
+        assert repr(built["navbar.flights_link"]) == "page.get_by_role('banner').get_by_role('link', name='Flights')"
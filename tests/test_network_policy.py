@@ -0,0 +1,88 @@
+import allure
+import pytest
+
+from helpers.network_policy import NO_MEDIA, NetworkPolicyController, NetworkSizeTable
+
+
+class FakeRequest:
+
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    def fulfill(self, **kwargs) -> None:
+        self.outcome = "fulfilled"
+
+    def abort(self, error_code: str) -> None:
+        self.outcome = "aborted"
+
+    def fallback(self) -> None:
+        self.outcome = "fallback"
+
+
+class FakePage:
+
+    def on(self, event: str, handler) -> None:
+        pass
+
+    def route(self, url: str, handler) -> None:
+        pass
+
+@allure.parent_suite("Framework")
+@allure.suite("Network Policy")
+@pytest.mark.unit
+class TestNetworkPolicy:
+
+    @allure.title("Sizes are keyed without the query string and fall back to the type average")
+    def test_size_estimates(self):
+        table = NetworkSizeTable()
+        table.learn("https://x/logo.png?v=1", "image", 3000)
+        table.learn("https://x/hero.png", "image", 1000)
+
+        assert table.estimate("https://x/logo.png?v=2", "image") == 3000
+        assert table.estimate("https://x/unseen.png", "image") == 2000
+        assert table.estimate("https://x/logo.png", "font") is None
+
+    @allure.title("Workers merge their sizes into one bounded table")
+    def test_flush_merges_workers(self, tmp_path):
+        path = tmp_path / "sizes.json"
+        first, second = NetworkSizeTable(path, max_entries=2), NetworkSizeTable(path, max_entries=2)
+        first.learn("https://x/a.png", "image", 100)
+        second.learn("https://x/b.png", "image", 300)
+        second.learn("https://x/c.woff2", "font", 50)
+        first.flush()
+        second.flush()
+
+        merged = NetworkSizeTable(path, max_entries=2)
+
+        assert len(merged.sizes) == 2
+        assert merged.estimate("https://x/a.png", "image") == 200
+        assert merged.estimate("https://x/b.png", "image") == 300
+        assert merged.type_sizes == {"image": [400, 2], "font": [50, 1]}
+
+    @allure.title("Aborted and stubbed requests count the bytes they saved")
+    def test_bytes_saved(self):
+        table = NetworkSizeTable()
+        table.learn("https://x/logo.png", "image", 3000)
+        table.learn("https://www.googletagmanager.com/gtag/js", "script", 90000)
+        controller = NetworkPolicyController(FakePage(), "https://x", table)
+        controller.pin(NO_MEDIA)
+
+        routes = [
+            FakeRoute("https://x/logo.png", "image"),
+            FakeRoute("https://x/font.woff2", "font"),
+            FakeRoute("https://www.googletagmanager.com/gtag/js?id=1", "script"),
+            FakeRoute("https://x/login", "document"),
+        ]
+        for route in routes:
+            controller._handle_route(route)
+
+        assert [route.outcome for route in routes] == ["aborted", "aborted", "fulfilled", "fallback"]
+        assert (controller.stats.bytes_saved, controller.stats.unknown_size) == (93000, 1)
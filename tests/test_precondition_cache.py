@@ -0,0 +1,54 @@
+import allure
+import pytest
+from dataclasses import replace
+
+from helpers.precondition_cache import PreconditionCache
+from models.data_models import CustomerSignupData
+
+PROFILE = CustomerSignupData(first_name="Cached", last_name="Account", country="Vietnam", phone="", email="", password="Secret123")
+
+def register(data: CustomerSignupData) -> CustomerSignupData:
+    register.calls += 1
+    return replace(data, email=f"cached{register.calls}@example.com", phone=f"0900{register.calls:06d}")
+
+@allure.parent_suite("Framework")
+@allure.suite("Precondition Cache")
+@pytest.mark.unit
+class TestPreconditionCache:
+
+    @pytest.fixture(autouse=True)
+    def reset_calls(self):
+        register.calls = 0
+
+    @allure.title("A cached precondition is reused until it expires")
+    def test_reuse_until_expired(self, tmp_path):
+        cache = PreconditionCache(tmp_path, "http://x", ttl=3600, max_entries=10)
+
+        first = cache.get_or_create(PROFILE, register)
+        second = PreconditionCache(tmp_path, "http://x", ttl=3600, max_entries=10).get_or_create(PROFILE, register)
+        expired = PreconditionCache(tmp_path, "http://x", ttl=-1, max_entries=10).get_or_create(PROFILE, register)
+
+        assert (first.from_cache, second.from_cache, expired.from_cache) == (False, True, False)
+        assert second.account == first.account
+        assert expired.account.email != first.account.email
+        assert register.calls == 2
+
+    @allure.title("Entries are scoped by namespace and evicted least recently used first")
+    def test_namespace_and_eviction(self, tmp_path):
+        cache = PreconditionCache(tmp_path, "http://x", ttl=3600, max_entries=1)
+        other = replace(PROFILE, first_name="Other")
+
+        cache.get_or_create(PROFILE, register)
+        cache.get_or_create(other, register)
+
+        assert cache.get(PROFILE) is None
+        assert cache.get(other).from_cache
+        assert PreconditionCache(tmp_path, "http://y", ttl=3600, max_entries=1).get(other) is None
+
+    @allure.title("A corrupted index is treated as empty")
+    def test_corrupted_index(self, tmp_path):
+        cache = PreconditionCache(tmp_path, "http://x", ttl=3600, max_entries=10)
+        cache.index_path.write_text("{not json", encoding="utf-8")
+
+        assert cache.get(PROFILE) is None
+        assert not cache.get_or_create(PROFILE, register).from_cache
@@ -0,0 +1,60 @@
+import json
+import allure
+import pytest
+
+from helpers.sharding import DEFAULT_WEIGHT, group_weights, load_durations, parse_shard, partition
+from scripts.merge_reports import MAKESPAN_REPORT, merge_durations
+
+@allure.parent_suite("Framework")
+@allure.suite("Sharding")
+@pytest.mark.unit
+class TestSharding:
+
+    @allure.title("Shard specs are parsed as 1-based i/N")
+    def test_parse_shard(self):
+        assert parse_shard("3/4") == (3, 4)
+        assert parse_shard("1/1") == (1, 1)
+
+    @allure.title("Invalid shard specs are rejected")
+    @pytest.mark.parametrize("value", ["0/4", "5/4", "1/0", "a/4", "2"])
+    def test_parse_shard_rejects_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(value)
+
+    @allure.title("Groups without history are weighted at the median duration")
+    def test_group_weights(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"a": 1, "b": 3, "c": 10}), encoding="utf-8")
+        durations = load_durations(path)
+
+        assert load_durations(tmp_path / "missing.json") == {}
+        assert group_weights({"x": ["a", "new"], "y": ["c"]}, durations) == {"x": 4.0, "y": 10.0}
+        assert group_weights({"x": ["a", "b"]}, {}) == {"x": 2 * DEFAULT_WEIGHT}
+
+    @allure.title("Partitioning is deterministic and covers every group exactly once")
+    def test_partition(self):
+        weights = {"d": 1.0, "a": 5.0, "c": 2.0, "b": 2.0, "e": 2.0}
+        assignment = partition(weights, 3)
+
+        assert assignment == {"a": 1, "b": 2, "c": 3, "e": 2, "d": 3}
+        assert partition(dict(reversed(weights.items())), 3) == assignment
+        assert set(partition(weights, 10).values()) == {1, 2, 3, 4, 5}
+
+    @allure.title("The durations file is refreshed from the medians the shards recorded")
+    def test_merge_durations_from_shards(self, tmp_path):
+        durations_path = tmp_path / ".test_durations.json"
+        durations_path.write_text(json.dumps({"a": 1.0, "gone": 2.0}), encoding="utf-8")
+        for shard, makespan in enumerate((
+            {"durations": {"a": 9.0, "b": 3.0}, "median_durations": {"a": 4.0, "b": 3.0}},
+            {"durations": {"c": 5.0}},
+        ), start=1):
+            report = tmp_path / f"shard-{shard}" / MAKESPAN_REPORT
+            report.parent.mkdir(parents=True)
+            report.write_text(json.dumps(makespan), encoding="utf-8")
+
+        count = merge_durations([tmp_path / "shard-1", tmp_path / "shard-2"], durations_path)
+        assignment = partition(group_weights({"x": ["a"], "y": ["b", "c"]}, load_durations(durations_path)), 2)
+
+        assert count == 4
+        assert load_durations(durations_path) == {"a": 4.0, "b": 3.0, "c": 5.0, "gone": 2.0}
+        assert assignment == {"y": 1, "x": 2}